@@ -1,10 +1,14 @@
 import streamlit as st
-import time
 import os
-from scraper import fetch_page, get_all_website_links, is_valid_url, process_content, hash_content
+import json
+from scraper import is_valid_url, available_parsers, available_link_parsers
+import time
 from urllib.parse import urlparse
-from bs4 import BeautifulSoup
-from document_processor import create_document_bytes  # yeni fonksiyonu içe aktar
+from crawl_job import CrawlJob
+from jobs import JobRunner
+from renderers import RENDERERS
+from metrics import STAGE_LABELS
+from profiles import load_profiles, save_profiles
 
 # --- Streamlit Config ---
 st.set_page_config(
@@ -71,7 +75,25 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-seen_hashes = set()
+CACHE_PATH = os.path.join('.kazima_cache', 'http_cache.sqlite')
+MANIFEST_PATH = os.path.join('.kazima_cache', 'manifest.sqlite')
+DEDUP_PATH = os.path.join('.kazima_cache', 'dedup.sqlite')
+JOBS_PATH = os.path.join('.kazima_cache', 'jobs')
+# Kullanıcı ayarı olduğundan önbellek klasörü dışında tutulur
+PROFILES_PATH = 'site_profiles.json'
+PROFILE_EXAMPLE = '''{
+  "ornek.com": {
+    "content": ["article.post-body"],
+    "exclude": [".ilgili-yazilar", ".paylas"],
+    "include": [".sss-item"],
+    "title": "h1.entry-title"
+  }
+}'''
+MAX_JOBS = 2
+OUTPUT_FORMATS = {'docx': "Word (sayfa başına .docx)", 'combined_docx': "Tek Word Belgesi (.docx)",
+                  'markdown': "Markdown (.md)", 'jsonl': "JSON Lines (.jsonl)"}
+JOB_STATES = {'queued': 'Kuyrukta', 'running': 'Çalışıyor', 'done': 'Tamamlandı',
+              'failed': 'Hata', 'cancelled': 'İptal edildi'}
 
 # --- Sidebar ---
 with st.sidebar:
@@ -86,8 +108,56 @@ with st.sidebar:
                             placeholder="https://example.com",
                             help="Kazıma işleminin başlayacağı URL")
         
+        use_cache = st.checkbox("Disk Önbelleği Kullan", value=False,
+                                help="Sayfaları diskte saklar, sonraki kazımalarda değişmeyen sayfaları yeniden indirmez (ETag / Last-Modified)")
+        if use_cache:
+            cache_mb = st.slider("Önbellek Boyutu (MB)", 10, 2000, 200,
+                                 help="Sınır aşılınca en uzun süredir kullanılmayan sayfalar silinir")
+        max_mb = st.slider("Maksimum Sayfa Boyutu (MB)", 1, 100, 10,
+                           help="Bu boyutu aşan ya da HTML olmayan (PDF, video vb.) yanıtlar indirilmeden atlanır")
+        head_probe = st.checkbox("HEAD ile Ön Kontrol", value=False,
+                                 help="Her sayfadan önce HEAD isteği gönderilir; uygun olmayan dosyalar için GET isteği hiç gönderilmez, ancak her sayfa için fazladan bir istek yapılır")
+        incremental = st.checkbox("Artımlı Kazıma", value=False,
+                                  help="İçeriği ve seçenekleri değişmeyen sayfalar için önceki çalıştırmada üretilen dosyayı yeniden kullanır")
+        similarity = st.slider("Benzerlik Eşiği", 0.80, 1.00, 0.95, step=0.01,
+                               help="Bu oranın üzerinde benzeyen sayfalar (tarih, sayaç, breadcrumb farkı gibi) kopya sayılır; 1.00 yalnızca metni aynı olan içerikleri atlar (büyük/küçük harf farkı gözetilmez)")
+        persist_dedup = st.checkbox("Benzerlik Dizinini Sakla", value=False,
+                                    help="Önceki çalıştırmalarda kazınan sayfaların kopyaları da atlanır")
+        workers = st.slider("İşlemci Sayısı", 1, max(2, os.cpu_count() or 1), 1,
+                            help="İçerik çıkarma ve .docx oluşturma işlerini paralel yürütecek süreç sayısı")
+        parsers = available_parsers()
+        parser = st.selectbox("HTML Ayrıştırıcı", parsers,
+                              help="İçerik çıkarmada kullanılacak ayrıştırıcı; lxml ve selectolax html.parser'dan hızlıdır")
+        link_parsers = available_link_parsers()
+        link_parser = st.selectbox("Link Ayrıştırıcı", link_parsers, index=len(link_parsers) - 1,
+                                   help="Link bulmada kullanılacak ayrıştırıcı; en hızlısı (stream: ağaç kurmadan yalnızca linkleri tarar) varsayılan olarak seçilidir")
+        output_format = st.selectbox("Çıktı Biçimi", list(OUTPUT_FORMATS), format_func=OUTPUT_FORMATS.get,
+                                     help="Word dışındaki biçimler tüm sayfaları tek dosyada toplar ve çok daha hızlı oluşturulur")
+        profile = st.checkbox("Profil Çıkar (cProfile)", value=False,
+                              help="İşin fonksiyon bazında süre dökümünü Sonuçlar sekmesinde gösterir; kazımayı bir miktar yavaşlatır")
         
     
+    with st.expander("🎯 Site Profilleri", expanded=False):
+        st.caption("Sık kazınan siteler için içerik kapsayıcısı ve atlanacak/mutlaka alınacak bölümler (CSS seçicileri). "
+                   "Yalnızca kazınan siteye ait profil uygulanır; profili olmayan sitelerde genel kurallar kullanılır.")
+        saved_profiles = ''
+        if os.path.exists(PROFILES_PATH):
+            with open(PROFILES_PATH, encoding='utf-8') as f:
+                saved_profiles = f.read()
+        profiles_text = st.text_area("Profiller (JSON)", value=saved_profiles, height=220, placeholder=PROFILE_EXAMPLE)
+        if st.button("💾 Profilleri Kaydet", use_container_width=True):
+            try:
+                save_profiles(json.loads(profiles_text or '{}'), PROFILES_PATH)
+                st.success("✅ Profiller kaydedildi")
+            except ValueError as e:
+                st.error(f"❌ Profiller kaydedilemedi: {e}")
+        site_profiles = None
+        if os.path.exists(PROFILES_PATH):
+            try:
+                site_profiles = load_profiles(PROFILES_PATH)
+            except ValueError as e:
+                st.warning(f"⚠️ Kayıtlı profiller okunamadı, genel kurallar kullanılacak: {e}")
+    
     with st.expander("🔍 Element Seçenekleri", expanded=True):
         col1, col2 = st.columns(2)
         opts = {}
@@ -122,6 +192,27 @@ with st.sidebar:
                              help="Kaç seviye derinliğe kadar linkleri takip edeceğinizi belirler")
             maxp = st.slider("Maksimum Sayfa", 10, 500, 50, 
                             help="Kazınacak maksimum sayfa sayısı")
+            concurrency = st.slider("Eşzamanlı İstek", 1, 32, 8,
+                                    help="Aynı anda indirilecek en fazla sayfa sayısı")
+            per_host = st.slider("Site Başına Eşzamanlı İstek", 1, 8, 2,
+                                 help="Aynı siteye aynı anda gönderilecek en fazla istek sayısı")
+            host_delay = st.slider("Site Başına Minimum Gecikme (sn)", 0.0, 2.0, 0.1, step=0.05,
+                                   help="Aynı siteye gönderilen iki istek arasındaki en kısa süre")
+            query_params = st.text_input("Korunacak Sorgu Parametreleri", placeholder="page, id",
+                                         help="Virgülle ayrılmış parametreler URL'de korunur (ör. sayfalama); diğer sorgu parametreleri atılır")
+            adaptive = st.checkbox("Verimli Sayfalara Öncelik Ver", value=True,
+                                   help="Etiket, sayfalama ve arşiv gibi içerik çıkmayan sayfalar sona bırakılır; "
+                                        "tarama ilerledikçe hangi yol kalıplarından belge çıktığı öğrenilir")
+            compact_seen = st.checkbox("Kompakt Ziyaret Kümesi (Bloom Filtresi)", value=False,
+                                       help="Çok büyük taramalarda bellek kullanımını sabit tutar; çok küçük bir olasılıkla bazı sayfalar atlanabilir")
+            use_robots = st.checkbox("robots.txt Kurallarına Uy", value=True,
+                                     help="Yasaklı yollar atlanır, Crawl-delay değeri site başına gecikmeye uygulanır; robots.txt sunucu hatası verirse site bu taramada taranmaz")
+            use_sitemap = st.checkbox("Sitemap ile URL Keşfi", value=False,
+                                      help="sitemap.xml içindeki tüm URL'ler taramanın başında kuyruğa eklenir; artımlı modda lastmod tarihi değişmeyen sayfalar indirilmez")
+            separate_files = st.checkbox("Dosyaları Ayrı Ayrı İndir", value=False,
+                                         help="Varsayılan olarak tüm belgeler tek bir .zip arşivinde indirilir")
+            zip_manifest = st.checkbox("Arşive JSON Manifest Ekle", value=False, disabled=separate_files,
+                                       help="URL → dosya adı → içerik hash'i eşleşmesini manifest.json olarak arşive ekler")
     
     st.divider()
     start_button = st.button("🚀 Kazımayı Başlat", use_container_width=True)
@@ -148,131 +239,228 @@ st.markdown("<h1 class='main-header'>🕸️ Web Kazıma Aracı</h1>", unsafe_al
 
 tab1, tab2, tab3 = st.tabs(["📋 İşlem", "📊 Sonuçlar", "❓ Yardım"])
 
-with tab1:
-    if not start_button:
-        st.info("👈 Ayarları yapılandırın ve başlatmak için soldaki butona tıklayın.")
-        
-        col1, col2, col3 = st.columns([1,2,1])
-        with col2:
-            st.image("https://www.svgrepo.com/show/374116/spider-web.svg", width=300)
-    
-    if start_button:
-        if not is_valid_url(url):
-            st.error("❌ Geçerli bir URL girmelisiniz. Örnek: https://example.com")
-        else:
-            tasks = []
-            visited = set()
-            domain = urlparse(url).netloc
-            
-            with st.spinner("🔍 URL'ler toplanıyor..."):
-                if mode == "Tek URL":
-                    html = fetch_page(url)
-                    if html:
-                        tasks.append((url, html))
-                else:
-                    status_text = st.empty()
-                    progress_bar = st.progress(0)
-                    to_visit = [(url, 0)]
-                    
-                    while to_visit and len(visited) < maxp:
-                        current_url, level = to_visit.pop(0)
-                        if current_url in visited or level > depth:
-                            continue
-                            
-                        visited.add(current_url)
-                        status_text.text(f"🔎 İnceleniyor: {current_url}")
-                        
-                        html = fetch_page(current_url)
-                        if html:
-                            tasks.append((current_url, html))
-                            
-                            if level < depth:
-                                new_links = get_all_website_links(current_url, domain)
-                                for link in new_links:
-                                    if link not in visited and is_valid_url(link):
-                                        to_visit.append((link, level + 1))
-                        
-                        progress_bar.progress(min(1.0, len(visited)/maxp))
-                        status_text.text(f"📄 Toplam {len(tasks)} sayfa bulundu ({len(visited)} URL ziyaret edildi)")
-                        time.sleep(0.1)
-            
-            from document_processor import create_document_bytes  # yeni fonksiyonu içe aktar
+@st.cache_resource
+def get_runner():
+    # Sunucu süreci başına tek çalıştırıcı; tüm oturumlar aynı eşzamanlı iş sınırını paylaşır
+    return JobRunner(JOBS_PATH, max_jobs=MAX_JOBS)
 
-# ...
-            if tasks:
-                st.markdown(f"### 📃 Toplam {len(tasks)} sayfa işlenecek")
-                
-                succ = 0
-                fail = 0
-                results = []
-                downloadables = []  # yeni: indirilebilir dosyaları sakla
+runner = get_runner()
+if 'job_ids' not in st.session_state:
+    st.session_state.job_ids = []
+    st.session_state.celebrated = set()
 
-                progress_bar = st.progress(0)
-                status_text = st.empty()
-                result_area = st.container()
-                
-                for i, (u, html) in enumerate(tasks):
-                    status_text.text(f"⚙️ İşleniyor: {u}")
-                    soup = BeautifulSoup(html, 'html.parser')
-                    cont = process_content(soup, opts)
-                    hash_val = hash_content(cont)
-                    
-                    if hash_val in seen_hashes:
-                        results.append(("warning", f"⚠️ Benzer içerik atlandı: {u}"))
-                        fail += 1
-                    elif len(cont) > 1:
-                        seen_hashes.add(hash_val)
-                        docx_io = create_document_bytes(cont)  # sadece bellekte oluştur
-                        downloadables.append((u, docx_io, i))
-                        results.append(("success", f"✅ Kazındı: {u}"))
-                        succ += 1
-                    else:
-                        results.append(("error", f"❌ İçerik bulunamadı: {u}"))
-                        fail += 1
-                    
-                    progress_bar.progress((i+1)/len(tasks))
-                    
-                    with result_area:
-                        for res_type, res_text in results[-5:]:
-                            if res_type == "success":
-                                st.success(res_text)
-                            elif res_type == "warning":
-                                st.warning(res_text)
-                            else:
-                                st.error(res_text)
-
-                status_text.text("")
-                st.balloons()
-                
-                st.markdown("## 📊 İşlem Özeti")
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    st.metric("Toplam İşlenen", len(tasks))
-                with col2:
-                    st.metric("Başarılı", succ)
-                with col3:
-                    st.metric("Başarısız", fail)
+def show_recent(job):
+    for rec in list(job.recent):
+        if rec['status'] == 'success':
+            st.success(f"✅ Kazındı: {rec['url']}")
+        elif rec['status'] == 'duplicate':
+            st.warning(f"⚠️ Benzer içerik atlandı: {rec['url']} (≈ {rec['duplicate_of']})")
+        else:
+            st.error(f"❌ İçerik bulunamadı: {rec['url']}")
 
-                st.success("✅ İşlem tamamlandı! Dosyalar aşağıdan indirilebilir.")
+def job_monitor(job_id):
+    # Çalışan iş her saniye yoklanır; iş bitince sayfa bir kez yeniden çizilir ve yoklama durur
+    job = runner.get(job_id)
+    if job is None or job.is_finished:
+        st.rerun()
+    crawl_job = job.crawl_job
+    if job.state == 'queued':
+        st.info(f"⏳ İş kuyrukta bekliyor ({runner.running()} iş çalışıyor, en fazla {MAX_JOBS})")
+    else:
+        st.progress(job.progress())
+        last = job.results[-1]['url'] if job.results else "-"
+        st.text(f"📄 {crawl_job.stats['processed']} sayfa işlendi ({crawl_job.visited} URL ziyaret edildi) - Son: {last}")
+    if st.button("⏹️ İşi İptal Et", key=f"cancel_{job_id}"):
+        runner.cancel(job_id)
+    show_recent(job)
 
+def show_summary(job):
+    stats = job.stats
+    settings = job.crawl_job.settings
+    processed = stats['processed']
+    
+    if job.state == 'failed':
+        st.error(f"❌ İş hata ile sonlandı: {job.error}")
+    elif job.state == 'cancelled':
+        st.warning(f"⏹️ İş iptal edildi, {processed} sayfa işlenmişti.")
+    
+    net = stats['network']
+    if net:
+        st.caption(f"🌐 {net['requests']} istek, {net['connections']} yeni bağlantı, {net['retries']} yeniden deneme, "
+                   f"{net['rejected']} HTML olmayan / çok büyük yanıt atlandı | "
+                   f"Bağlantı: {net['connect_time']:.2f} sn, Bekleme: {net['wait_time']:.2f} sn, Aktarım: {net['transfer_time']:.2f} sn")
+    if stats['frontier']:
+        fs = stats['frontier']
+        st.caption(f"🧭 Kuyruk: {fs['enqueued']} URL eklendi, {fs['duplicates']} tekrar engellendi, en fazla {fs['peak']} bekleyen | "
+                   f"Bellek: kuyruk {fs['queue_bytes'] / 1024:.1f} KB, ziyaret kümesi {fs['seen_bytes'] / 1024:.1f} KB")
+        ds = stats['discovery']
+        if settings['use_robots'] or settings['use_sitemap']:
+            st.caption(f"🗺️ Sitemap: {ds['sitemap_urls']} URL | robots.txt ile engellenen: {ds['robots_blocked']} | "
+                       f"lastmod ile indirilmeden geçilen: {ds['lastmod_skipped']}")
+    if stats['scheduler']:
+        ss = stats['scheduler']
+        st.caption(f"🎯 Öncelik: {ss['useful']} sayfadan belge çıktı, {ss['wasted']} sayfa boşa gitti | "
+                   f"Kuyruk {ss['refreshes']} kez yeniden sıralandı")
+    
+    if not processed:
+        if job.state == 'done':
+            st.error("❌ İşlenecek sayfa bulunamadı. Lütfen farklı bir URL deneyin.")
+        return
+    
+    if job.state == 'done' and job.id not in st.session_state.celebrated:
+        st.session_state.celebrated.add(job.id)
+        st.balloons()
+    
+    st.markdown("## 📊 İşlem Özeti")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Toplam İşlenen", processed)
+    with col2:
+        st.metric("Başarılı", stats['success'])
+    with col3:
+        st.metric("Başarısız", stats['duplicate'] + stats['empty'])
+    
+    if settings['manifest_path']:
+        changes = stats['changes']
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Yeni", changes['new'])
+        with col2:
+            st.metric("Değişen", changes['changed'])
+        with col3:
+            st.metric("Değişmeyen", changes['unchanged'])
+        with col4:
+            st.metric("Kaldırılan", len(stats['removed']))
+    
+    if stats['cache']:
+        cs = stats['cache']
+        st.info(f"💾 Önbellek: {cs['hits']} isabet, {cs['misses']} ıska, "
+                f"{cs['bytes_saved'] / (1024 * 1024):.2f} MB indirme tasarrufu "
+                f"({cs['evictions']} kayıt boyut sınırı nedeniyle silindi)")
+    
+    if stats['success']:
+        st.success("✅ İşlem tamamlandı! Dosyalar aşağıdan indirilebilir.")
+        st.markdown("## 📥 İndirilebilir Kazıma Sonuçları")
+        netloc = urlparse(job.crawl_job.urls[0]).netloc.replace('.', '_')
+        if job.export is not None and job.crawl_job.renders_docx:
+            st.download_button(
+                label=f"📦 {stats['success']} belgeyi tek arşivde indir (.zip)",
+                data=job.export_bytes(),
+                file_name=f"{netloc}_kazima.zip",
+                mime="application/zip",
+                key=f"download_{job.id}_zip"
+            )
+            return
+        if job.export is not None:
+            renderer = RENDERERS[job.crawl_job.settings['format']]
+            st.download_button(
+                label=f"📦 {stats['success']} sayfayı tek dosyada indir (.{renderer['extension']})",
+                data=job.export_bytes(),
+                file_name=f"{netloc}_kazima.{renderer['extension']}",
+                mime=renderer['mime'],
+                key=f"download_{job.id}_export"
+            )
+            return
+        for i, rec in enumerate(job.results):
+            if rec['status'] != 'success':
+                continue
+            filename = rec['filename']
+            st.download_button(
+                label=f"📄 {filename} indir",
+                data=job.read_document(filename),
+                file_name=filename,
+                mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+                key=f"download_{job.id}_{i}"
+            )
 
-                st.markdown("## 📥 İndirilebilir Kazıma Sonuçları")
+def show_metrics(job):
+    report = job.crawl_job.metrics.report()
+    if not report['pages']:
+        st.info("⏳ Henüz ölçülen sayfa yok.")
+        return
+    st.markdown(f"## ⏱️ Aşama Süreleri ({report['pages']} sayfa)")
+    stages = report['stages']
+    st.dataframe([{
+        "Aşama": STAGE_LABELS.get(stage, stage),
+        "Sayfa": s['count'],
+        "Toplam (sn)": round(s['seconds'], 3),
+        "Ortalama (ms)": round(s['mean'] * 1000, 1),
+        "p50 (ms)": round(s['p50'] * 1000, 1),
+        "p95 (ms)": round(s['p95'] * 1000, 1),
+        "En uzun (ms)": round(s['max'] * 1000, 1),
+        "Veri (MB)": round(s['bytes'] / (1024 * 1024), 2),
+    } for stage, s in stages.items()], hide_index=True, use_container_width=True)
+    st.bar_chart({"Toplam (sn)": {STAGE_LABELS.get(stage, stage): s['seconds'] for stage, s in stages.items()}})
+    
+    st.markdown("### 🐢 En Yavaş Sayfalar")
+    st.dataframe([{"URL": rec['url'], "Toplam (sn)": round(rec['seconds'], 3),
+                   "En uzun aşama": STAGE_LABELS.get(max(rec['stages'], key=rec['stages'].get), "-")}
+                  for rec in report['slowest']], hide_index=True, use_container_width=True)
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        st.download_button("📄 Raporu indir (.json)", job.crawl_job.metrics.to_json(),
+                           file_name="kazima_metrikleri.json", mime="application/json", key=f"metrics_json_{job.id}")
+    with col2:
+        st.download_button("📈 Prometheus metrikleri (.prom)", job.crawl_job.metrics.to_prometheus(),
+                           file_name="kazima_metrikleri.prom", mime="text/plain", key=f"metrics_prom_{job.id}")
+    
+    if job.is_finished and job.crawl_job.profiler is not None:
+        with st.expander("🔬 cProfile Çıktısı (kümülatif süreye göre)"):
+            st.code(job.crawl_job.profile_text(), language=None)
 
-                for u, docx_io, i in downloadables:
-                    parsed = urlparse(u)
-                    filename = f"{parsed.netloc.replace('.', '_')}_{i}.docx"
-                    st.download_button(
-                        label=f"📄 {filename} indir",
-                        data=docx_io,
-                        file_name=filename,
-                        mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document"
-                    )
+selected_job = None
+with tab1:
+    if start_button:
+        if not is_valid_url(url):
+            st.error("❌ Geçerli bir URL girmelisiniz. Örnek: https://example.com")
+        else:
+            settings = dict(
+                parser=parser, link_parser=link_parser, similarity=similarity, workers=workers, format=output_format,
+                cache_path=CACHE_PATH if use_cache else None,
+                cache_bytes=cache_mb * 1024 * 1024 if use_cache else 0,
+                max_bytes=max_mb * 1024 * 1024, head_probe=head_probe, site_profiles=site_profiles,
+                manifest_path=MANIFEST_PATH if incremental else None,
+                dedup_path=DEDUP_PATH if persist_dedup else None,
+                profile=profile,
+            )
+            if mode == "Tek URL":
+                crawl_job = CrawlJob([url], opts, mode='single', **settings)
             else:
-                st.error("❌ İşlenecek sayfa bulunamadı. Lütfen farklı bir URL deneyin.")
-
+                crawl_job = CrawlJob([url], opts, mode='site', depth=depth, max_pages=maxp, concurrency=concurrency,
+                                     per_host=per_host, host_delay=host_delay,
+                                     allowed_params=[q.strip() for q in query_params.split(',') if q.strip()],
+                                     ordering='adaptive' if adaptive else 'fifo',
+                                     compact_seen=compact_seen, use_robots=use_robots, use_sitemap=use_sitemap,
+                                     **settings)
+            archive = mode == "Tüm Site" and not separate_files
+            job = runner.submit(crawl_job, archive=archive, with_manifest=archive and zip_manifest)
+            st.session_state.job_ids.append(job.id)
+    
+    my_jobs = [job for job in map(runner.get, st.session_state.job_ids) if job is not None]
+    if not my_jobs:
+        st.info("👈 Ayarları yapılandırın ve başlatmak için soldaki butona tıklayın.")
+        
+        col1, col2, col3 = st.columns([1,2,1])
+        with col2:
+            st.image("https://www.svgrepo.com/show/374116/spider-web.svg", width=300)
+    else:
+        job = my_jobs[-1]
+        if len(my_jobs) > 1:
+            labels = {j.id: f"{j.crawl_job.urls[0]} ({JOB_STATES[j.state]}, {time.strftime('%H:%M:%S', time.localtime(j.created))})"
+                      for j in reversed(my_jobs)}
+            job = runner.get(st.selectbox("İş", list(labels), format_func=labels.get))
+        st.markdown(f"#### 🕸️ {job.crawl_job.urls[0]} — {JOB_STATES[job.state]}")
+        if job.is_finished:
+            show_summary(job)
+        else:
+            st.fragment(job_monitor, run_every=1.0)(job.id)
+        selected_job = job
 
 with tab2:
-    st.info("📥 Kazıma sonrası dosyaları tab 1'den indirmeniz yeterlidir. Artık dosyalar sunucuya kaydedilmemektedir.")
+    st.info("📥 Kazıma sonuçları tab 1'den indirilebilir. Son işlerin dosyaları sayfa yenilense de kaybolmaz; eski işler otomatik silinir.")
+    if selected_job is not None:
+        show_metrics(selected_job)
 
 
 with tab3:
@@ -293,11 +481,13 @@ with tab3:
       - **Span İçerikleri**: Özel içerikli `<span>` elementleri (soru-cevap bölümleri gibi)
       - **Listeler**: `<ul>` ve `<ol>` liste elementleri
       - **Header/Footer**: Sayfa üstü ve altı bölümler
+    - **Site Profilleri**: Her gün kazınan siteler için içeriğin bulunduğu kapsayıcı (`content`), atlanacak (`exclude`) ve sınıf filtresine takılmadan alınacak (`include`) bölümler CSS seçicileriyle tanımlanabilir; tarama yalnızca kapsayıcının içinde yapılır
     
     ### 📋 Sonuçlar
     - Kazınan içerikler Microsoft Word (.docx) formatında kaydedilir
-    - Her sayfa için ayrı bir dosya oluşturulur
+    - Her sayfa için ayrı bir dosya oluşturulur; Tüm Site modunda dosyalar tek bir .zip arşivinde indirilir
     - Dosya isimleri URL yapısına göre otomatik oluşturulur
+    - **Sonuçlar** sekmesinde indirme, ayrıştırma, içerik çıkarma ve belge oluşturma aşamalarının süreleri ile en yavaş sayfalar görülür; rapor JSON veya Prometheus biçiminde indirilebilir
     
     ### ⚠️ Önemli Notlar
     - Bazı siteler otomatik kazımayı engelleyebilir (CAPTCHA, IP engelleme vb.)
@@ -313,6 +503,7 @@ with tab3:
           - Gereksiz elementleri işaretlemeyin, bu işlemi hızlandırır
           - **Span İçerikleri** seçeneğini sadece accordion/soru-cevap bölümleri için açın
         - **Derinlik Ayarı**: Büyük sitelerde derinliği düşük tutun (1-2), aksi halde işlem çok uzayabilir
+        - **Sayfa Bütçesi**: "Verimli Sayfalara Öncelik Ver" açıkken etiket, sayfalama ve arşiv sayfaları sona bırakılır; maksimum sayfa sayısı daha çok içerikli sayfaya harcanır
         - **URL Yapısı**: Bazı sitelerde parametre içeren URL'ler (? işareti ile başlayan) aynı içeriği farklı URL'lerle sunar
         - **Filtreleme**: Sonuç klasöründe elde edilen dosyaları içerik açısından kontrol edin
         """)
@@ -0,0 +1,63 @@
+import argparse
+import time
+from urllib.parse import urlparse
+from crawler import Crawler
+from scraper import fetch_and_parse, is_valid_url
+from benchmarks.stub_server import StubSite, start_server
+
+def sequential_crawl(url, depth, maxp, delay):
+    # app.py'deki eski tek iş parçacıklı BFS döngüsü
+    tasks = []
+    visited = set()
+    domain = urlparse(url).netloc
+    to_visit = [(url, 0)]
+    while to_visit and len(visited) < maxp:
+        current_url, level = to_visit.pop(0)
+        if current_url in visited or level > depth:
+            continue
+        visited.add(current_url)
+        page = fetch_and_parse(current_url, domain)
+        if page:
+            tasks.append(current_url)
+            if level < depth:
+                for link in page['links']:
+                    if link not in visited and is_valid_url(link):
+                        to_visit.append((link, level + 1))
+        time.sleep(delay)
+    return len(tasks)
+
+def concurrent_crawl(url, depth, maxp, delay, concurrency, per_host):
+    crawler = Crawler(url, depth=depth, max_pages=maxp, concurrency=concurrency,
+                      per_host=per_host, host_delay=delay)
+    for _ in crawler.crawl():
+        pass
+    return crawler.found
+
+def main():
+    parser = argparse.ArgumentParser(description="Sıralı ve eşzamanlı tarama karşılaştırması")
+    parser.add_argument('--pages', type=int, default=200)
+    parser.add_argument('--fanout', type=int, default=5)
+    parser.add_argument('--latency', type=float, default=0.05)
+    parser.add_argument('--depth', type=int, default=5)
+    parser.add_argument('--maxp', type=int, default=100)
+    parser.add_argument('--delay', type=float, default=0.0, help="Host başına minimum gecikme (sn)")
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 4, 8, 16])
+    args = parser.parse_args()
+
+    server, url = start_server(StubSite(args.pages, args.fanout, args.latency))
+    try:
+        start = time.perf_counter()
+        found = sequential_crawl(url, args.depth, args.maxp, args.delay)
+        baseline = time.perf_counter() - start
+        print(f"{'mod':<16}{'sayfa':>8}{'süre (sn)':>12}{'sayfa/sn':>12}{'hızlanma':>10}")
+        print(f"{'sıralı':<16}{found:>8}{baseline:>12.2f}{found / baseline:>12.1f}{1.0:>10.2f}")
+        for n in args.concurrency:
+            start = time.perf_counter()
+            found = concurrent_crawl(url, args.depth, args.maxp, args.delay, n, n)
+            elapsed = time.perf_counter() - start
+            print(f"{f'eşzamanlı x{n}':<16}{found:>8}{elapsed:>12.2f}{found / elapsed:>12.1f}{baseline / elapsed:>10.2f}")
+    finally:
+        server.shutdown()
+
+if __name__ == '__main__':
+    main()
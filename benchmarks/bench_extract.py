@@ -0,0 +1,45 @@
+import argparse
+import hashlib
+import os
+import time
+from pipeline import run_pipeline
+from dedup import DuplicateIndex
+from benchmarks.corpus import load_corpus, synthetic_corpus
+
+DEFAULT_OPTS = {
+    'h1': True, 'h2': True, 'h3': True, 'h4': False, 'h5': False, 'h6': False,
+    'p': True, 'div': False, 'lists': True, 'headers': False, 'footers': False, 'span': True,
+}
+
+def corpus_pages(corpus):
+    for name, html in corpus:
+        yield name, {'html': html, 'body_hash': hashlib.md5(html.encode()).hexdigest(), 'links': None}
+
+def run(corpus, workers):
+    start = time.perf_counter()
+    statuses = [res['status'] for res in run_pipeline(corpus_pages(corpus), DEFAULT_OPTS, DuplicateIndex(), workers=workers)]
+    return time.perf_counter() - start, statuses
+
+def main():
+    parser = argparse.ArgumentParser(description="İçerik çıkarma + .docx oluşturma işlem havuzu ölçümü")
+    parser.add_argument('--corpus', help="Kayıtlı .html sayfalarının bulunduğu klasör (verilmezse yapay küme)")
+    parser.add_argument('--pages', type=int, default=80, help="Yapay küme sayfa sayısı")
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, os.cpu_count() or 1])
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.corpus) if args.corpus else synthetic_corpus(args.pages)
+    print(f"{len(corpus)} sayfa, {sum(len(h) for _, h in corpus) / 1024:.0f} KB HTML")
+    print(f"{'işlemci':<10}{'süre (sn)':>12}{'sayfa/sn':>12}{'hızlanma':>10}")
+    baseline = None
+    expected = None
+    for n in sorted(set(args.workers)):
+        elapsed, statuses = run(corpus, n)
+        if expected is None:
+            expected = statuses
+        elif statuses != expected:
+            print(f"UYARI: {n} işlemci ile sonuçlar farklı")
+        baseline = baseline or elapsed
+        print(f"{n:<10}{elapsed:>12.2f}{len(corpus) / elapsed:>12.1f}{baseline / elapsed:>10.2f}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+import argparse
+import time
+from bs4 import BeautifulSoup
+from scraper import (content_tags, is_main_content, iter_content_elements, process_content,
+                     UNWANTED_CLASSES, WANTED_SPECIAL_CLASSES)
+from benchmarks.bench_extract import DEFAULT_OPTS
+from benchmarks.corpus import load_corpus, synthetic_corpus
+
+def legacy_should_process_element(elem, opts):
+    # process_content'in eski, her eleman için ataları tek tek dolaşan filtresi (karşılaştırma için)
+    if not is_main_content(elem):
+        return False
+    if elem.name == 'span' and opts['span']:
+        current = elem
+        while current and current.name != 'body':
+            if current.get('class'):
+                class_names = ' '.join(current.get('class')).lower()
+                if any(wanted in class_names for wanted in WANTED_SPECIAL_CLASSES):
+                    return True
+            if current.get('id'):
+                id_name = current.get('id').lower()
+                if any(wanted in id_name for wanted in WANTED_SPECIAL_CLASSES):
+                    return True
+            current = current.parent
+        return False
+    if not opts['div']:
+        if elem.name == 'div' or elem.find_parents('div'):
+            if opts.get('filter_divs', True):
+                current = elem
+                while current and current.name != 'body':
+                    if current.get('class'):
+                        class_names = ' '.join(current.get('class')).lower()
+                        if any(wanted in class_names for wanted in WANTED_SPECIAL_CLASSES):
+                            return True
+                        if any(unwanted in class_names for unwanted in UNWANTED_CLASSES):
+                            return False
+                    if current.get('id'):
+                        id_name = current.get('id').lower()
+                        if any(wanted in id_name for wanted in WANTED_SPECIAL_CLASSES):
+                            return True
+                        if any(unwanted in id_name for unwanted in UNWANTED_CLASSES):
+                            return False
+                    current = current.parent
+                return True
+            return False
+    return True
+
+def main():
+    parser = argparse.ArgumentParser(description="process_content eleman filtresi mikro ölçümü")
+    parser.add_argument('--corpus', help="Kayıtlı .html sayfalarının bulunduğu klasör (verilmezse yapay küme)")
+    parser.add_argument('--pages', type=int, default=16)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.corpus) if args.corpus else synthetic_corpus(args.pages)
+    soups = [(name, BeautifulSoup(html, 'html.parser')) for name, html in corpus]
+    opts = DEFAULT_OPTS
+    tags, _ = content_tags(opts)
+
+    for name, soup in soups:
+        legacy = [e for e in soup.body.find_all(tags) if legacy_should_process_element(e, opts)]
+        if legacy != list(iter_content_elements(soup.body, tags, opts)):
+            raise SystemExit(f"HATA: {name} için seçilen elemanlar farklı")
+
+    timings = {}
+    for label, select in [
+        ('eski filtre', lambda soup: [e for e in soup.body.find_all(tags) if legacy_should_process_element(e, opts)]),
+        ('tek geçiş', lambda soup: list(iter_content_elements(soup.body, tags, opts))),
+        ('process_content', lambda soup: process_content(soup, opts)),
+    ]:
+        best = None
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            for _, soup in soups:
+                select(soup)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        timings[label] = best
+
+    print(f"{len(soups)} sayfa, seçilen elemanlar iki yöntemde aynı")
+    print(f"{'yöntem':<18}{'süre (ms)':>12}{'ms/sayfa':>12}")
+    for label, elapsed in timings.items():
+        print(f"{label:<18}{elapsed * 1000:>12.1f}{elapsed * 1000 / len(soups):>12.2f}")
+    print(f"hızlanma (filtre): {timings['eski filtre'] / timings['tek geçiş']:.1f}x")
+
+if __name__ == '__main__':
+    main()
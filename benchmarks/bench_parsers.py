@@ -0,0 +1,79 @@
+import argparse
+import time
+import random
+from scraper import (available_parsers, parse_html, extract_content, extract_page_links, scan_page_links,
+                     _normalize_link, STREAM_LINK_PARSER)
+from benchmarks.bench_extract import DEFAULT_OPTS
+from benchmarks.corpus import load_corpus, nav_page, synthetic_corpus
+
+OPTION_SETS = [
+    DEFAULT_OPTS,
+    {**DEFAULT_OPTS, 'span': False},
+    {**DEFAULT_OPTS, 'div': True, 'headers': True, 'footers': True},
+    {**DEFAULT_OPTS, 'h4': True, 'h5': True, 'h6': True, 'lists': False, 'p': False},
+]
+
+def check_conformance(corpus, parsers):
+    # Her ayrıştırıcının html.parser ile aynı içerik listesini ve linkleri ürettiğini doğrular
+    failures = []
+    for name, html in corpus:
+        reference = parse_html(html, 'html.parser')
+        ref_links = extract_page_links(reference, 'http://ornek.test/', 'ornek.test')
+        ref_contents = [extract_content(reference, opts) for opts in OPTION_SETS]
+        if scan_page_links(html, 'http://ornek.test/', 'ornek.test') != ref_links:
+            failures.append((STREAM_LINK_PARSER, name, 'linkler'))
+        for parser in parsers:
+            tree = parse_html(html, parser)
+            if extract_page_links(tree, 'http://ornek.test/', 'ornek.test') != ref_links:
+                failures.append((parser, name, 'linkler'))
+            for i, opts in enumerate(OPTION_SETS):
+                if extract_content(tree, opts) != ref_contents[i]:
+                    failures.append((parser, name, f'içerik (seçenek {i})'))
+    return failures
+
+def measure(corpus, parser, stage, repeat):
+    best = None
+    for _ in range(repeat):
+        _normalize_link.cache_clear()
+        start = time.perf_counter()
+        for _, html in corpus:
+            if parser == STREAM_LINK_PARSER:
+                scan_page_links(html, 'http://ornek.test/', 'ornek.test')
+                continue
+            tree = parse_html(html, parser)
+            if stage == 'links':
+                extract_page_links(tree, 'http://ornek.test/', 'ornek.test')
+            else:
+                extract_content(tree, DEFAULT_OPTS)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return len(corpus) / best
+
+def main():
+    parser = argparse.ArgumentParser(description="Ayrıştırıcı uyumluluk kontrolü ve hız ölçümü")
+    parser.add_argument('--corpus', help="Kayıtlı .html sayfalarının bulunduğu klasör (verilmezse yapay küme)")
+    parser.add_argument('--pages', type=int, default=20)
+    parser.add_argument('--nav-pages', type=int, default=5, help="Eklenecek menü ağırlıklı sayfa sayısı")
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.corpus) if args.corpus else synthetic_corpus(args.pages)
+    rng = random.Random(0)
+    corpus += [(f'nav_page_{i}.html', nav_page(rng, i)) for i in range(args.nav_pages)]
+    parsers = available_parsers()
+    failures = check_conformance(corpus, parsers)
+    for parser_name, page, what in failures:
+        print(f"UYUMSUZ: {parser_name} {page} {what}")
+    print(f"{len(corpus)} sayfa, {len(parsers)} ayrıştırıcı, {len(failures)} uyumsuzluk")
+
+    print(f"{'ayrıştırıcı':<14}{'link sayfa/sn':>16}{'içerik sayfa/sn':>18}")
+    for parser_name in parsers:
+        links = measure(corpus, parser_name, 'links', args.repeat)
+        content = measure(corpus, parser_name, 'content', args.repeat)
+        print(f"{parser_name:<14}{links:>16.1f}{content:>18.1f}")
+    links = measure(corpus, STREAM_LINK_PARSER, 'links', args.repeat)
+    print(f"{STREAM_LINK_PARSER:<14}{links:>16.1f}{'-':>18}")
+    raise SystemExit(1 if failures else 0)
+
+if __name__ == '__main__':
+    main()
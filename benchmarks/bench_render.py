@@ -0,0 +1,43 @@
+import argparse
+import io
+import time
+from scraper import parse_html, extract_content
+from document_processor import create_document_bytes
+from renderers import RENDERERS, open_renderer
+from benchmarks.bench_extract import DEFAULT_OPTS
+from benchmarks.corpus import load_corpus, synthetic_corpus
+
+def render_per_page_docx(pages):
+    return sum(len(create_document_bytes(content).getvalue()) for _, content in pages)
+
+def render_stream(fmt, pages):
+    stream = io.BytesIO()
+    renderer = open_renderer(fmt, stream)
+    for url, content in pages:
+        renderer.add(url, content)
+    renderer.close()
+    return len(stream.getvalue())
+
+def main():
+    parser = argparse.ArgumentParser(description="Çıktı biçimlerinin oluşturma süresi ve boyutu")
+    parser.add_argument('--corpus', help="Kayıtlı .html sayfalarının bulunduğu klasör (verilmezse yapay küme)")
+    parser.add_argument('--pages', type=int, default=500, help="Yapay küme sayfa sayısı")
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.corpus) if args.corpus else synthetic_corpus(args.pages)
+    # Ayrıştırma ölçüme katılmaz, tüm biçimler aynı içerik listelerini alır
+    pages = [(f"http://ornek.test/{name}", extract_content(parse_html(html, 'html.parser'), DEFAULT_OPTS))
+             for name, html in corpus]
+    print(f"{len(pages)} sayfa")
+    print(f"{'biçim':<16}{'süre (sn)':>12}{'sayfa/sn':>12}{'boyut (KB)':>14}")
+
+    runs = [('docx', lambda: render_per_page_docx(pages))]
+    runs += [(fmt, lambda fmt=fmt: render_stream(fmt, pages)) for fmt in RENDERERS]
+    for name, run in runs:
+        start = time.perf_counter()
+        size = run()
+        elapsed = time.perf_counter() - start
+        print(f"{name:<16}{elapsed:>12.2f}{len(pages) / elapsed:>12.1f}{size / 1024:>14.0f}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+import argparse
+import io
+import random
+import time
+from crawl_job import CrawlJob
+from benchmarks.corpus import _words
+from benchmarks.stub_server import start_server
+
+class BlogSite:
+    # Blog biçiminde yapay site: her sayfada etiket bulutu, sayfalama ve arşiv linkleri bulunur; yalnızca
+    # makale sayfalarında içerik vardır. Liste sayfaları makalelerden çok olduğundan BFS sayfa bütçesinin
+    # büyük kısmını içeriksiz sayfalara harcar. opaque=True ile yollar ipucu vermez (/t/3 gibi), sıralama
+    # yalnızca öğrenilen verime dayanır.
+    def __init__(self, articles=300, tags=60, per_page=10, latency=0.005, opaque=False, seed=0):
+        self.articles = articles
+        self.tags = tags
+        self.per_page = per_page
+        self.latency = latency
+        self.listing_pages = (articles + per_page - 1) // per_page
+        self.seed = seed
+        names = ('b', 't', 'l', 'a') if opaque else ('blog', 'tag', 'page', 'archive')
+        self.article_dir, self.tag_dir, self.page_dir, self.archive_dir = names
+        self.opaque = opaque
+        self._bodies = {}
+
+    def delay(self):
+        return self.latency
+
+    def article_url(self, i):
+        if self.opaque:
+            return f'/{self.article_dir}/{i}'
+        return f'/{self.article_dir}/{"-".join(_words(random.Random(i), 3).split())}-{i}.html'
+
+    def _chrome(self, rng):
+        # Her sayfada tekrarlanan linkler: etiket bulutu, ilk sayfalama sayfaları, aylık arşiv
+        tags = ''.join(f'<li><a href="/{self.tag_dir}/{t}">{_words(rng, 1)}</a></li>' for t in range(self.tags))
+        pages = ''.join(f'<li><a href="/{self.page_dir}/{n}">{n}</a></li>' for n in range(2, min(8, self.listing_pages)))
+        months = ''.join(f'<li><a href="/{self.archive_dir}/{m}">{m}</a></li>' for m in range(1, 13))
+        return f'<nav><ul>{tags}</ul><ul>{pages}</ul><ul>{months}</ul></nav>'
+
+    def _listing(self, title, items, extra=''):
+        links = ''.join(f'<li><a href="{self.article_url(i)}">{_words(random.Random(i), 3)}</a></li>' for i in items)
+        return (f'<html><head><title>{title}</title></head><body>{self._chrome(random.Random(0))}'
+                f'<ul class="posts">{links}</ul>{extra}</body></html>')
+
+    def page_for(self, path):
+        parts = [p for p in path.split('/') if p]
+        if not parts:
+            return self._listing('Blog', range(self.per_page))
+        if len(parts) != 2:
+            return None
+        kind, key = parts
+        if kind == self.article_dir:
+            i = int(key.rsplit('-', 1)[-1].split('.')[0])
+            if not 0 <= i < self.articles:
+                return None
+            rng = random.Random(self.seed * 7919 + i)
+            related = ''.join(f'<li><a href="{self.article_url(rng.randrange(self.articles))}">{_words(rng, 3)}</a></li>'
+                              for _ in range(3))
+            body = ''.join(f'<p>{_words(rng, 40)} {i * 7919 + k}</p>' for k in range(6))
+            return (f'<html><head><title>Makale {i}</title></head><body>{self._chrome(rng)}'
+                    f'<main><h1>Makale {i}</h1>{body}</main><ul class="related">{related}</ul></body></html>')
+        if not key.isdigit():
+            return None
+        n = int(key)
+        rng = random.Random(self.seed * 104729 + sum(map(ord, kind)) + n)
+        if kind == self.page_dir and n < self.listing_pages:
+            nxt = f'<a href="/{self.page_dir}/{n + 1}">Sonraki</a>' if n + 1 < self.listing_pages else ''
+            return self._listing(f'Sayfa {n}', range(n * self.per_page, min((n + 1) * self.per_page, self.articles)), nxt)
+        if kind == self.tag_dir and n < self.tags:
+            return self._listing(f'Etiket {n}', [rng.randrange(self.articles) for _ in range(self.per_page)])
+        if kind == self.archive_dir and 1 <= n <= 12:
+            return self._listing(f'Arşiv {n}', [rng.randrange(self.articles) for _ in range(self.per_page)])
+        return None
+
+    def body_for(self, path):
+        body = self._bodies.get(path)
+        if body is None:
+            page = self.page_for(path.split('?', 1)[0])
+            if page is None:
+                return None
+            body = self._bodies[path] = page.encode('utf-8')
+        return body
+
+def run_job(url, ordering, args):
+    job = CrawlJob([url], mode='site', format='jsonl', ordering=ordering, depth=args.depth, max_pages=args.budget,
+                   concurrency=args.concurrency, per_host=args.concurrency, host_delay=0.0, use_robots=False)
+    start = time.perf_counter()
+    for _ in job.run(stream=io.BytesIO()):
+        pass
+    elapsed = time.perf_counter() - start
+    return job.stats, elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description="Aynı sayfa bütçesinde BFS ve uyarlanabilir sıralamanın "
+                                                 "ürettiği belge sayısı")
+    parser.add_argument('--articles', type=int, default=300)
+    parser.add_argument('--tags', type=int, default=60)
+    parser.add_argument('--budget', type=int, default=100, help="max_pages")
+    parser.add_argument('--depth', type=int, default=5)
+    parser.add_argument('--concurrency', type=int, default=4)
+    parser.add_argument('--latency', type=float, default=0.005)
+    parser.add_argument('--opaque', action='store_true', help="Yollarda etiket/sayfa gibi ipuçları olmasın")
+    args = parser.parse_args()
+
+    server, url = start_server(BlogSite(args.articles, args.tags, latency=args.latency, opaque=args.opaque))
+    try:
+        print(f"{'sıralama':<12}{'sayfa':>8}{'belge':>8}{'boş':>8}{'kopya':>8}{'süre (sn)':>12}{'belge/sn':>10}")
+        for ordering in ('fifo', 'priority', 'adaptive'):
+            stats, elapsed = run_job(url, ordering, args)
+            print(f"{ordering:<12}{stats['processed']:>8}{stats['success']:>8}{stats['empty']:>8}"
+                  f"{stats['duplicate']:>8}{elapsed:>12.2f}{stats['success'] / elapsed:>10.1f}")
+    finally:
+        server.shutdown()
+
+if __name__ == '__main__':
+    main()
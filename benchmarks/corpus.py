@@ -0,0 +1,99 @@
+import glob
+import os
+import random
+
+def load_corpus(path):
+    # Diske kaydedilmiş .html sayfalarını (ad, html) olarak okur
+    pages = []
+    for file_path in sorted(glob.glob(os.path.join(path, '**', '*.html'), recursive=True)):
+        with open(file_path, encoding='utf-8', errors='replace') as f:
+            pages.append((os.path.relpath(file_path, path), f.read()))
+    return pages
+
+def _words(rng, n):
+    vocab = ['kazıma', 'sayfa', 'içerik', 'başlık', 'paragraf', 'liste', 'site', 'veri',
+             'belge', 'soru', 'cevap', 'ürün', 'hizmet', 'destek', 'hakkında', 'iletişim']
+    return ' '.join(rng.choice(vocab) for _ in range(n))
+
+def _nav(rng, links):
+    items = ''.join(f'<li><a href="/page/{i}.html">{_words(rng, 2)}</a></li>' for i in links)
+    return f'<header><nav class="menu"><ul>{items}</ul></nav></header>'
+
+def article_page(rng, i):
+    body = ''.join(
+        f'<h2>{_words(rng, 4)}</h2>' + ''.join(f'<p>{_words(rng, 40)} <b>{_words(rng, 3)}</b> {_words(rng, 20)}</p>' for _ in range(4))
+        for _ in range(6))
+    return f'<html><head><title>Makale {i}</title></head><body>{_nav(rng, range(20))}<main><h1>Makale {i}</h1>{body}</main><footer><p>{_words(rng, 10)}</p></footer></body></html>'
+
+def deep_page(rng, i, depth=40):
+    inner = f'<p>{_words(rng, 30)}</p><span>{_words(rng, 10)}</span>'
+    for d in range(depth):
+        cls = rng.choice(['wrapper', 'container', 'row', 'col', 'content', 'section', 'inner'])
+        inner = f'<div class="{cls}-{d}">{inner}<p>{_words(rng, 12)}</p></div>'
+    return f'<html><head><title>Derin {i}</title></head><body>{_nav(rng, range(10))}{inner * 5}</body></html>'
+
+def faq_page(rng, i, questions=60):
+    items = ''.join(
+        f'<div class="faq-item"><span class="soru">{_words(rng, 8)}?</span><div class="cevap"><p>{_words(rng, 30)}</p></div></div>'
+        for _ in range(questions))
+    return f'<html><head><title>SSS {i}</title></head><body>{_nav(rng, range(10))}<div class="accordion">{items}</div><div class="sidebar"><p>{_words(rng, 20)}</p></div></body></html>'
+
+def list_page(rng, i, items=800):
+    lis = ''.join(f'<li><strong>{_words(rng, 2)}</strong> {_words(rng, 12)}</li>' for _ in range(items))
+    return f'<html><head><title>Liste {i}</title></head><body>{_nav(rng, range(10))}<h1>Liste {i}</h1><ul>{lis}</ul><ol>{lis[:len(lis) // 4]}</ol></body></html>'
+
+PAGE_KINDS = [article_page, deep_page, faq_page, list_page]
+
+def nav_page(rng, i, links=1500):
+    # Link bulma ölçümü için: mega menü, göreli/mutlak/dosya linkleri ve <base href> içeren sayfa
+    groups = ''.join(
+        f'<li><span>{_words(rng, 2)}</span><ul>'
+        + ''.join(f'<li><a href="{rng.choice(["/kategori/", "urun/", "../arsiv/", "http://ornek.test/etiket/"])}{rng.randrange(links)}'
+                  f'{rng.choice([".html", "", "/", ".pdf", ".JPG", "?sayfa=2", "#yorumlar"])}">{_words(rng, 2)}</a></li>'
+                  for _ in range(50))
+        + '</ul></li>' for _ in range(links // 50))
+    return (f'<html><head><title>Menü {i}</title><base href="/bolum/{i}/"></head><body>'
+            f'<nav class="mega-menu"><ul>{groups}</ul></nav><h1>Menü {i}</h1><p>{_words(rng, 40)}</p>'
+            f'<script>var s = "<a href=\'/script-ici\'>";</script></body></html>')
+
+def synthetic_corpus(n=40, seed=0):
+    # Makale, derin DOM, SSS/accordion ve büyük liste sayfalarından oluşan tekrarlanabilir bir küme
+    rng = random.Random(seed)
+    return [(f'{PAGE_KINDS[i % len(PAGE_KINDS)].__name__}_{i}.html', PAGE_KINDS[i % len(PAGE_KINDS)](rng, i)) for i in range(n)]
+
+def save_corpus(pages, path):
+    # (ad, html) çiftlerini load_corpus'un okuyabileceği şekilde klasöre yazar
+    for name, html in pages:
+        file_path = os.path.join(path, name)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(file_path, 'w', encoding='utf-8') as f:
+            f.write(html)
+
+def record_pages(urls):
+    # Canlı sayfaları bir kez indirip (ad, html) olarak döndürür; sonraki ölçümler ağdan bağımsız olur
+    from urllib.parse import urlparse
+    from scraper import fetch_page
+    pages = []
+    for i, url in enumerate(urls):
+        html = fetch_page(url)
+        if html is None:
+            print(f"İndirilemedi: {url}")
+            continue
+        pages.append((f"{i:04d}_{urlparse(url).netloc.replace('.', '_')}.html", html))
+    return pages
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Ölçümler için HTML sayfa kümesi kaydet")
+    parser.add_argument('path', help="Sayfaların yazılacağı klasör")
+    parser.add_argument('--pages', type=int, default=40, help="Yapay küme sayfa sayısı")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--url', nargs='+', default=[], help="Yapay küme yerine kaydedilecek canlı sayfalar")
+    args = parser.parse_args()
+
+    pages = record_pages(args.url) if args.url else synthetic_corpus(args.pages, args.seed)
+    save_corpus(pages, args.path)
+    print(f"{len(pages)} sayfa, {sum(len(h) for _, h in pages) / 1024:.0f} KB -> {args.path}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+import random
+import re
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        site = self.server.site
+        body = site.body_for(self.path)
+        delay = site.delay()
+        if delay:
+            time.sleep(delay)
+        if body is None:
+            self.send_response(404)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+# Kayıtlı sayfalardaki mevcut linkler devre dışı bırakılır; site yalnızca seçilen link grafiğini izler
+ANCHOR_HREF = re.compile(r'(<a\b[^>]*?\s)href=', re.IGNORECASE)
+GRAPHS = ('tree', 'random', 'ring')
+
+class StubSite:
+    # /page/<i>.html sayfalarından oluşan yapay site. graph: 'tree' (her sayfa fanout alt sayfaya),
+    # 'random' (seed ile sabit rastgele fanout sayfaya), 'ring' (sonraki fanout sayfaya) link verir.
+    # corpus verilirse i. sayfa corpus[i % len(corpus)] HTML'i ve sonuna eklenen link listesidir.
+    def __init__(self, pages=200, fanout=5, latency=0.05, corpus=None, graph='tree', jitter=0.0, seed=0):
+        if graph not in GRAPHS:
+            raise ValueError(f"Bilinmeyen link grafiği: {graph}")
+        self.pages = pages
+        self.fanout = fanout
+        self.latency = latency
+        self.jitter = jitter
+        self.graph = graph
+        self.seed = seed
+        self.corpus = [ANCHOR_HREF.sub(r'\1data-href=', html) for _, html in corpus] if corpus else None
+        self._rng = random.Random(seed)
+        self._bodies = {}
+        self._lock = threading.Lock()
+
+    def delay(self):
+        if not self.jitter:
+            return self.latency
+        with self._lock:
+            return self.latency + self._rng.uniform(0, self.jitter)
+
+    def links_for(self, i):
+        if self.graph == 'random':
+            rng = random.Random(self.seed * 1000003 + i)
+            children = [rng.randrange(self.pages) for _ in range(self.fanout)]
+        elif self.graph == 'ring':
+            children = [(i + k + 1) % self.pages for k in range(self.fanout)]
+        else:
+            children = [i * self.fanout + k + 1 for k in range(self.fanout)]
+        return [c for c in children if c < self.pages] + [0]
+
+    def page_for(self, path):
+        if path in ('/', '/index.html'):
+            i = 0
+        elif path.startswith('/page/') and path.endswith('.html'):
+            try:
+                i = int(path[len('/page/'):-len('.html')])
+            except ValueError:
+                return None
+        else:
+            return None
+        if not 0 <= i < self.pages:
+            return None
+        links = ''.join(f'<li><a href="/page/{c}.html">Sayfa {c}</a></li>' for c in self.links_for(i))
+        if self.corpus:
+            html = self.corpus[i % len(self.corpus)]
+            nav = f'<nav class="stub-links"><ul>{links}</ul></nav><p>Benzersiz içerik {i * 7919}.</p>'
+            end = html.rfind('</body>')
+            return html[:end] + nav + html[end:] if end != -1 else html + nav
+        return (
+            f'<html><head><title>Sayfa {i}</title></head><body>'
+            f'<nav><ul>{links}</ul></nav>'
+            f'<h1>Sayfa {i}</h1>'
+            f'<p>Bu sayfa <b>{i}</b> numaralı test sayfasıdır.</p>'
+            f'<p>Benzersiz içerik {i * 7919}.</p>'
+            f'</body></html>'
+        )
+
+    def body_for(self, path):
+        # Kodlanmış gövde yol başına bir kez üretilir; ölçüme sunucu tarafındaki HTML üretimi karışmaz
+        body = self._bodies.get(path)
+        if body is None:
+            page = self.page_for(path)
+            if page is None:
+                return None
+            body = self._bodies[path] = page.encode('utf-8')
+        return body
+
+def start_server(site, host='127.0.0.1', port=0):
+    server = ThreadingHTTPServer((host, port), StubHandler)
+    server.daemon_threads = True
+    server.site = site
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, f"http://{host}:{server.server_address[1]}/"
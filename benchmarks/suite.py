@@ -0,0 +1,193 @@
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from crawler import Crawler
+from scraper import available_parsers, parse_html, extract_content, hash_content
+from dedup import simhash
+from document_processor import create_document_bytes
+from benchmarks.bench_extract import DEFAULT_OPTS
+from benchmarks.corpus import load_corpus, synthetic_corpus
+from benchmarks.stub_server import GRAPHS, StubSite, start_server
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Karşılaştırmada gösterilen ana değerler: (aşama, anahtar, daha büyüğü iyi mi)
+HEADLINE = [
+    ('crawl', 'pages_per_sec', True),
+    ('extract', 'parse_ms', False),
+    ('extract', 'process_content_ms', False),
+    ('extract', 'fingerprint_ms', False),
+    ('docx', 'create_document_ms', False),
+]
+RSS_KEYS = ('peak_rss_mb', 'rss_delta_mb')
+
+def peak_rss_mb():
+    if resource is None:
+        return None
+    # Linux'ta KB, macOS'ta bayt
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == 'darwin' else rss / 1024
+
+def load_pages(args):
+    return load_corpus(args['corpus']) if args['corpus'] else synthetic_corpus(args['pages'], args['seed'])
+
+def _with_rss(measure):
+    # Her aşama ayrı süreçte çalışır; tepe RSS yalnızca o aşamayı, artış modüller yüklendikten sonraki
+    # ayırmaları yansıtır
+    def run(args):
+        base = peak_rss_mb()
+        result = measure(args)
+        peak = peak_rss_mb()
+        if peak is not None:
+            result['peak_rss_mb'] = peak
+            result['rss_delta_mb'] = peak - base
+        return result
+    return run
+
+def measure_crawl(args):
+    site = StubSite(args['site_pages'], args['fanout'], args['latency'], corpus=load_pages(args),
+                    graph=args['graph'], jitter=args['jitter'], seed=args['seed'])
+    server, url = start_server(site)
+    try:
+        best = None
+        for _ in range(args['repeat']):
+            crawler = Crawler(url, depth=args['depth'], max_pages=args['site_pages'], concurrency=args['concurrency'],
+                              per_host=args['concurrency'], host_delay=0.0, parser=args['parser'])
+            start = time.perf_counter()
+            found = sum(1 for _ in crawler.crawl())
+            elapsed = time.perf_counter() - start
+            if best is None or elapsed < best[1]:
+                best = (found, elapsed)
+    finally:
+        server.shutdown()
+    found, elapsed = best
+    return {'pages': found, 'seconds': elapsed, 'pages_per_sec': found / elapsed}
+
+def measure_extract(args):
+    pages = load_pages(args)
+    # fingerprint: her sayfada kopya kontrolü için hesaplanan hash_content + SimHash
+    parse_runs, extract_runs, fingerprint_runs = [], [], []
+    for _ in range(args['repeat']):
+        parse_time = extract_time = fingerprint_time = 0.0
+        for _, html in pages:
+            start = time.perf_counter()
+            tree = parse_html(html, args['parser'])
+            parse_time += time.perf_counter() - start
+            start = time.perf_counter()
+            content = extract_content(tree, DEFAULT_OPTS)
+            extract_time += time.perf_counter() - start
+            start = time.perf_counter()
+            hash_content(content)
+            simhash(content)
+            fingerprint_time += time.perf_counter() - start
+        parse_runs.append(parse_time)
+        extract_runs.append(extract_time)
+        fingerprint_runs.append(fingerprint_time)
+    n = len(pages)
+    return {'pages': n, 'html_kb': sum(len(h) for _, h in pages) / 1024,
+            'parse_ms': statistics.median(parse_runs) / n * 1000,
+            'process_content_ms': statistics.median(extract_runs) / n * 1000,
+            'fingerprint_ms': statistics.median(fingerprint_runs) / n * 1000}
+
+def measure_docx(args):
+    contents = [extract_content(parse_html(html, args['parser']), DEFAULT_OPTS) for _, html in load_pages(args)]
+    contents = [c for c in contents if c]
+    create_document_bytes(contents[0])  # şablon önbelleği ısınır
+    runs = []
+    size = 0
+    for _ in range(args['repeat']):
+        start = time.perf_counter()
+        size = sum(len(create_document_bytes(content).getvalue()) for content in contents)
+        runs.append(time.perf_counter() - start)
+    n = len(contents)
+    return {'documents': n, 'create_document_ms': statistics.median(runs) / n * 1000, 'docx_kb': size / n / 1024}
+
+STAGES = {
+    'crawl': _with_rss(measure_crawl),
+    'extract': _with_rss(measure_extract),
+    'docx': _with_rss(measure_docx),
+}
+
+def run_stage(name, args):
+    with ProcessPoolExecutor(max_workers=1, mp_context=get_context('spawn')) as pool:
+        return pool.submit(_run_stage, name, args).result()
+
+def _run_stage(name, args):
+    return STAGES[name](args)
+
+def git_commit():
+    try:
+        out = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True)
+        dirty = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'],
+                               capture_output=True, text=True).stdout.strip()
+        return out.stdout.strip() + ('+değişiklik' if dirty else '')
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def print_results(results):
+    for stage, values in results.items():
+        print(f"[{stage}] " + ', '.join(f"{k}={v:.2f}" if isinstance(v, float) else f"{k}={v}"
+                                        for k, v in values.items()))
+
+def print_comparison(baseline, current):
+    if baseline['params'] != current['params']:
+        print("UYARI: Ölçüm parametreleri farklı, sonuçlar doğrudan karşılaştırılamaz")
+    print(f"\n{'ölçüm':<30}{baseline['commit'] or 'önceki':>20}{current['commit'] or 'şimdiki':>20}{'değişim':>10}")
+    for stage, key, higher_better in HEADLINE + [(s, k, False) for s in STAGES for k in RSS_KEYS]:
+        old = baseline['results'].get(stage, {}).get(key)
+        new = current['results'].get(stage, {}).get(key)
+        if old is None or new is None:
+            continue
+        change = (new - old) / old * 100 if old else 0.0
+        better = change > 0 if higher_better else change < 0
+        mark = '' if abs(change) < 3 else (' +' if better else ' -')
+        print(f"{f'{stage}.{key}':<30}{old:>20.2f}{new:>20.2f}{change:>9.1f}%{mark}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Çevrimdışı, tekrarlanabilir ölçüm takımı: tarama hızı, "
+                                                 "process_content, parmak izi (hash_content + SimHash) ve "
+                                                 "create_document_bytes maliyeti, tepe bellek")
+    parser.add_argument('--corpus', help="Kayıtlı .html sayfalarının bulunduğu klasör (verilmezse yapay küme)")
+    parser.add_argument('--pages', type=int, default=40, help="Yapay küme sayfa sayısı")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--parser', choices=available_parsers(), default='html.parser')
+    parser.add_argument('--site-pages', type=int, default=200, help="Yerel sunucudaki sayfa sayısı")
+    parser.add_argument('--graph', choices=GRAPHS, default='tree', help="Link grafiği")
+    parser.add_argument('--fanout', type=int, default=5, help="Sayfa başına link sayısı")
+    parser.add_argument('--depth', type=int, default=10)
+    parser.add_argument('--latency', type=float, default=0.02, help="Yanıt gecikmesi (sn)")
+    parser.add_argument('--jitter', type=float, default=0.0, help="Gecikmeye eklenen rastgele süre üst sınırı (sn)")
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--stages', nargs='+', choices=list(STAGES), default=list(STAGES))
+    parser.add_argument('--save', help="Sonuçları JSON olarak bu dosyaya yaz")
+    parser.add_argument('--compare', help="Önceki bir --save çıktısıyla karşılaştır")
+    args = parser.parse_args()
+
+    params = {k: v for k, v in vars(args).items() if k not in ('save', 'compare', 'stages')}
+    results = {}
+    for name in args.stages:
+        print(f"{name} ölçülüyor...", file=sys.stderr)
+        results[name] = run_stage(name, params)
+    current = {'commit': git_commit(), 'python': platform.python_version(), 'platform': platform.platform(),
+               'created': time.strftime('%Y-%m-%d %H:%M:%S'), 'params': params, 'results': results}
+
+    print_results(results)
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump(current, f, ensure_ascii=False, indent=1)
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            print_comparison(json.load(f), current)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,129 @@
+import argparse
+import json
+import os
+import sys
+from scraper import available_link_parsers, available_parsers, is_valid_url
+from crawl_job import CrawlJob, DEFAULT_OPTS, DEFAULT_SETTINGS, open_output, read_seed_file
+from renderers import RENDERERS
+from profiles import load_profiles
+
+# Komut satırından toplu kazıma (ör. cron ile):
+#   python cli.py https://example.com --site --depth 2 --max-pages 200 -o sonuc.zip
+#   python cli.py --seeds urls.txt -o kazima_sonuclari/ --incremental
+
+CACHE_DIR = '.kazima_cache'
+
+def build_parser():
+    p = argparse.ArgumentParser(description="Arayüz olmadan web kazıma")
+    p.add_argument('urls', nargs='*', help="Kazınacak URL'ler")
+    p.add_argument('--seeds', help="Her satırında bir URL bulunan dosya")
+    p.add_argument('-o', '--output', required=True,
+                   help="Çıktı klasörü ya da .zip arşivi; docx dışındaki biçimlerde tek çıktı dosyası")
+    p.add_argument('--format', choices=['docx'] + list(RENDERERS), default='docx',
+                   help="docx: sayfa başına belge, combined_docx/markdown/jsonl: tüm sayfalar tek dosyada")
+    p.add_argument('--site', action='store_true', help="Her URL'den başlayarak tüm siteyi kazı")
+    p.add_argument('--depth', type=int, default=DEFAULT_SETTINGS['depth'])
+    p.add_argument('--max-pages', type=int, default=DEFAULT_SETTINGS['max_pages'], help="Site başına en fazla sayfa")
+    p.add_argument('--concurrency', type=int, default=DEFAULT_SETTINGS['concurrency'])
+    p.add_argument('--per-host', type=int, default=DEFAULT_SETTINGS['per_host'])
+    p.add_argument('--host-delay', type=float, default=DEFAULT_SETTINGS['host_delay'])
+    p.add_argument('--workers', type=int, default=DEFAULT_SETTINGS['workers'], help="İçerik çıkarma süreç sayısı")
+    p.add_argument('--parser', choices=available_parsers(), default=DEFAULT_SETTINGS['parser'])
+    p.add_argument('--link-parser', choices=available_link_parsers(),
+                   help="'stream': ağaç kurmadan yalnızca linkleri tarar")
+    p.add_argument('--query-params', default='', help="URL'de korunacak sorgu parametreleri (virgülle ayrılmış)")
+    p.add_argument('--similarity', type=float, default=DEFAULT_SETTINGS['similarity'])
+    p.add_argument('--ignore-robots', action='store_true', help="robots.txt kurallarını uygulama")
+    p.add_argument('--sitemap', action='store_true', help="sitemap.xml ile URL keşfi")
+    p.add_argument('--ordering', choices=('fifo', 'priority', 'adaptive'), default=DEFAULT_SETTINGS['ordering'],
+                   help="Tarama sırası; 'adaptive' içerik çıkan sayfalara benzeyen URL'leri öne alır")
+    p.add_argument('--compact-seen', action='store_true', help="Ziyaret kümesi için Bloom filtresi")
+    p.add_argument('--cache', action='store_true', help="Disk önbelleği kullan")
+    p.add_argument('--incremental', action='store_true', help="Değişmeyen sayfaları yeniden üretme")
+    p.add_argument('--persist-dedup', action='store_true', help="Benzerlik dizinini çalıştırmalar arasında sakla")
+    p.add_argument('--max-mb', type=float, default=DEFAULT_SETTINGS['max_bytes'] / (1024 * 1024),
+                   help="Bu boyutu aşan sayfalar indirilmez (MB)")
+    p.add_argument('--head-probe', action='store_true', help="İndirmeden önce HEAD isteğiyle içerik türü/boyut kontrolü")
+    p.add_argument('--site-profiles', help="Site profilleri JSON dosyası (alan adı -> içerik/hariç/dahil seçicileri)")
+    p.add_argument('--opts', help="Element seçenekleri JSON dosyası (ör. {\"h1\": true, \"div\": true})")
+    p.add_argument('--manifest', action='store_true', help="URL -> dosya adı -> içerik hash'i listesini manifest.json olarak ekle")
+    p.add_argument('--report', help="Aşama süreleri raporunu JSON olarak bu dosyaya yaz")
+    p.add_argument('--prometheus', help="Aşama süreleri metriklerini Prometheus metin biçiminde bu dosyaya yaz")
+    p.add_argument('--profile', help="cProfile çıktısını bu .prof dosyasına yaz (snakeviz/pstats ile açılabilir)")
+    p.add_argument('--quiet', action='store_true', help="Sayfa sayfa çıktı verme")
+    return p
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    urls = list(args.urls)
+    if args.seeds:
+        urls.extend(read_seed_file(args.seeds))
+    invalid = [u for u in urls if not is_valid_url(u)]
+    if not urls or invalid:
+        print(f"Geçerli URL gerekli: {', '.join(invalid) or '-'}", file=sys.stderr)
+        return 2
+
+    opts = dict(DEFAULT_OPTS)
+    if args.opts:
+        with open(args.opts, encoding='utf-8') as f:
+            opts.update(json.load(f))
+
+    site_profiles = None
+    if args.site_profiles:
+        try:
+            site_profiles = load_profiles(args.site_profiles)
+        except (OSError, ValueError) as e:
+            print(f"Site profilleri okunamadı: {e}", file=sys.stderr)
+            return 2
+
+    job = CrawlJob(
+        urls, opts,
+        mode='site' if args.site else 'single', format=args.format,
+        depth=args.depth, max_pages=args.max_pages, concurrency=args.concurrency,
+        per_host=args.per_host, host_delay=args.host_delay, workers=args.workers,
+        parser=args.parser, link_parser=args.link_parser,
+        allowed_params=[q.strip() for q in args.query_params.split(',') if q.strip()],
+        similarity=args.similarity, use_robots=not args.ignore_robots, use_sitemap=args.sitemap,
+        ordering=args.ordering, compact_seen=args.compact_seen,
+        cache_path=os.path.join(CACHE_DIR, 'http_cache.sqlite') if args.cache else None,
+        manifest_path=os.path.join(CACHE_DIR, 'manifest.sqlite') if args.incremental else None,
+        dedup_path=os.path.join(CACHE_DIR, 'dedup.sqlite') if args.persist_dedup else None,
+        max_bytes=int(args.max_mb * 1024 * 1024), head_probe=args.head_probe,
+        profile=bool(args.profile), site_profiles=site_profiles,
+    )
+
+    if args.format == 'docx':
+        output, stream = open_output(args.output, args.manifest), None
+    else:
+        output, stream = None, open(args.output, 'wb')
+    try:
+        for res in job.run(output, stream):
+            if args.quiet:
+                continue
+            if res['status'] == 'success':
+                print(f"OK\t{res['url']}\t{res['filename'] or args.output}")
+            elif res['status'] == 'duplicate':
+                print(f"KOPYA\t{res['url']}\t{res['duplicate_of']}")
+            else:
+                print(f"BOŞ\t{res['url']}")
+    finally:
+        (output or stream).close()
+
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            f.write(job.metrics.to_json())
+    if args.prometheus:
+        with open(args.prometheus, 'w', encoding='utf-8') as f:
+            f.write(job.metrics.to_prometheus())
+    if args.profile:
+        job.profiler.dump_stats(args.profile)
+
+    stats = job.stats
+    print(json.dumps({k: stats[k] for k in ('processed', 'success', 'duplicate', 'empty', 'changes', 'network',
+                                            'scheduler')}
+                     | {'removed': len(stats['removed']), 'visited': job.visited}, ensure_ascii=False),
+          file=sys.stderr)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
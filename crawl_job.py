@@ -0,0 +1,332 @@
+import cProfile
+import io
+import json
+import os
+import pstats
+import threading
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from urllib.parse import urlparse
+from scraper import CrawlerSession, DEFAULT_MAX_BYTES, fetch_and_parse
+from crawler import Crawler, HostLimiter
+from http_cache import ResponseCache
+from manifest import Manifest, options_key
+from dedup import DuplicateIndex
+from pipeline import run_pipeline
+from renderers import RENDERERS, open_renderer
+from metrics import StageMetrics, add_stage
+from profiles import compile_profiles, select_profiles
+
+# Arayüzdeki varsayılan element seçimleri
+DEFAULT_OPTS = {
+    'h1': True, 'h2': True, 'h3': True, 'h4': False, 'h5': False, 'h6': False,
+    'p': True, 'div': False, 'lists': True, 'headers': False, 'footers': False, 'span': False,
+}
+
+# mode: 'single' girilen URL'lerin yalnızca kendisini, 'site' her URL'den başlayarak siteyi kazır
+# format: 'docx' sayfa başına bir belge, diğerleri (renderers.RENDERERS) tüm sayfaları tek çıktıya yazar
+# ordering: site modunda tarama sırası, crawler.Crawler ile aynı ('fifo' | 'priority' | 'adaptive')
+DEFAULT_SETTINGS = {
+    'mode': 'single',
+    'format': 'docx',
+    'depth': 2,
+    'max_pages': 50,
+    'concurrency': 8,
+    'per_host': 2,
+    'host_delay': 0.1,
+    'parser': 'html.parser',
+    'link_parser': None,
+    'allowed_params': None,
+    'ordering': 'fifo',
+    'compact_seen': False,
+    'use_robots': True,
+    'use_sitemap': False,
+    'similarity': 0.95,
+    'workers': 1,
+    'cache_path': None,
+    'cache_bytes': 200 * 1024 * 1024,
+    'max_bytes': DEFAULT_MAX_BYTES,
+    'head_probe': False,
+    'manifest_path': None,
+    'dedup_path': None,
+    'profile': False,
+    'site_profiles': None,
+}
+
+MANIFEST_NAME = 'manifest.json'
+
+def document_filename(url, index):
+    return f"{urlparse(url).netloc.replace('.', '_')}_{index}.docx"
+
+def read_seed_file(path):
+    # Her satırda bir URL; boş satırlar ve # ile başlayan satırlar atlanır
+    with open(path, encoding='utf-8') as f:
+        return [line.strip() for line in f if line.strip() and not line.lstrip().startswith('#')]
+
+class DirectoryOutput:
+    def __init__(self, path, with_manifest=False):
+        self.path = path
+        self.entries = {} if with_manifest else None
+        os.makedirs(path, exist_ok=True)
+
+    def write(self, filename, data, url=None, content_hash=None):
+        with open(os.path.join(self.path, filename), 'wb') as f:
+            f.write(data)
+        if self.entries is not None:
+            self.entries[url] = {'filename': filename, 'content_hash': content_hash}
+
+    def close(self):
+        if self.entries is not None:
+            with open(os.path.join(self.path, MANIFEST_NAME), 'w', encoding='utf-8') as f:
+                json.dump(self.entries, f, ensure_ascii=False, indent=1)
+
+class ZipOutput:
+    # Belgeler üretildikçe tek bir arşive yazılır; target bir yol ya da (geçici) dosya nesnesi olabilir.
+    # .docx zaten sıkıştırılmış bir zip olduğundan yeniden sıkıştırılmadan (ZIP_STORED) eklenir.
+    def __init__(self, target, with_manifest=False):
+        self.target = target
+        self.entries = {} if with_manifest else None
+        self._zip = zipfile.ZipFile(target, 'w', zipfile.ZIP_STORED)
+
+    def write(self, filename, data, url=None, content_hash=None):
+        self._zip.writestr(filename, data)
+        if self.entries is not None:
+            self.entries[url] = {'filename': filename, 'content_hash': content_hash}
+
+    def close(self):
+        if self.entries is not None:
+            self._zip.writestr(MANIFEST_NAME, json.dumps(self.entries, ensure_ascii=False, indent=1),
+                               compress_type=zipfile.ZIP_DEFLATED)
+        self._zip.close()
+
+def open_output(path, with_manifest=False):
+    # .zip ile biten yollar arşive, diğerleri klasöre yazılır
+    if path.lower().endswith('.zip'):
+        return ZipOutput(path, with_manifest)
+    return DirectoryOutput(path, with_manifest)
+
+def fetch_pages(urls, session, manifest=None, parser='html.parser', concurrency=8, per_host=2, host_delay=0.1,
+                stop=None):
+    # URL listesini site dolaşmadan indirir; (url, page) sırası tamamlanma sırasıdır.
+    # stop (threading.Event) işaretlenince yeni istek gönderilmez.
+    limiter = HostLimiter(per_host, host_delay)
+
+    def fetch(url):
+        host = urlparse(url).netloc
+        limiter.acquire(host)
+        try:
+            return fetch_and_parse(url, session=session, manifest=manifest, parser=parser)
+        finally:
+            limiter.release(host)
+
+    pending = iter(urls)
+    in_flight = {}
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+        while True:
+            for url in pending:
+                if stop is not None and stop.is_set():
+                    break
+                in_flight[pool.submit(fetch, url)] = url
+                if len(in_flight) >= concurrency:
+                    break
+            if not in_flight:
+                break
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield in_flight.pop(future), future.result()
+
+class CrawlJob:
+    # Arayüzden bağımsız kazıma işi: URL'leri indirir, içerik çıkarır, .docx üretir ve isteğe bağlı olarak
+    # sonuçları bir klasöre ya da .zip arşivine yazar. Uygulama ve komut satırı aynı motoru kullanır.
+    def __init__(self, urls, opts=None, **settings):
+        unknown = set(settings) - set(DEFAULT_SETTINGS)
+        if unknown:
+            raise ValueError(f"Bilinmeyen ayar: {', '.join(sorted(unknown))}")
+        self.urls = list(urls)
+        self.opts = dict(opts if opts is not None else DEFAULT_OPTS)
+        self.settings = dict(DEFAULT_SETTINGS, **settings)
+        if self.settings['format'] != 'docx' and self.settings['format'] not in RENDERERS:
+            raise ValueError(f"Bilinmeyen çıktı biçimi: {self.settings['format']}")
+        # Kazınacak sitelere ait profiller seçeneklere eklenir: işlem havuzuna seçeneklerle taşınır ve
+        # profil değişince artımlı kazımada sayfalar yeniden işlenir. Diğer sitelerinki dahil hatalı profiller
+        # ValueError verir.
+        compile_profiles(self.settings['site_profiles'])
+        profiles = select_profiles(self.settings['site_profiles'], self.urls)
+        if profiles:
+            self.opts['profiles'] = profiles
+        self.crawlers = []
+        self.fetched = 0
+        self._cancel = threading.Event()
+        self.metrics = StageMetrics()
+        self.profiler = None
+        self.stats = {
+            'processed': 0, 'success': 0, 'duplicate': 0, 'empty': 0,
+            'changes': {'new': 0, 'changed': 0, 'unchanged': 0}, 'removed': [],
+            'network': None, 'cache': None, 'frontier': None, 'discovery': None, 'scheduler': None,
+        }
+
+    def cancel(self):
+        # run() süren istekler bittikten sonra durur; o ana kadarki sonuçlar korunur
+        self._cancel.set()
+        for crawler in self.crawlers:
+            crawler.stop()
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    def profile_text(self, limit=30):
+        # profile=True ile çalıştırılan işin cProfile özeti (kümülatif süreye göre)
+        if self.profiler is None:
+            return None
+        out = io.StringIO()
+        pstats.Stats(self.profiler, stream=out).sort_stats('cumulative').print_stats(limit)
+        return out.getvalue()
+
+    @property
+    def renders_docx(self):
+        return self.settings['format'] == 'docx'
+
+    @property
+    def total(self):
+        # İlerleme çubuğu için üst sınır
+        if self.settings['mode'] == 'site':
+            return self.settings['max_pages'] * len(self.urls)
+        return len(self.urls)
+
+    @property
+    def visited(self):
+        if self.settings['mode'] == 'site':
+            return sum(len(crawler.visited) for crawler in self.crawlers)
+        return self.fetched
+
+    def _site_pages(self, session, manifest, opts_hash):
+        s = self.settings
+        for start_url in self.urls:
+            if self.cancelled:
+                return
+            crawler = Crawler(start_url, depth=s['depth'], max_pages=s['max_pages'], concurrency=s['concurrency'],
+                              per_host=s['per_host'], host_delay=s['host_delay'], session=session,
+                              manifest=manifest, parser=s['parser'], link_parser=s['link_parser'],
+                              allowed_params=s['allowed_params'], ordering=s['ordering'],
+                              compact_seen=s['compact_seen'],
+                              use_robots=s['use_robots'], use_sitemap=s['use_sitemap'],
+                              opts_hash=opts_hash if self.renders_docx else None)
+            self.crawlers.append(crawler)
+            if self.cancelled:
+                crawler.stop()
+            yield from crawler.crawl()
+
+    def _list_pages(self, session, manifest):
+        s = self.settings
+        for url, page in fetch_pages(self.urls, session, manifest, s['parser'], s['concurrency'],
+                                     s['per_host'], s['host_delay'], self._cancel):
+            self.fetched += 1
+            yield url, page
+
+    def run(self, output=None, stream=None):
+        # Sonuçları sayfa işlendikçe döndürür. 'docx' biçiminde başarılı sonuçlar 'filename' alanı taşır ve
+        # output verilmişse yazılır; diğer biçimlerde sayfalar stream'e (ikili dosya nesnesi) eklenir.
+        s = self.settings
+        stats = self.stats
+        cache = ResponseCache(s['cache_path'], s['cache_bytes']) if s['cache_path'] else None
+        manifest = Manifest(s['manifest_path']) if s['manifest_path'] else None
+        dedup = DuplicateIndex(s['similarity'], s['dedup_path'])
+        opts_hash = options_key(self.opts)
+        session = CrawlerSession(pool_maxsize=s['concurrency'], cache=cache, max_bytes=s['max_bytes'],
+                                 head_probe=s['head_probe'])
+        if s['mode'] == 'site':
+            pages = self._site_pages(session, manifest, opts_hash)
+        else:
+            pages = self._list_pages(session, manifest)
+        renderer = open_renderer(s['format'], stream) if stream is not None and not self.renders_docx else None
+        seen_urls = set()
+        # cProfile yalnızca bu iş parçacığını (ayrıştırma, içerik çıkarma, belge oluşturma) ölçer; indirme
+        # iş parçacıklarının süreleri aşama ölçümlerinde yer alır
+        if s['profile']:
+            self.profiler = cProfile.Profile()
+            self.profiler.enable()
+        try:
+            for res in run_pipeline(pages, self.opts, dedup, manifest, opts_hash, workers=s['workers'],
+                                    render=self.renders_docx):
+                stats['processed'] += 1
+                stats[res['status']] += 1
+                # 'adaptive' sıralama hangi sayfalardan belge çıktığını öğrenir; her tarayıcı yalnızca kendi
+                # URL'lerini dikkate alır
+                for crawler in self.crawlers:
+                    crawler.record_result(res['url'], res['status'] == 'success')
+                seen_urls.add(res['url'])
+                if res['change']:
+                    stats['changes'][res['change']] += 1
+                res['filename'] = None
+                if res['status'] == 'success' and renderer is not None:
+                    start = time.perf_counter()
+                    renderer.add(res['url'], res['content'])
+                    add_stage(res['stages'], 'render', time.perf_counter() - start)
+                elif res['status'] == 'success' and self.renders_docx:
+                    res['filename'] = document_filename(res['url'], stats['processed'] - 1)
+                    if output is not None:
+                        output.write(res['filename'], res['docx'].getvalue(), res['url'], res['content_hash'])
+                self.metrics.record(res['url'], res['stages'], res['sizes'])
+                yield res
+                if self.cancelled:
+                    break
+
+            if manifest is not None and stats['processed'] and not self.cancelled:
+                stats['removed'].extend(self._prune(manifest, dedup, seen_urls))
+        finally:
+            if self.profiler is not None:
+                self.profiler.disable()
+            if renderer is not None:
+                renderer.close()
+            session.close()
+            stats['network'] = dict(session.stats)
+            if cache:
+                stats['cache'] = dict(cache.stats)
+                cache.close()
+            dedup.close()
+            if manifest:
+                manifest.close()
+            self._collect_crawl_stats()
+
+    def _prune(self, manifest, dedup, seen_urls):
+        # Yalnızca tamamı taranan sitelerde görülmeyen sayfalar kaldırılmış sayılır: sayfa bütçesi, derinlik
+        # sınırı ya da iptal yüzünden ziyaret edilmeyen, indirilemeyen ve robots.txt ile engellenen sayfalar silinmez
+        complete = {}
+        keep = set(seen_urls)
+        for crawler in self.crawlers:
+            complete[crawler.domain] = complete.get(crawler.domain, True) and crawler.complete
+            keep |= crawler.unfetched
+        removed = []
+        for domain, done in complete.items():
+            if done:
+                removed.extend(manifest.remove_missing(domain, keep))
+        dedup.remove(removed)
+        return removed
+
+    def _collect_crawl_stats(self):
+        if not self.crawlers:
+            return
+        frontier = {'enqueued': 0, 'duplicates': 0, 'peak': 0, 'queue_bytes': 0, 'seen_bytes': 0}
+        discovery = {'sitemap_urls': 0, 'robots_blocked': 0, 'lastmod_skipped': 0}
+        for crawler in self.crawlers:
+            fs = crawler.frontier.stats
+            mem = crawler.frontier.memory_bytes()
+            frontier['enqueued'] += fs['enqueued']
+            frontier['duplicates'] += fs['duplicates']
+            frontier['peak'] = max(frontier['peak'], fs['peak'])
+            frontier['queue_bytes'] += mem['queue']
+            frontier['seen_bytes'] += mem['seen']
+            for key in discovery:
+                discovery[key] += crawler.stats[key]
+        self.stats['frontier'] = frontier
+        self.stats['discovery'] = discovery
+        schedulers = [crawler.scheduler for crawler in self.crawlers if crawler.scheduler is not None]
+        if schedulers:
+            self.stats['scheduler'] = {
+                'useful': sum(sc.stats['useful'] for sc in schedulers),
+                'wasted': sum(sc.stats['wasted'] for sc in schedulers),
+                'refreshes': sum(sc.stats['refreshes'] for sc in schedulers),
+                'templates': [t for sc in schedulers for t in sc.report()],
+            }
@@ -0,0 +1,193 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from urllib.parse import urlparse
+from scraper import CrawlerSession, fetch_and_parse, canonicalize_url, normalize_link
+from frontier import Frontier
+from scheduler import YieldScheduler
+import discovery
+
+class HostLimiter:
+    # Aynı host'a aynı anda en fazla per_host istek gider, istek başlangıçları en az delay saniye aralıklıdır
+    def __init__(self, per_host=2, delay=0.1):
+        self.per_host = max(1, per_host)
+        self.delay = delay
+        self._lock = threading.Lock()
+        self._slots = {}
+        self._next_start = {}
+
+    def _slot(self, host):
+        with self._lock:
+            if host not in self._slots:
+                self._slots[host] = threading.Semaphore(self.per_host)
+            return self._slots[host]
+
+    def acquire(self, host):
+        self._slot(host).acquire()
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start.get(host, now))
+            self._next_start[host] = start + self.delay
+        if start > now:
+            time.sleep(start - now)
+
+    def release(self, host):
+        self._slot(host).release()
+
+class Crawler:
+    def __init__(self, start_url, depth=2, max_pages=50, concurrency=8, per_host=2, host_delay=0.1,
+                 session=None, manifest=None, parser='html.parser', link_parser=None, allowed_params=None,
+                 ordering='fifo', compact_seen=False, use_robots=False, use_sitemap=False, opts_hash=None):
+        # ordering: 'fifo' (BFS), 'priority' (sığ seviye önce) ya da 'adaptive' (beklenen içerik verimine göre,
+        # sonuçlar record_result ile bildirildikçe öğrenilir)
+        self.allowed_params = allowed_params
+        self.start_url = canonicalize_url(start_url, allowed_params)
+        self.depth = depth
+        self.max_pages = max_pages
+        self.concurrency = max(1, concurrency)
+        self.limiter = HostLimiter(per_host, host_delay)
+        self.session = session or CrawlerSession(pool_maxsize=self.concurrency)
+        self.manifest = manifest
+        self.parser = parser
+        self.link_parser = link_parser
+        self.domain = urlparse(self.start_url).netloc
+        self.scheduler = YieldScheduler() if ordering == 'adaptive' else None
+        self.frontier = Frontier('priority' if self.scheduler else ordering, compact_seen,
+                                 capacity=max(10000, max_pages * 50))
+        self.visited = set()
+        self.found = 0
+        self.use_robots = use_robots
+        self.use_sitemap = use_sitemap
+        self.opts_hash = opts_hash
+        self.robots = None
+        self.lastmod = {}
+        self.stats = {'sitemap_urls': 0, 'robots_blocked': 0, 'lastmod_skipped': 0}
+        # complete: crawl() sayfa bütçesi, derinlik sınırı ya da iptal olmadan bitti; ancak o zaman manifest'te
+        # bu taramada görülmeyen sayfalar kaldırılmış sayılabilir. unfetched: indirilemeyen ya da robots.txt ile
+        # engellenen, durumu bilinmediği için kaldırılmayan URL'ler
+        self.complete = False
+        self.truncated = False
+        self.unfetched = set()
+        self._stop = threading.Event()
+
+    def stop(self):
+        # Yeni istek gönderilmez, süren istekler bitince crawl() sonlanır
+        self._stop.set()
+
+    def _discover(self):
+        # robots.txt kuralları ve crawl-delay okunur, sitemap'teki tüm URL'ler tek seferde kuyruğa eklenir
+        if self.use_robots:
+            host = urlparse(self.start_url).netloc
+            self.limiter.acquire(host)
+            try:
+                self.robots = discovery.load_robots(self.start_url, self.session)
+            finally:
+                self.limiter.release(host)
+            delay = discovery.crawl_delay(self.robots)
+            if delay is not None:
+                self.limiter.delay = max(self.limiter.delay, delay)
+        if not self.use_sitemap:
+            return
+        locations = discovery.sitemap_locations(self.start_url, self.robots)
+        for loc, lastmod in discovery.iter_sitemap_urls(locations, self.session, limiter=self.limiter):
+            url = normalize_link(self.start_url, loc, self.domain, self.allowed_params)
+            if not url:
+                continue
+            if lastmod is not None:
+                self.lastmod[url] = lastmod
+            # Sitemap URL'leri başlangıç sayfasından bağlantı verilmiş gibi 1. seviyeden başlar
+            if self._push(url, min(1, self.depth)):
+                self.stats['sitemap_urls'] += 1
+
+    def _push(self, url, level, parent=None):
+        # Zaten görülen linkler için puan hesaplanmaz; puanlama bilgisi yalnızca kuyruğa giren URL'ler için tutulur
+        if self.scheduler is None or url in self.frontier:
+            return self.frontier.push(url, level)
+        info = self.scheduler.describe(url, parent)
+        if not self.frontier.push(url, level, self.scheduler.score(info, level)):
+            return False
+        self.scheduler.link_found(url, info)
+        return True
+
+    def _push_links(self, page, level, parent):
+        if level < self.depth:
+            for link in page['links']:
+                self._push(link, level + 1, parent)
+        elif not self.truncated and any(link not in self.frontier for link in page['links']):
+            self.truncated = True
+
+    def record_result(self, url, useful):
+        # Sayfa işlendikten sonra içerik çıkıp çıkmadığı bildirilir; 'adaptive' sıralama buna göre öğrenir
+        if self.scheduler is not None:
+            self.scheduler.record(url, useful)
+
+    def _is_allowed(self, url):
+        return self.robots is None or self.robots.can_fetch(discovery.USER_AGENT, url)
+
+    def _unchanged_page(self, url):
+        # lastmod, manifest'teki son kayıttan eskiyse sayfa hiç indirilmeden manifest'ten döndürülür
+        lastmod = self.lastmod.get(url)
+        if lastmod is None or self.manifest is None or self.opts_hash is None:
+            return None
+        entry = self.manifest.get(url)
+        if (entry is None or entry['updated'] is None or lastmod > entry['updated']
+                or entry['opts_hash'] != self.opts_hash or entry['simhash'] is None
+                or (entry['has_content'] and not entry['has_document'])):
+            return None
+        return {'url': url, 'final_url': url, 'html': None, 'body_hash': entry['body_hash'], 'headers': {},
+                'parser': self.parser, 'soup': None, 'links': set(entry['links'] or []), 'timing': None,
+                'from_cache': True}
+
+    def _fetch(self, url):
+        host = urlparse(url).netloc
+        self.limiter.acquire(host)
+        try:
+            return fetch_and_parse(url, self.domain, self.session, self.manifest, self.parser, self.link_parser,
+                                   self.allowed_params)
+        finally:
+            self.limiter.release(host)
+
+    def crawl(self):
+        # Sayfalar indirildikçe (url, page) olarak döner; page başarısız isteklerde None'dır
+        to_visit = self.frontier
+        self._push(self.start_url, 0)
+        self._discover()
+        in_flight = {}
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            while (to_visit or in_flight) and not self._stop.is_set():
+                if self.scheduler is not None and self.scheduler.needs_refresh():
+                    to_visit.reprioritize(self.scheduler.priority)
+                while to_visit and not self._stop.is_set() and len(in_flight) < self.concurrency and len(self.visited) < self.max_pages:
+                    current_url, level = to_visit.pop()
+                    if not self._is_allowed(current_url):
+                        self.stats['robots_blocked'] += 1
+                        self.unfetched.add(current_url)
+                        if self.scheduler is not None:
+                            self.scheduler.forget(current_url)
+                        continue
+                    self.visited.add(current_url)
+                    page = self._unchanged_page(current_url)
+                    if page:
+                        self.stats['lastmod_skipped'] += 1
+                        self.found += 1
+                        self._push_links(page, level, current_url)
+                        yield current_url, page
+                        continue
+                    in_flight[pool.submit(self._fetch, current_url)] = (current_url, level)
+
+                if not in_flight:
+                    break
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    current_url, level = in_flight.pop(future)
+                    page = future.result()
+                    if page:
+                        self.found += 1
+                        self._push_links(page, level, current_url)
+                    else:
+                        self.unfetched.add(current_url)
+                        self.record_result(current_url, False)
+                    yield current_url, page
+        # Kuyruk tamamen boşaldıysa ve hiçbir link derinlik sınırı yüzünden bırakılmadıysa sitenin tamamı görülmüştür
+        self.complete = not self._stop.is_set() and not to_visit and not self.truncated
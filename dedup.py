@@ -0,0 +1,150 @@
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+from collections import Counter
+from scraper import item_text
+
+SIMHASH_BITS = 64
+SHINGLE_SIZE = 3
+_WORD = re.compile(r'\w+', re.UNICODE)
+
+# BIT_TABLES[bit]: bayt değerini o bit 1 ise 1'e, değilse 0'a çeviren bytes.translate tablosu
+BIT_TABLES = [bytes(value >> bit & 1 for value in range(256)) for bit in range(8)]
+
+def simhash(content, shingle_size=SHINGLE_SIZE):
+    # İçerik listesindeki tüm metnin kelime shingle'larından 64 bitlik SimHash parmak izi.
+    # Bit toplamları özellik başına 64 adımlık Python döngüsüyle değil, tüm özetlerin tek bir bayt dizisinde
+    # birleştirilip her bayt konumu ve bit için C düzeyinde (translate + count) sayılmasıyla bulunur.
+    words = _WORD.findall(' '.join(item_text(item) for item in content).lower())
+    if len(words) < shingle_size:
+        counts = Counter([' '.join(words)] if words else [])
+    else:
+        counts = Counter(map(' '.join, zip(*(words[i:] for i in range(shingle_size)))))
+    # Ağırlık, özetin o kadar tekrarlanmasıyla uygulanır
+    blake2b = hashlib.blake2b
+    digests = b''.join(blake2b(feature.encode(), digest_size=8).digest() * weight
+                       for feature, weight in counts.items())
+    total = len(digests) // 8
+    value = 0
+    # Özet büyük uçlu okunur: i. bayt parmak izinin (7 - i) * 8. bitinden başlar
+    for i in range(8):
+        column = digests[i::8]
+        shift = (7 - i) * 8
+        for bit, table in enumerate(BIT_TABLES):
+            if 2 * column.translate(table).count(1) > total:
+                value |= 1 << (shift + bit)
+    return value
+
+def hamming(a, b):
+    return bin(a ^ b).count('1')
+
+def max_distance(threshold):
+    # Benzerlik eşiğini (0-1) izin verilen en fazla farklı bit sayısına çevirir
+    return max(0, min(SIMHASH_BITS - 1, round((1 - threshold) * SIMHASH_BITS)))
+
+def to_signed(value):
+    # SQLite INTEGER işaretli 64 bittir
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+def to_unsigned(value):
+    return value + (1 << 64) if value < 0 else value
+
+class DuplicateIndex:
+    # Birebir (hash_content) ve yakın (SimHash) kopya dizini. Parmak izleri k+1 banda bölünür;
+    # en fazla k bit farklı iki parmak izi en az bir bantta aynıdır (güvercin yuvası), bu yüzden
+    # yalnızca aynı bant kovasındaki adaylar karşılaştırılır. threshold 1.0 ise SimHash büyük/küçük harf ve
+    # noktalama farklarını görmediğinden yalnızca birebir eşleşme kullanılır.
+    def __init__(self, threshold=0.95, path=None):
+        self.threshold = threshold
+        self.near = threshold < 1.0
+        self.distance = max_distance(threshold)
+        bands = self.distance + 1
+        width = SIMHASH_BITS // bands
+        self._bands = [(i * width, SIMHASH_BITS if i == bands - 1 else (i + 1) * width) for i in range(bands)]
+        self._buckets = [{} for _ in self._bands]
+        self._exact = {}
+        self._entries = {}
+        self._lock = threading.Lock()
+        self._db = None
+        if path:
+            folder = os.path.dirname(path)
+            if folder:
+                os.makedirs(folder, exist_ok=True)
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS fingerprints (url TEXT PRIMARY KEY, exact TEXT, simhash INTEGER)")
+            self._db.commit()
+            for url, exact, value in self._db.execute("SELECT url, exact, simhash FROM fingerprints"):
+                self._index(url, exact, to_unsigned(value))
+        self.stats = {'exact': 0, 'near': 0, 'unique': 0}
+
+    def _band_keys(self, value):
+        return [(value >> start) & ((1 << (end - start)) - 1) for start, end in self._bands]
+
+    def _index(self, url, exact, value):
+        self._entries[url] = (exact, value)
+        self._exact.setdefault(exact, url)
+        for bucket, key in zip(self._buckets, self._band_keys(value)):
+            bucket.setdefault(key, []).append(url)
+
+    def find(self, url, exact, value):
+        # url dışındaki bir sayfayla birebir ya da eşik içinde benzer ise o sayfanın URL'sini döndürür
+        with self._lock:
+            match = self._exact.get(exact)
+            if match is not None and match != url:
+                self.stats['exact'] += 1
+                return match
+            if not self.near:
+                self.stats['unique'] += 1
+                return None
+            checked = set()
+            for bucket, key in zip(self._buckets, self._band_keys(value)):
+                for candidate in bucket.get(key, ()):
+                    if candidate == url or candidate in checked:
+                        continue
+                    checked.add(candidate)
+                    entry = self._entries.get(candidate)
+                    if entry is not None and hamming(entry[1], value) <= self.distance:
+                        self.stats['near'] += 1
+                        return candidate
+            self.stats['unique'] += 1
+            return None
+
+    def add(self, url, exact, value):
+        with self._lock:
+            if url in self._entries:
+                self._remove(url)
+            self._index(url, exact, value)
+            if self._db is not None:
+                self._db.execute("INSERT OR REPLACE INTO fingerprints VALUES (?, ?, ?)", (url, exact, to_signed(value)))
+                self._db.commit()
+
+    def remove(self, urls):
+        # Kaldırılan sayfaların parmak izleri dizinden ve kalıcı tablodan silinir
+        with self._lock:
+            urls = [url for url in urls if url in self._entries]
+            for url in urls:
+                self._remove(url)
+            if self._db is not None and urls:
+                self._db.executemany("DELETE FROM fingerprints WHERE url = ?", [(url,) for url in urls])
+                self._db.commit()
+
+    def _remove(self, url):
+        exact, value = self._entries.pop(url)
+        if self._exact.get(exact) == url:
+            del self._exact[exact]
+        for bucket, key in zip(self._buckets, self._band_keys(value)):
+            urls = bucket.get(key)
+            if urls and url in urls:
+                urls.remove(url)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def close(self):
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
@@ -0,0 +1,141 @@
+import zlib
+import xml.etree.ElementTree as ET
+from datetime import datetime, timezone
+from urllib.parse import urljoin, urlparse
+from urllib.robotparser import RobotFileParser
+import requests
+from scraper import HEADERS, ResponseRejected
+
+USER_AGENT = HEADERS['User-Agent']
+MAX_SITEMAP_URLS = 100000
+MAX_SITEMAPS = 500
+# RFC 9309 en az 500 KiB okunmasını ister
+ROBOTS_MAX_BYTES = 500 * 1024
+
+def disallow_all():
+    robots = RobotFileParser()
+    robots.disallow_all = True
+    return robots
+
+def load_robots(start_url, session):
+    # RFC 9309: robots.txt 4xx ile yanıtlanırsa (404, 401, 403...) None döner ve her şeye izin verilir;
+    # 5xx ya da ağ hatası durumunda site geçici olarak tamamen yasaklı sayılır. Dosya oturumun max_bytes
+    # sınırından bağımsız olarak ROBOTS_MAX_BYTES'a kadar okunur; daha büyükse okunan kısım (yarım kalan son
+    # satır hariç) kullanılır.
+    chunks = session.stream(urljoin(start_url, '/robots.txt'), max_bytes=0)
+    data = b''
+    try:
+        for chunk in chunks:
+            data += chunk
+            if len(data) > ROBOTS_MAX_BYTES:
+                data = data[:ROBOTS_MAX_BYTES].rsplit(b'\n', 1)[0]
+                break
+    except requests.HTTPError as e:
+        if 400 <= e.response.status_code < 500:
+            return None
+        return disallow_all()
+    except requests.RequestException:
+        return disallow_all()
+    finally:
+        chunks.close()
+    robots = RobotFileParser()
+    robots.parse(data.decode('utf-8', errors='replace').splitlines())
+    return robots
+
+def crawl_delay(robots):
+    if robots is None:
+        return None
+    delay = robots.crawl_delay(USER_AGENT)
+    return float(delay) if delay is not None else None
+
+def sitemap_locations(start_url, robots=None):
+    if robots is not None and robots.site_maps():
+        return robots.site_maps()
+    return [urljoin(start_url, '/sitemap.xml')]
+
+def parse_lastmod(value):
+    # W3C tarih biçimini (2024-05-01, 2024-05-01T10:00:00+03:00, ...Z) UTC zaman damgasına çevirir
+    if not value:
+        return None
+    value = value.strip()
+    if value.endswith('Z'):
+        value = value[:-1] + '+00:00'
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+def _local(tag):
+    return tag.rsplit('}', 1)[-1]
+
+def _stream_entries(chunks, max_bytes=None):
+    # Sitemap'i parça parça okur (gzip dahil) ve her <url>/<sitemap> kaydını bitince döndürür. Açılmış
+    # gzip içeriği de max_bytes ile sınırlıdır; aşılırsa ResponseRejected fırlatılır.
+    parser = ET.XMLPullParser(events=('end',))
+    decompressor = None
+    first = True
+    size = 0
+    for chunk in chunks:
+        if first:
+            first = False
+            if chunk[:2] == b'\x1f\x8b':
+                decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        if decompressor is not None:
+            # Tek parçanın bile sınırın çok üstüne açılmaması için çıktı boyutu sınırlanır
+            chunk = decompressor.decompress(chunk, max_bytes - size + 1) if max_bytes else decompressor.decompress(chunk)
+        size += len(chunk)
+        if max_bytes and size > max_bytes:
+            raise ResponseRejected(f"açılmış sitemap {max_bytes} baytı aşıyor")
+        parser.feed(chunk)
+        yield from _read_entries(parser)
+    parser.close()
+    yield from _read_entries(parser)
+
+def _read_entries(parser):
+    for _, elem in parser.read_events():
+        kind = _local(elem.tag)
+        if kind not in ('url', 'sitemap'):
+            continue
+        loc = None
+        lastmod = None
+        for child in elem:
+            name = _local(child.tag)
+            if name == 'loc' and child.text:
+                loc = child.text.strip()
+            elif name == 'lastmod':
+                lastmod = parse_lastmod(child.text)
+        elem.clear()
+        if loc:
+            yield kind, loc, lastmod
+
+def iter_sitemap_urls(sitemap_urls, session, max_urls=MAX_SITEMAP_URLS, limiter=None):
+    # Sitemap ve sitemap index dosyalarını akış halinde okuyup (url, lastmod) döndürür.
+    # limiter (crawler.HostLimiter) verilirse her sitemap isteği host sınırlarına ve gecikmesine uyar.
+    pending = list(sitemap_urls)
+    seen = set()
+    count = 0
+    while pending and len(seen) < MAX_SITEMAPS:
+        sitemap_url = pending.pop(0)
+        if sitemap_url in seen:
+            continue
+        seen.add(sitemap_url)
+        host = urlparse(sitemap_url).netloc
+        if limiter is not None:
+            limiter.acquire(host)
+        try:
+            for kind, loc, lastmod in _stream_entries(session.stream(sitemap_url), session.max_bytes):
+                if kind == 'sitemap':
+                    pending.append(loc)
+                    continue
+                yield loc, lastmod
+                count += 1
+                if count >= max_urls:
+                    return
+        except (requests.RequestException, ET.ParseError, zlib.error):
+            continue
+        finally:
+            if limiter is not None:
+                limiter.release(host)
@@ -1,43 +1,158 @@
+import re
+import threading
+import zipfile
 from docx import Document
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
 from docx.shared import Pt
+from docx.text.paragraph import Paragraph
 from io import BytesIO
 
-def create_document_bytes(content):
+TITLE_SIZE = Pt(14)
+TEXT_SIZE = Pt(12)
+# Bu sayıdan fazla paragraf içeren sayfalar python-docx nesneleri yerine doğrudan XML olarak yazılır
+DIRECT_XML_THRESHOLD = 500
+
+SECT_PR = qn('w:sectPr')
+# XML 1.0'da geçersiz kontrol karakterleri (lxml bunları kabul etmez)
+INVALID_XML_CHARS = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]')
+RUN_CONTROL = re.compile('(\t|[\r\n])')
+
+def styled_document():
+    # Yazı boyutları ve kalınlık her run yerine stillerde tanımlanır
     doc = Document()
-    title = content[0]['text']
-    h0 = doc.add_heading(title, level=0)
-    h0.runs[0].font.size = Pt(14)
-    
+    styles = doc.styles
+    styles['Normal'].font.size = TEXT_SIZE
+    styles['List Bullet'].font.size = TEXT_SIZE
+    styles['Title'].font.size = TITLE_SIZE
+    for lvl in range(1, 10):
+        heading = styles[f'Heading {lvl}']
+        heading.font.size = TITLE_SIZE
+        heading.font.bold = True
+    return doc
+
+_local = threading.local()
+
+def _base_document():
+    # Stilli şablon iş parçacığı başına bir kez yüklenir; her sayfada gövdesi boşaltılıp yeniden kullanılır
+    doc = getattr(_local, 'doc', None)
+    if doc is None:
+        doc = _local.doc = styled_document()
+    body = doc.element.body
+    for child in list(body):
+        if child.tag != SECT_PR:
+            body.remove(child)
+    return doc
+
+def _template_parts():
+    # Doğrudan XML yazımı için şablonun zip içeriği ve document.xml'in gövde öncesi/sonrası
+    parts = getattr(_local, 'parts', None)
+    if parts is None:
+        buffer = BytesIO()
+        styled_document().save(buffer)
+        with zipfile.ZipFile(buffer) as z:
+            entries = [(info, z.read(info)) for info in z.infolist()]
+        document_xml = next(data for info, data in entries if info.filename == 'word/document.xml').decode('utf-8')
+        body_start = document_xml.index('>', document_xml.index('<w:body')) + 1
+        body_end = document_xml.index('<w:sectPr', body_start)
+        parts = _local.parts = (entries, document_xml[:body_start], document_xml[body_end:])
+    return parts
+
+def _runs(item):
+    # Aynı kalınlıktaki ardışık parçalar tek run'da birleştirilir (Word'de metin aynen bitişik görünür)
+    if isinstance(item, str):
+        return [(item, False)]
+    if 'parts' not in item:
+        return [(item['text'], False)]
+    runs = []
+    for part in item['parts']:
+        bold = bool(part['bold'])
+        if runs and runs[-1][1] == bold:
+            runs[-1] = (runs[-1][0] + part['text'], bold)
+        else:
+            runs.append((part['text'], bold))
+    return runs
+
+def _blocks(content):
+    # İçerik listesini (paragraf stili, run'lar) sırasına çevirir; stil None ise varsayılan (Normal)
+    yield 'Title', [(content[0]['text'], False)]
     for item in content[1:]:
         if item['type'] == 'header':
-            h = doc.add_heading(level=item['level'])
-            run = h.add_run(item['text'])
-            run.bold = True
-            run.font.size = Pt(14)
+            yield f"Heading{item['level']}", [(item['text'], False)]
         elif item['type'] == 'paragraph':
-            p = doc.add_paragraph()
-            if 'parts' in item:
-                for part in item['parts']:
-                    run = p.add_run(part['text'])
-                    if part['bold']:
-                        run.bold = True
-                    run.font.size = Pt(12)
-            else:
-                run = p.add_run(item['text'])
-                run.font.size = Pt(12)
+            yield None, _runs(item)
         elif item['type'] == 'list':
             for li in item['items']:
-                p = doc.add_paragraph(style='List Bullet')
-                if 'parts' in li:
-                    for part in li['parts']:
-                        run = p.add_run(part['text'])
-                        if part['bold']:
-                            run.bold = True
-                        run.font.size = Pt(12)
-                else:
-                    run = p.add_run(li)
-                    run.font.size = Pt(12)
-    
+                yield 'ListBullet', _runs(li)
+
+def add_content(doc, content):
+    # İçerik listesini (process_content çıktısı) verilen belgenin sonuna ekler. Paragraflar sectPr'ın önüne
+    # doğrudan eklenir; python-docx'in her eklemede gövdeyi taraması ve stil adı çözümlemesi atlanır.
+    body = doc.element.body
+    sect = body.find(SECT_PR)
+    for style_id, runs in _blocks(content):
+        p = OxmlElement('w:p')
+        if sect is not None:
+            sect.addprevious(p)
+        else:
+            body.append(p)
+        if style_id is not None:
+            p.get_or_add_pPr().style = style_id
+        paragraph = Paragraph(p, doc._body)
+        for text, bold in runs:
+            run = paragraph.add_run(INVALID_XML_CHARS.sub('', text))
+            if bold:
+                run.bold = True
+
+def _run_xml(text, bold):
+    out = ['<w:r>']
+    if bold:
+        out.append('<w:rPr><w:b/></w:rPr>')
+    for piece in RUN_CONTROL.split(INVALID_XML_CHARS.sub('', text)):
+        if piece == '\t':
+            out.append('<w:tab/>')
+        elif piece in ('\r', '\n'):
+            out.append('<w:br/>')
+        elif piece:
+            out.append(f'<w:t xml:space="preserve">{escape_xml(piece)}</w:t>')
+    out.append('</w:r>')
+    return ''.join(out)
+
+def escape_xml(text):
+    return text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+
+def create_document_xml_bytes(content):
+    # Büyük sayfalar için: gövde XML'i metin olarak üretilir, şablonun diğer parçaları olduğu gibi kopyalanır
+    entries, head, tail = _template_parts()
+    body = []
+    for style_id, runs in _blocks(content):
+        body.append('<w:p>')
+        if style_id is not None:
+            body.append(f'<w:pPr><w:pStyle w:val="{style_id}"/></w:pPr>')
+        body.extend(_run_xml(text, bold) for text, bold in runs)
+        body.append('</w:p>')
+    document_xml = (head + ''.join(body) + tail).encode('utf-8')
+
+    doc_io = BytesIO()
+    with zipfile.ZipFile(doc_io, 'w', zipfile.ZIP_DEFLATED) as z:
+        for info, data in entries:
+            z.writestr(info, document_xml if info.filename == 'word/document.xml' else data)
+    doc_io.seek(0)
+    return doc_io
+
+def count_paragraphs(content):
+    return sum(len(item['items']) if item['type'] == 'list' else 1 for item in content)
+
+def create_document_bytes(content, direct_xml=None):
+    # direct_xml: None ise paragraf sayısına göre seçilir, True/False ile zorlanabilir
+    if direct_xml is None:
+        direct_xml = count_paragraphs(content) > DIRECT_XML_THRESHOLD
+    if direct_xml:
+        return create_document_xml_bytes(content)
+
+    doc = _base_document()
+    add_content(doc, content)
+
     doc_io = BytesIO()
     doc.save(doc_io)
     doc_io.seek(0)
@@ -0,0 +1,96 @@
+import hashlib
+import heapq
+import math
+import sys
+from collections import deque
+from scraper import url_key
+
+class BloomFilter:
+    # Çok büyük taramalar için sabit bellekli "görüldü" kümesi; yanlış pozitif oranı error_rate ile sınırlıdır
+    def __init__(self, capacity=1000000, error_rate=0.001):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item):
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'big')
+        h2 = int.from_bytes(digest[8:], 'big') | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hash_count)]
+
+    def __contains__(self, item):
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+    def add(self, item):
+        for pos in self._positions(item):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __len__(self):
+        return self.count
+
+    def memory_bytes(self):
+        return len(self.bits)
+
+class Frontier:
+    # Tarama sırası: 'fifo' (deque, BFS) ya da 'priority' (küçük öncelik önce). URL'ler kuyruğa eklenirken
+    # tekilleştirilir; görülen URL'ler (scraper.url_key ile) set ya da Bloom filtresinde tutulur.
+    # Kuyrukta URL'nin linkteki biçimi saklanır.
+    def __init__(self, ordering='fifo', compact=False, capacity=1000000, error_rate=0.001):
+        self.ordering = ordering
+        self.compact = compact
+        self.seen = BloomFilter(capacity, error_rate) if compact else set()
+        self._queue = [] if ordering == 'priority' else deque()
+        self._counter = 0
+        self.stats = {'enqueued': 0, 'duplicates': 0, 'popped': 0, 'peak': 0}
+
+    def push(self, url, level, priority=None):
+        key = url_key(url)
+        if key in self.seen:
+            self.stats['duplicates'] += 1
+            return False
+        self.seen.add(key)
+        if self.ordering == 'priority':
+            heapq.heappush(self._queue, (level if priority is None else priority, self._counter, url, level))
+            self._counter += 1
+        else:
+            self._queue.append((url, level))
+        self.stats['enqueued'] += 1
+        self.stats['peak'] = max(self.stats['peak'], len(self._queue))
+        return True
+
+    def pop(self):
+        self.stats['popped'] += 1
+        if self.ordering == 'priority':
+            _, _, url, level = heapq.heappop(self._queue)
+            return url, level
+        return self._queue.popleft()
+
+    def __contains__(self, url):
+        return url_key(url) in self.seen
+
+    def reprioritize(self, priority):
+        # 'priority' sıralamasında bekleyen URL'lerin önceliği priority(url, level) ile yeniden hesaplanır;
+        # eşit önceliklerde ekleme sırası korunur
+        if self.ordering != 'priority':
+            return
+        self._queue = [(priority(url, level), counter, url, level) for _, counter, url, level in self._queue]
+        heapq.heapify(self._queue)
+
+    def __len__(self):
+        return len(self._queue)
+
+    def __bool__(self):
+        return bool(self._queue)
+
+    def memory_bytes(self):
+        # Kuyruk ve görülen kümesinin yaklaşık bellek kullanımı
+        queue_bytes = sys.getsizeof(self._queue) + sum(sys.getsizeof(entry[-2]) for entry in self._queue)
+        if self.compact:
+            seen_bytes = self.seen.memory_bytes()
+        else:
+            seen_bytes = sys.getsizeof(self.seen) + sum(sys.getsizeof(url) for url in self.seen)
+        return {'queue': queue_bytes, 'seen': seen_bytes}
@@ -0,0 +1,110 @@
+import os
+import sqlite3
+import threading
+import time
+
+class ResponseCache:
+    # ETag / Last-Modified ile koşullu yeniden doğrulama yapan, boyut sınırlı (LRU) SQLite yanıt önbelleği
+    def __init__(self, path, max_bytes=200 * 1024 * 1024):
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                url TEXT PRIMARY KEY,
+                final_url TEXT,
+                etag TEXT,
+                last_modified TEXT,
+                content_type TEXT,
+                encoding TEXT,
+                body BLOB,
+                size INTEGER,
+                last_access REAL
+            )
+        """)
+        self._db.execute("CREATE INDEX IF NOT EXISTS responses_last_access ON responses(last_access)")
+        self._db.commit()
+        self._total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        self.stats = {'hits': 0, 'misses': 0, 'stores': 0, 'evictions': 0, 'bytes_saved': 0}
+
+    def conditional_headers(self, url):
+        with self._lock:
+            row = self._db.execute("SELECT etag, last_modified FROM responses WHERE url = ?", (url,)).fetchone()
+        if row is None:
+            return {}
+        headers = {}
+        if row[0]:
+            headers['If-None-Match'] = row[0]
+        if row[1]:
+            headers['If-Modified-Since'] = row[1]
+        return headers
+
+    def get(self, url):
+        with self._lock:
+            row = self._db.execute(
+                "SELECT final_url, etag, last_modified, content_type, encoding, body FROM responses WHERE url = ?",
+                (url,)).fetchone()
+            if row is None:
+                return None
+            self._db.execute("UPDATE responses SET last_access = ? WHERE url = ?", (time.time(), url))
+            self._db.commit()
+        return {
+            'final_url': row[0],
+            'etag': row[1],
+            'last_modified': row[2],
+            'content_type': row[3],
+            'encoding': row[4],
+            'body': row[5],
+        }
+
+    def put(self, url, response):
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return
+        body = response.content
+        size = len(body)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._db.execute("SELECT size FROM responses WHERE url = ?", (url,)).fetchone()
+            if old:
+                self._total -= old[0]
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (url, response.url, etag, last_modified, response.headers.get('Content-Type'),
+                 response.encoding, body, size, time.time()))
+            self._total += size
+            self.stats['stores'] += 1
+            self._evict()
+            self._db.commit()
+
+    def _evict(self):
+        while self._total > self.max_bytes:
+            row = self._db.execute("SELECT url, size FROM responses ORDER BY last_access LIMIT 1").fetchone()
+            if row is None:
+                self._total = 0
+                break
+            self._db.execute("DELETE FROM responses WHERE url = ?", (row[0],))
+            self._total -= row[1]
+            self.stats['evictions'] += 1
+
+    def record_hit(self, size):
+        with self._lock:
+            self.stats['hits'] += 1
+            self.stats['bytes_saved'] += size
+
+    def record_miss(self):
+        with self._lock:
+            self.stats['misses'] += 1
+
+    def size(self):
+        return self._total
+
+    def close(self):
+        with self._lock:
+            self._db.close()
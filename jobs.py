@@ -0,0 +1,156 @@
+import os
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from crawl_job import DirectoryOutput, ZipOutput
+
+# İş durumları: queued -> running -> done | failed | cancelled
+FINISHED_STATES = ('done', 'failed', 'cancelled')
+# Arşiv ya da tek dosyalık çıktı bu boyuta kadar bellekte tutulur, aşılınca iş klasöründe geçici dosyaya taşınır
+EXPORT_SPOOL_BYTES = 32 * 1024 * 1024
+
+class BackgroundJob:
+    def __init__(self, crawl_job, out_dir, archive=False, with_manifest=False, recent_size=5):
+        self.id = uuid.uuid4().hex[:12]
+        self.crawl_job = crawl_job
+        self.out_dir = out_dir
+        self.archive_mode = archive
+        self.with_manifest = with_manifest
+        self.export = None
+        self._export_lock = threading.Lock()
+        self.state = 'queued'
+        self.error = None
+        self.created = time.time()
+        self.started = None
+        self.finished = None
+        self.results = []
+        self.recent = deque(maxlen=recent_size)
+        self.future = None
+
+    @property
+    def stats(self):
+        return self.crawl_job.stats
+
+    @property
+    def is_finished(self):
+        return self.state in FINISHED_STATES
+
+    def progress(self):
+        total = self.crawl_job.total
+        if self.is_finished or not total:
+            return 1.0
+        return min(1.0, self.crawl_job.visited / total)
+
+    def open_output(self):
+        # (output, stream) döner. Arşiv modunda belgeler tek tek saklanmaz, üretildikçe tek bir zip'e eklenir;
+        # .docx dışındaki biçimler doğrudan tek dosyaya yazılır.
+        os.makedirs(self.out_dir, exist_ok=True)
+        if not self.crawl_job.renders_docx:
+            self.export = tempfile.SpooledTemporaryFile(max_size=EXPORT_SPOOL_BYTES, dir=self.out_dir)
+            return None, self.export
+        if self.archive_mode:
+            self.export = tempfile.SpooledTemporaryFile(max_size=EXPORT_SPOOL_BYTES, dir=self.out_dir)
+            return ZipOutput(self.export, self.with_manifest), None
+        return DirectoryOutput(self.out_dir, self.with_manifest), None
+
+    def export_bytes(self):
+        with self._export_lock:
+            self.export.seek(0)
+            return self.export.read()
+
+    def close(self):
+        if self.export is not None:
+            self.export.close()
+
+    def document_path(self, filename):
+        return os.path.join(self.out_dir, filename)
+
+    def read_document(self, filename):
+        with open(self.document_path(filename), 'rb') as f:
+            return f.read()
+
+class JobRunner:
+    # Kazıma işlerini Streamlit betiğinden bağımsız iş parçacıklarında yürütür. Aynı anda en fazla
+    # max_jobs iş çalışır, fazlası kuyrukta bekler. Sonuç dosyaları results_dir/<iş id> altında tutulur,
+    # böylece sayfa yeniden çalıştığında (rerun) ya da başka bir oturumdan erişildiğinde kaybolmaz.
+    def __init__(self, results_dir, max_jobs=2, max_history=20):
+        self.results_dir = results_dir
+        self.max_history = max_history
+        self._pool = ThreadPoolExecutor(max_workers=max(1, max_jobs), thread_name_prefix='kazima-job')
+        self._lock = threading.Lock()
+        self._jobs = {}
+
+    def submit(self, crawl_job, archive=False, with_manifest=False):
+        job = None
+        while job is None or job.id in self._jobs:
+            job = BackgroundJob(crawl_job, None, archive, with_manifest)
+        job.out_dir = os.path.join(self.results_dir, job.id)
+        with self._lock:
+            self._jobs[job.id] = job
+            self._prune()
+        job.future = self._pool.submit(self._run, job)
+        return job
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def jobs(self):
+        with self._lock:
+            return sorted(self._jobs.values(), key=lambda job: job.created, reverse=True)
+
+    def running(self):
+        return sum(1 for job in self.jobs() if job.state == 'running')
+
+    def queued(self):
+        return sum(1 for job in self.jobs() if job.state == 'queued')
+
+    def cancel(self, job_id):
+        job = self.get(job_id)
+        if job is None or job.is_finished:
+            return False
+        job.crawl_job.cancel()
+        # Henüz başlamamış iş kuyruktan çıkarılır
+        if job.future is not None and job.future.cancel():
+            job.state = 'cancelled'
+            job.finished = time.time()
+        return True
+
+    def _run(self, job):
+        job.state = 'running'
+        job.started = time.time()
+        output, stream = job.open_output()
+        state = 'failed'
+        try:
+            for res in job.crawl_job.run(output, stream):
+                record = {'url': res['url'], 'status': res['status'], 'change': res['change'],
+                          'duplicate_of': res['duplicate_of'], 'filename': res['filename']}
+                job.results.append(record)
+                job.recent.append(record)
+            state = 'cancelled' if job.crawl_job.cancelled else 'done'
+        except Exception as e:
+            job.error = str(e)
+        finally:
+            # Durum, arşiv kapatılıp okunabilir hale geldikten sonra güncellenir
+            if output is not None:
+                output.close()
+            job.finished = time.time()
+            job.state = state
+
+    def _prune(self):
+        # En eski biten işler ve dosyaları silinir
+        finished = sorted((job for job in self._jobs.values() if job.is_finished), key=lambda job: job.created)
+        while len(self._jobs) > self.max_history and finished:
+            job = finished.pop(0)
+            del self._jobs[job.id]
+            job.close()
+            shutil.rmtree(job.out_dir, ignore_errors=True)
+
+    def shutdown(self):
+        for job in self.jobs():
+            job.crawl_job.cancel()
+        self._pool.shutdown(wait=True)
@@ -0,0 +1,212 @@
+from scraper import NON_CONTENT_TAGS, content_tags, own_flags, link_base, normalize_link
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+# html.parser ile aynı sonucu vermek için get_text'in atladığı metinler
+_SKIPPED_TEXT_PARENTS = {'script', 'style', 'template'}
+
+def available():
+    return LexborHTMLParser is not None
+
+def parse(html):
+    if LexborHTMLParser is None:
+        raise ImportError("selectolax kurulu değil: pip install selectolax")
+    return LexborHTMLParser(html)
+
+def is_tree(tree):
+    return LexborHTMLParser is not None and isinstance(tree, LexborHTMLParser)
+
+def extract_links(tree, page_url, base_domain, allowed_params=None):
+    base = tree.css_first('base[href]')
+    page_url = link_base(page_url, base.attributes.get('href') if base is not None else None)
+    urls = set()
+    for a in tree.css('a[href]'):
+        clean = normalize_link(page_url, a.attributes.get('href') or '', base_domain, allowed_params)
+        if clean:
+            urls.add(clean)
+    return urls
+
+def _children(node):
+    return node.iter(include_text=True, skip_empty=False)
+
+def _elements(node):
+    return node.iter(include_text=False)
+
+def _text_of(node):
+    if node.is_comment_node:
+        return node.comment_content or ''
+    return node.text(deep=False) or ''
+
+def _string(node):
+    # BeautifulSoup'taki .string karşılığı: tek çocuklu elemanlarda çocuğun metni, aksi halde None
+    if not node.is_element_node:
+        return _text_of(node)
+    children = list(_children(node))
+    if len(children) != 1:
+        return None
+    return _string(children[0])
+
+def _strings(node):
+    stack = [iter(_children(node))]
+    while stack:
+        child = next(stack[-1], None)
+        if child is None:
+            stack.pop()
+            continue
+        if child.is_text_node:
+            yield child.text(deep=False) or ''
+        elif child.is_element_node and child.tag not in _SKIPPED_TEXT_PARENTS:
+            stack.append(iter(_children(child)))
+
+def _get_text(node, separator=''):
+    return separator.join(t.strip() for t in _strings(node) if t.strip())
+
+def _has_descendant(node, tag):
+    return node.css_first(tag) is not None
+
+def _iter_content_elements(body, tags, opts, skip=None, force=None, scoped=False):
+    # scraper.iter_content_elements ile aynı kurallar, lexbor ağacı üzerinde (skip/force: düğüm mem_id kümeleri)
+    tag_set = set(tags)
+    span_rule = bool(opts['span'])
+    div_rule = not opts['div']
+    filter_divs = opts.get('filter_divs', True)
+    skip = skip or ()
+    force = force or ()
+    check_profile = bool(skip or force)
+    excluded = False
+    div_ancestor = False
+    parent = body.parent
+    while parent is not None and parent.is_element_node:
+        excluded = excluded or (not scoped and parent.tag in NON_CONTENT_TAGS)
+        div_ancestor = div_ancestor or parent.tag == 'div'
+        parent = parent.parent
+    stack = [(iter(_elements(body)), (excluded, div_ancestor, False, None))]
+    while stack:
+        children, state = stack[-1]
+        node = next(children, None)
+        if node is None:
+            stack.pop()
+            continue
+        excluded, div_ancestor, wanted_chain, decision = state
+        if check_profile and node.mem_id in skip:
+            continue
+        name = node.tag
+        attrs = node.attributes
+        classes = (attrs.get('class') or '').split() if 'class' in attrs else None
+        wanted, own_decision = own_flags(classes, attrs.get('id'))
+        if check_profile and node.mem_id in force:
+            wanted, own_decision = True, True
+        if own_decision is not None:
+            decision = own_decision
+        wanted_chain = wanted_chain or wanted
+
+        if name in tag_set and not excluded:
+            if name == 'span' and span_rule:
+                accept = wanted_chain
+            elif div_rule and (name == 'div' or div_ancestor):
+                accept = filter_divs and decision is not False
+            else:
+                accept = True
+            if accept:
+                yield node
+
+        if name == 'body':
+            wanted_chain, decision = False, None
+        stack.append((iter(_elements(node)), (
+            excluded or name in NON_CONTENT_TAGS,
+            div_ancestor or name == 'div',
+            wanted_chain,
+            decision,
+        )))
+
+def _parts(node):
+    bold_parts = []
+    for content_part in _children(node):
+        if content_part.is_element_node and content_part.tag in ('b', 'strong'):
+            bold_parts.append({'text': _get_text(content_part), 'bold': True})
+        else:
+            string = _string(content_part)
+            if string and string.strip():
+                bold_parts.append({'text': string.strip(), 'bold': False})
+    return bold_parts
+
+def _ancestors(node):
+    parent = node.parent
+    while parent is not None and parent.is_element_node:
+        yield parent
+        parent = parent.parent
+
+def _profile_elements(tree, tags, opts, profile):
+    # scraper.iter_profile_elements karşılığı; seçiciler lexbor'un yerel CSS motoruyla eşleştirilir
+    selectors = profile['selectors']
+    roots = None
+    if selectors['content']:
+        matched = tree.css(selectors['content'])
+        ids = {node.mem_id for node in matched}
+        roots = [node for node in matched if not any(p.mem_id in ids for p in _ancestors(node))] or None
+    scope = roots or [tree.root]
+    skip = force = None
+    if selectors['exclude']:
+        skip = {node.mem_id for root in scope for node in root.css(selectors['exclude'])}
+    if selectors['include']:
+        force = {node.mem_id for root in scope for node in root.css(selectors['include'])}
+    if roots is None:
+        yield from _iter_content_elements(tree.body, tags, opts, skip, force)
+        return
+    for root in roots:
+        yield from _iter_content_elements(root, tags, opts, skip, force, scoped=True)
+
+def process_content(tree, opts, profile=None):
+    # scraper.process_content'in selectolax/lexbor karşılığı; aynı içerik listesini üretir
+    content = []
+    title_node = tree.css_first('title')
+    title_string = _string(title_node) if title_node is not None else None
+    title = title_string.strip() if title_string else 'Başlıksız'
+    if profile is not None and profile['selectors']['title']:
+        title_node = tree.css_first(profile['selectors']['title'])
+        title = (_get_text(title_node, ' ') if title_node is not None else '') or title
+    content.append({'type':'title','text':title})
+
+    tags, header_tags = content_tags(opts)
+
+    if profile is not None:
+        elements = _profile_elements(tree, tags, opts, profile)
+    else:
+        elements = _iter_content_elements(tree.body, tags, opts)
+    for elem in elements:
+        name = elem.tag
+        if name in header_tags:
+            text = _get_text(elem)
+            if text:
+                content.append({'type':'header','level':int(name[1]),'text':text})
+        elif name == 'p':
+            bold_parts = _parts(elem)
+            if bold_parts:
+                content.append({'type':'paragraph','parts':bold_parts})
+        elif name in ('ul','ol'):
+            items = []
+            for li in _elements(elem):
+                if li.tag != 'li' or _has_descendant(li, 'a'):
+                    continue
+                bold_parts = _parts(li)
+                if bold_parts:
+                    items.append({'parts': bold_parts})
+            if items:
+                content.append({'type':'list','items':items})
+        elif name == 'span' and opts['span']:
+            text = _get_text(elem, ' ')
+            if text:
+                content.append({'type':'paragraph','text':text})
+        elif name == 'header' and opts['headers']:
+            txt = _get_text(elem)
+            if txt:
+                content.append({'type':'paragraph','text':txt})
+        elif name == 'footer' and opts['footers']:
+            txt = _get_text(elem)
+            if txt:
+                content.append({'type':'paragraph','text':txt})
+
+    return content
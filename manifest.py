@@ -0,0 +1,97 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from urllib.parse import urlparse
+from dedup import to_signed, to_unsigned
+from scraper import url_key
+
+def options_key(opts):
+    return hashlib.md5(json.dumps(opts, sort_keys=True).encode()).hexdigest()
+
+def content_fingerprint(content):
+    # hash_content yalnızca metne bakar; değişiklik tespiti biçim dahil tüm içerik listesini kullanır
+    return hashlib.md5(json.dumps(content, sort_keys=True, ensure_ascii=False).encode()).hexdigest()
+
+class Manifest:
+    # Her URL için ham gövde özeti, seçenekler, içerik özeti, linkler ve üretilen .docx saklanır
+    def __init__(self, path):
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS pages (
+                url TEXT PRIMARY KEY,
+                body_hash TEXT,
+                opts_hash TEXT,
+                content_hash TEXT,
+                fingerprint TEXT,
+                has_content INTEGER,
+                links TEXT,
+                docx BLOB,
+                updated REAL,
+                simhash INTEGER
+            )
+        """)
+        columns = [row[1] for row in self._db.execute("PRAGMA table_info(pages)")]
+        if 'simhash' not in columns:
+            self._db.execute("ALTER TABLE pages ADD COLUMN simhash INTEGER")
+        self._db.commit()
+
+    def get(self, url):
+        with self._lock:
+            row = self._db.execute(
+                "SELECT body_hash, opts_hash, content_hash, fingerprint, has_content, links, docx IS NOT NULL, simhash, updated "
+                "FROM pages WHERE url = ?",
+                (url,)).fetchone()
+        if row is None:
+            return None
+        return {
+            'body_hash': row[0],
+            'opts_hash': row[1],
+            'content_hash': row[2],
+            'fingerprint': row[3],
+            'has_content': bool(row[4]),
+            'links': json.loads(row[5]) if row[5] is not None else None,
+            'has_document': bool(row[6]),
+            'simhash': to_unsigned(row[7]) if row[7] is not None else None,
+            'updated': row[8],
+        }
+
+    def load_document(self, url):
+        with self._lock:
+            row = self._db.execute("SELECT docx FROM pages WHERE url = ?", (url,)).fetchone()
+        if row is None or row[0] is None:
+            return None
+        return row[0]
+
+    def put(self, url, body_hash, opts_hash, content_hash, fingerprint, has_content, links=None, docx=None,
+            simhash=None):
+        links_json = json.dumps(sorted(links)) if links is not None else None
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO pages (url, body_hash, opts_hash, content_hash, fingerprint, has_content, "
+                "links, docx, updated, simhash) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (url, body_hash, opts_hash, content_hash, fingerprint, int(has_content), links_json, docx, time.time(),
+                 to_signed(simhash) if simhash is not None else None))
+            self._db.commit()
+
+    def remove_missing(self, domain, seen_urls):
+        # Bu taramada bulunamayan, aynı siteye ait eski kayıtları siler ve URL'lerini döndürür. Sondaki '/'
+        # farkı (url_key) aynı sayfa sayılır.
+        seen_keys = {url_key(u) for u in seen_urls}
+        with self._lock:
+            urls = [row[0] for row in self._db.execute("SELECT url FROM pages")]
+            removed = [u for u in urls if urlparse(u).netloc == domain and url_key(u) not in seen_keys]
+            self._db.executemany("DELETE FROM pages WHERE url = ?", [(u,) for u in removed])
+            self._db.commit()
+        return removed
+
+    def close(self):
+        with self._lock:
+            self._db.close()
@@ -0,0 +1,112 @@
+import heapq
+import json
+import threading
+
+# Ölçülen aşamalar, işlem sırasıyla
+STAGES = ('fetch', 'parse', 'links', 'process_content', 'hash_content', 'render')
+STAGE_LABELS = {
+    'fetch': "İndirme", 'parse': "HTML ayrıştırma", 'links': "Link çıkarma",
+    'process_content': "İçerik çıkarma", 'hash_content': "Hash / SimHash", 'render': "Belge oluşturma",
+}
+# Gecikme histogramı üst sınırları (saniye), Prometheus histogram kovaları gibi birikimli tutulur
+BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+def add_stage(stages, stage, seconds):
+    stages[stage] = stages.get(stage, 0.0) + seconds
+
+class StageMetrics:
+    # Sayfa sonuçlarındaki aşama sürelerini toplar: aşama başına sayı, toplam/en uzun süre, bayt ve histogram,
+    # ayrıca toplam süresi en uzun sayfalar
+    def __init__(self, slowest=10):
+        self.slowest_size = slowest
+        self._lock = threading.Lock()
+        self._stages = {stage: _empty_stage() for stage in STAGES}
+        self._slowest = []
+        self.pages = 0
+
+    def record(self, url, stages, sizes=None):
+        sizes = sizes or {}
+        total = sum(stages.values())
+        with self._lock:
+            self.pages += 1
+            for stage, seconds in stages.items():
+                s = self._stages.setdefault(stage, _empty_stage())
+                s['count'] += 1
+                s['seconds'] += seconds
+                s['max'] = max(s['max'], seconds)
+                s['bytes'] += sizes.get(stage, 0)
+                s['buckets'][_bucket(seconds)] += 1
+            item = (total, self.pages, url, dict(stages))
+            if len(self._slowest) < self.slowest_size:
+                heapq.heappush(self._slowest, item)
+            elif total > self._slowest[0][0]:
+                heapq.heapreplace(self._slowest, item)
+
+    def report(self):
+        with self._lock:
+            stages = {}
+            for stage, s in self._stages.items():
+                if not s['count']:
+                    continue
+                stages[stage] = {
+                    'count': s['count'],
+                    'seconds': s['seconds'],
+                    'mean': s['seconds'] / s['count'],
+                    'max': s['max'],
+                    'p50': _quantile(s['buckets'], s['count'], 0.5, s['max']),
+                    'p95': _quantile(s['buckets'], s['count'], 0.95, s['max']),
+                    'bytes': s['bytes'],
+                    'buckets': dict(zip([str(b) for b in BUCKETS] + ['+Inf'], _cumulative(s['buckets']))),
+                }
+            slowest = [{'url': url, 'seconds': total, 'stages': stages_}
+                       for total, _, url, stages_ in sorted(self._slowest, reverse=True)]
+            return {'pages': self.pages, 'stages': stages, 'slowest': slowest}
+
+    def to_json(self):
+        return json.dumps(self.report(), ensure_ascii=False, indent=1)
+
+    def to_prometheus(self, prefix='kazima'):
+        report = self.report()
+        lines = [
+            f"# HELP {prefix}_stage_seconds Aşama başına sayfa işleme süresi",
+            f"# TYPE {prefix}_stage_seconds histogram",
+        ]
+        for stage, s in report['stages'].items():
+            for le, count in s['buckets'].items():
+                lines.append(f'{prefix}_stage_seconds_bucket{{stage="{stage}",le="{le}"}} {count}')
+            lines.append(f'{prefix}_stage_seconds_sum{{stage="{stage}"}} {s["seconds"]:.6f}')
+            lines.append(f'{prefix}_stage_seconds_count{{stage="{stage}"}} {s["count"]}')
+        lines.append(f"# HELP {prefix}_stage_bytes_total Aşamada işlenen bayt (indirilen gövde, üretilen belge)")
+        lines.append(f"# TYPE {prefix}_stage_bytes_total counter")
+        for stage, s in report['stages'].items():
+            lines.append(f'{prefix}_stage_bytes_total{{stage="{stage}"}} {s["bytes"]}')
+        lines.append(f"# TYPE {prefix}_pages_total counter")
+        lines.append(f"{prefix}_pages_total {report['pages']}")
+        return '\n'.join(lines) + '\n'
+
+def _empty_stage():
+    return {'count': 0, 'seconds': 0.0, 'max': 0.0, 'bytes': 0, 'buckets': [0] * (len(BUCKETS) + 1)}
+
+def _bucket(seconds):
+    for i, bound in enumerate(BUCKETS):
+        if seconds <= bound:
+            return i
+    return len(BUCKETS)
+
+def _cumulative(buckets):
+    total = 0
+    out = []
+    for count in buckets:
+        total += count
+        out.append(total)
+    return out
+
+def _quantile(buckets, count, q, maximum):
+    # Histogramdan yaklaşık yüzdelik: hedef sıranın düştüğü kovanın üst sınırı (en fazla gözlenen en uzun süre)
+    target = q * count
+    seen = 0
+    for i, n in enumerate(buckets):
+        seen += n
+        if seen >= target:
+            return min(BUCKETS[i], maximum) if i < len(BUCKETS) else maximum
+    return maximum
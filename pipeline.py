@@ -0,0 +1,239 @@
+import multiprocessing
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+from scraper import get_soup, parse_html, extract_content, hash_content
+from document_processor import create_document_bytes
+from manifest import content_fingerprint
+from dedup import simhash
+from metrics import add_stage
+
+def _extract(tree, opts, stages, url=None):
+    start = time.perf_counter()
+    cont = extract_content(tree, opts, url)
+    extracted = time.perf_counter()
+    hash_val = hash_content(cont)
+    fp_simhash = simhash(cont)
+    add_stage(stages, 'process_content', extracted - start)
+    add_stage(stages, 'hash_content', time.perf_counter() - extracted)
+    return cont, hash_val, fp_simhash
+
+def extract_job(html, opts, parser='html.parser', url=None):
+    # İşlem havuzunda çalışan ilk iş: ham HTML'den içerik listesi, hash_content, SimHash ve aşama süreleri
+    stages = {}
+    start = time.perf_counter()
+    tree = parse_html(html, parser)
+    stages['parse'] = time.perf_counter() - start
+    cont, hash_val, fp_simhash = _extract(tree, opts, stages, url)
+    return cont, hash_val, fp_simhash, stages
+
+def render_job(cont):
+    # İşlem havuzunda çalışan ikinci iş: kopya olmadığı anlaşılan içerikten .docx baytları ve süresi
+    start = time.perf_counter()
+    data = create_document_bytes(cont).getvalue()
+    return data, time.perf_counter() - start
+
+def _page_url(url, page):
+    # Site profili yönlendirme sonrası adrese göre seçilir
+    return page.get('final_url') or url
+
+def _is_unchanged(entry, page, opts_hash):
+    return entry is not None and entry['opts_hash'] == opts_hash and entry['body_hash'] == page['body_hash']
+
+def _reuse_entry(entry, page, opts_hash, render):
+    # Değişmeyen sayfa manifest'ten alınabilir; .docx dışındaki biçimler içerik listesine ihtiyaç duyduğundan
+    # render=False iken sayfa yine ayrıştırılır
+    return render and _is_unchanged(entry, page, opts_hash) and entry['simhash'] is not None
+
+def prepare_page(url, page, opts, dedup, manifest=None, opts_hash=None, extracted=None, render=True):
+    # İçeriği çıkarır (ya da manifest'ten alır) ve kopya kontrolünü .docx oluşturulmadan önce yapar.
+    # extracted verilirse (extract_job sonucu) sayfa yeniden ayrıştırılmaz.
+    entry = manifest.get(url) if manifest is not None else None
+    same_opts = entry is not None and entry['opts_hash'] == opts_hash
+    stages = page.setdefault('stages', {})
+    cont = None
+    if _reuse_entry(entry, page, opts_hash, render):
+        hash_val = entry['content_hash']
+        fingerprint = entry['fingerprint']
+        fp_simhash = entry['simhash']
+        has_content = entry['has_content']
+        change = 'unchanged'
+    else:
+        if extracted is not None:
+            cont, hash_val, fp_simhash, extract_stages = extracted
+            for stage, seconds in extract_stages.items():
+                add_stage(stages, stage, seconds)
+        else:
+            cont, hash_val, fp_simhash = _extract(get_soup(page), opts, stages, _page_url(url, page))
+        fingerprint = content_fingerprint(cont) if manifest is not None else None
+        has_content = len(cont) > 1
+        if manifest is None:
+            change = None
+        elif entry is None:
+            change = 'new'
+        elif same_opts and entry['fingerprint'] == fingerprint:
+            change = 'unchanged'
+        else:
+            change = 'changed'
+
+    duplicate_of = dedup.find(url, hash_val, fp_simhash) if has_content else None
+    docx = None
+    if duplicate_of is not None:
+        status = 'duplicate'
+    elif has_content:
+        dedup.add(url, hash_val, fp_simhash)
+        status = 'success'
+        if change == 'unchanged' and entry['has_document']:
+            stored = manifest.load_document(url)
+            if stored is not None:
+                docx = BytesIO(stored)
+    else:
+        status = 'empty'
+    return {
+        'url': url, 'page': page, 'opts': opts, 'status': status, 'change': change,
+        'duplicate_of': duplicate_of, 'content': cont, 'content_hash': hash_val,
+        'fingerprint': fingerprint, 'simhash': fp_simhash, 'has_content': has_content, 'docx': docx,
+        'render': render,
+    }
+
+def needs_render(state):
+    return state['render'] and state['status'] == 'success' and state['docx'] is None
+
+def complete_page(state, manifest=None, opts_hash=None, rendered=None):
+    # Gerekiyorsa .docx'i oluşturur, manifest'i günceller ve sayfanın ham HTML'ini bırakır
+    # rendered: render_job sonucu (baytlar, süre)
+    page = state['page']
+    docx = state['docx']
+    stages = page.setdefault('stages', {})
+    sizes = page.setdefault('sizes', {})
+    if needs_render(state):
+        if rendered is not None:
+            data, seconds = rendered
+            docx = BytesIO(data)
+        else:
+            cont = state['content']
+            if cont is None:
+                cont = extract_content(get_soup(page), state['opts'], _page_url(state['url'], page))
+            start = time.perf_counter()
+            docx = create_document_bytes(cont)
+            seconds = time.perf_counter() - start
+        add_stage(stages, 'render', seconds)
+        sizes['render'] = docx.getbuffer().nbytes
+
+    if manifest is not None:
+        stored_docx = docx.getvalue() if docx is not None else None
+        manifest.put(state['url'], page['body_hash'], opts_hash, state['content_hash'], state['fingerprint'],
+                     state['has_content'], page.get('links'), stored_docx, state['simhash'])
+    page.pop('html', None)
+    page.pop('soup', None)
+    return {'url': state['url'], 'status': state['status'], 'change': state['change'],
+            'duplicate_of': state['duplicate_of'], 'content_hash': state['content_hash'], 'docx': docx,
+            'content': state['content'] if not state['render'] else None, 'stages': stages, 'sizes': sizes}
+
+def process_page(url, page, opts, dedup, manifest=None, opts_hash=None, render=True):
+    # Sayfayı içerik listesine ve .docx'e dönüştürür; artımlı modda değişmeyen sayfalar manifest'ten alınır.
+    # status: 'success' | 'duplicate' | 'empty', change: 'new' | 'changed' | 'unchanged' | None
+    # render=False iken .docx oluşturulmaz, sonuç 'content' alanında içerik listesini taşır
+    state = prepare_page(url, page, opts, dedup, manifest, opts_hash, render=render)
+    return complete_page(state, manifest, opts_hash)
+
+def buffered(iterable, maxsize=16):
+    # Kaynağı ayrı bir iş parçacığında tüketir; kuyruk dolunca üretici bekler (backpressure)
+    items = queue.Queue(maxsize=maxsize)
+    stop = threading.Event()
+
+    def put(item):
+        while not stop.is_set():
+            try:
+                items.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for item in iterable:
+                if not put(('item', item)):
+                    break
+        except Exception as e:
+            put(('error', e))
+        finally:
+            if hasattr(iterable, 'close'):
+                iterable.close()
+            put(('done', None))
+
+    worker = threading.Thread(target=produce, daemon=True)
+    worker.start()
+    try:
+        while True:
+            kind, value = items.get()
+            if kind == 'done':
+                break
+            if kind == 'error':
+                raise value
+            yield value
+    finally:
+        stop.set()
+        worker.join()
+
+def run_pipeline(pages, opts, dedup, manifest=None, opts_hash=None, queue_size=16, workers=1, render=True):
+    # (url, page) akışını sayfa geldikçe işler; ham HTML içerik çıkarıldıktan hemen sonra bırakılır
+    if workers > 1:
+        yield from _run_parallel(pages, opts, dedup, manifest, opts_hash, queue_size, workers, render)
+        return
+    for url, page in buffered(pages, queue_size):
+        if page is None:
+            continue
+        yield process_page(url, page, opts, dedup, manifest, opts_hash, render)
+
+def _run_parallel(pages, opts, dedup, manifest, opts_hash, queue_size, workers, render=True):
+    # İki aşamalı sıralı işlem havuzu: içerik çıkarma işleri paralel yürür, kopya kontrolü geliş sırasıyla
+    # ana süreçte yapılır (sıralı çalışmayla aynı sonuç), yalnızca kopya olmayan sayfalar için
+    # .docx oluşturma işi havuza gönderilir. Sonuçlar da geliş sırasıyla döner.
+    # pencere öğesi: [url, page, çıkarma işi, durum, oluşturma işi]
+    window = deque()
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+
+        def advance(block):
+            for item in window:
+                if item[3] is not None:
+                    continue
+                url, page, extract_future = item[0], item[1], item[2]
+                if extract_future is not None and not extract_future.done():
+                    if not block:
+                        return
+                    # yalnızca sıradaki ilk öğe için beklenir
+                    block = False
+                extracted = extract_future.result() if extract_future is not None else None
+                item[3] = prepare_page(url, page, opts, dedup, manifest, opts_hash, extracted, render)
+                if needs_render(item[3]):
+                    item[4] = pool.submit(render_job, item[3]['content'])
+
+        def ready(item):
+            return item[3] is not None and (item[4] is None or item[4].done())
+
+        def finish(item):
+            rendered = item[4].result() if item[4] is not None else None
+            return complete_page(item[3], manifest, opts_hash, rendered)
+
+        for url, page in buffered(pages, queue_size):
+            if page is None:
+                continue
+            entry = manifest.get(url) if manifest is not None else None
+            extract_future = None
+            if not _reuse_entry(entry, page, opts_hash, render):
+                extract_future = pool.submit(extract_job, page['html'], opts, page.get('parser', 'html.parser'),
+                                             _page_url(url, page))
+            window.append([url, page, extract_future, None, None])
+            advance(block=len(window) > workers * 2)
+            while window and (ready(window[0]) or len(window) > workers * 2):
+                advance(block=True)
+                yield finish(window.popleft())
+        while window:
+            advance(block=True)
+            yield finish(window.popleft())
@@ -0,0 +1,109 @@
+import json
+import threading
+from urllib.parse import urlparse
+import soupsieve
+
+# Site profili: bilinen sitelerde içeriğin nerede olduğunu CSS seçicileriyle tanımlar. Örnek profiles.json:
+# {
+#   "ornek.com": {
+#     "content": ["article.post-body", "main .icerik"],   içerik kapsayıcıları; yalnızca bunların altı taranır
+#     "exclude": [".ilgili-yazilar", ".paylas"],          tamamen atlanan alt ağaçlar
+#     "include": [".sss-item"],                           sınıf/id filtresine takılmadan alınan alt ağaçlar
+#     "title": "h1.entry-title"                           <title> yerine kullanılacak başlık
+#   }
+# }
+# Alan adı anahtarı alt alan adlarını da kapsar (ornek.com -> blog.ornek.com); en uzun eşleşme kullanılır.
+# Seçiciler tek bir eşleştiriciye derlenir; profil kümeleri süreç başına bir kez derlenir.
+PROFILE_RULES = ('content', 'exclude', 'include', 'title')
+_MAX_COMPILED = 16
+
+def load_profiles(path):
+    with open(path, encoding='utf-8') as f:
+        profiles = json.load(f)
+    compile_profiles(profiles)
+    return profiles
+
+def save_profiles(profiles, path):
+    compile_profiles(profiles)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(profiles, f, ensure_ascii=False, indent=2)
+
+def _selectors(domain, rule, value):
+    # Kural değeri tek bir seçici metni ya da seçici metinleri listesidir
+    if value is None:
+        return []
+    if isinstance(value, str):
+        return [value] if value else []
+    if isinstance(value, list) and all(isinstance(s, str) for s in value):
+        return value
+    raise ValueError(f"{domain}: '{rule}' seçicisi metin ya da metin listesi olmalı")
+
+def compile_profile(domain, spec):
+    # {'content': SoupSieve | None, ..., 'selectors': {kural: seçici metni}}; lexbor ağaçları seçici metnini kullanır
+    if not isinstance(spec, dict):
+        raise ValueError(f"{domain}: profil bir sözlük olmalı")
+    unknown = set(spec) - set(PROFILE_RULES)
+    if unknown:
+        raise ValueError(f"{domain}: bilinmeyen profil kuralı: {', '.join(sorted(unknown))}")
+    compiled = {'domain': domain, 'selectors': {}}
+    for rule in PROFILE_RULES:
+        selector = ', '.join(_selectors(domain, rule, spec.get(rule)))
+        compiled['selectors'][rule] = selector or None
+        try:
+            compiled[rule] = soupsieve.compile(selector) if selector else None
+        except soupsieve.SelectorSyntaxError as e:
+            raise ValueError(f"{domain}: geçersiz '{rule}' seçicisi: {e}") from e
+    return compiled
+
+def compile_profiles(profiles):
+    if profiles is None:
+        return {}
+    if not isinstance(profiles, dict):
+        raise ValueError("Site profilleri alan adı -> profil sözlüğü olmalı")
+    return {domain.lower(): compile_profile(domain, spec) for domain, spec in profiles.items()}
+
+def _host_keys(netloc):
+    # 'blog.ornek.com:8080' -> 'blog.ornek.com:8080', 'blog.ornek.com', 'ornek.com', 'com'
+    netloc = netloc.lower()
+    yield netloc
+    host = netloc.rsplit(':', 1)[0] if netloc.count(':') == 1 else netloc
+    if host.startswith('www.'):
+        host = host[4:]
+    labels = host.split('.')
+    for i in range(len(labels)):
+        yield '.'.join(labels[i:])
+
+def match_profile(profiles, url):
+    # Ham (derlenmemiş) profil sözlüğünde URL'ye uyan alan adı anahtarı; yoksa None
+    if not profiles or not url:
+        return None
+    keys = {key.lower(): key for key in profiles}
+    for candidate in _host_keys(urlparse(url).netloc):
+        if candidate in keys:
+            return keys[candidate]
+    return None
+
+def select_profiles(profiles, urls):
+    # Yalnızca kazınacak sitelere ait profiller seçeneklere eklenir; diğer sitelerin profillerinin
+    # değişmesi artımlı kazımadaki seçenek özetini etkilemez
+    keys = {match_profile(profiles, url) for url in urls}
+    return {key: profiles[key] for key in sorted(k for k in keys if k is not None)}
+
+_compiled = {}
+_compiled_lock = threading.Lock()
+
+def profile_for(profiles, url):
+    # Sayfa URL'sine uyan derlenmiş profil. Profiller seçeneklerle birlikte işlem havuzuna kopyalandığından
+    # önbellek nesne kimliğine değil içeriğine göre tutulur.
+    key = match_profile(profiles, url)
+    if key is None:
+        return None
+    cache_key = json.dumps(profiles, sort_keys=True)
+    compiled = _compiled.get(cache_key)
+    if compiled is None:
+        compiled = compile_profiles(profiles)
+        with _compiled_lock:
+            if len(_compiled) >= _MAX_COMPILED:
+                _compiled.clear()
+            _compiled[cache_key] = compiled
+    return compiled[key.lower()]
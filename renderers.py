@@ -0,0 +1,82 @@
+import json
+from docx.enum.text import WD_BREAK
+from document_processor import add_content, styled_document
+
+# Tüm sayfaları tek bir çıktıya yazan biçimler. Her yazıcı bir ikili dosya nesnesine yazar,
+# add(url, content) ile sayfa sayfa beslenir ve close() ile tamamlanır (dosyayı kapatmaz).
+
+def markdown_inline(item):
+    if isinstance(item, str):
+        return item
+    if 'parts' in item:
+        return ' '.join(f"**{part['text']}**" if part['bold'] else part['text'] for part in item['parts'])
+    return item['text']
+
+def render_markdown(url, content):
+    lines = [f"# {content[0]['text']}", '', f"<{url}>", '']
+    for item in content[1:]:
+        if item['type'] == 'header':
+            lines.append(f"{'#' * min(6, item['level'] + 1)} {item['text']}")
+        elif item['type'] == 'paragraph':
+            lines.append(markdown_inline(item))
+        elif item['type'] == 'list':
+            lines.extend(f"- {markdown_inline(li)}" for li in item['items'])
+        lines.append('')
+    return '\n'.join(lines)
+
+class MarkdownWriter:
+    # Sayfalar geldikçe yazılır, bellekte yalnızca o anki sayfa tutulur
+    def __init__(self, stream):
+        self.stream = stream
+        self.pages = 0
+
+    def add(self, url, content):
+        if self.pages:
+            self.stream.write(b'\n---\n\n')
+        self.stream.write(render_markdown(url, content).encode('utf-8'))
+        self.pages += 1
+
+    def close(self):
+        pass
+
+class JsonlWriter:
+    # Her satır bir sayfa: {"url", "title", "content"}; dizinleme araçları için
+    def __init__(self, stream):
+        self.stream = stream
+        self.pages = 0
+
+    def add(self, url, content):
+        record = {'url': url, 'title': content[0]['text'], 'content': content[1:]}
+        self.stream.write(json.dumps(record, ensure_ascii=False).encode('utf-8'))
+        self.stream.write(b'\n')
+        self.pages += 1
+
+    def close(self):
+        pass
+
+class CombinedDocxWriter:
+    # Tüm sayfalar tek belgede: şablon bir kez yüklenir, belge bir kez kaydedilir; sayfalar arasında sayfa sonu
+    def __init__(self, stream):
+        self.stream = stream
+        self.pages = 0
+        self.doc = styled_document()
+
+    def add(self, url, content):
+        if self.pages:
+            self.doc.add_paragraph().add_run().add_break(WD_BREAK.PAGE)
+        add_content(self.doc, content)
+        self.doc.add_paragraph(url)
+        self.pages += 1
+
+    def close(self):
+        self.doc.save(self.stream)
+
+RENDERERS = {
+    'combined_docx': {'writer': CombinedDocxWriter, 'extension': 'docx',
+                      'mime': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'},
+    'markdown': {'writer': MarkdownWriter, 'extension': 'md', 'mime': 'text/markdown'},
+    'jsonl': {'writer': JsonlWriter, 'extension': 'jsonl', 'mime': 'application/x-ndjson'},
+}
+
+def open_renderer(fmt, stream):
+    return RENDERERS[fmt]['writer'](stream)
@@ -0,0 +1,141 @@
+import re
+import threading
+from urllib.parse import urlparse, parse_qsl
+
+# Uyarlanabilir tarama sırası: sayfa bütçesi (max_pages) içerik çıkan sayfalara harcansın diye kuyruktaki
+# URL'ler beklenen verime göre sıralanır. Verim üç kaynaktan tahmin edilir:
+#   şablon    - aynı yol kalıbındaki (/etiket/*, /blog/*/#) sayfaların şimdiye kadarki sonucu
+#   önek      - aynı ilk yol bölümündeki (/blog, /etiket) sayfaların sonucu
+#   üst sayfa - linki veren sayfadan bulunan diğer sayfaların sonucu (liste sayfası iyi makalelere mi gidiyor?)
+# Veri yokken her tahmin URL kalıbına göre verilen ön değere eşittir; sonuç geldikçe ona doğru kayar.
+LOW_VALUE_SEGMENTS = frozenset({
+    'tag', 'tags', 'etiket', 'etiketler', 'category', 'categories', 'kategori', 'author', 'yazar', 'page', 'sayfa',
+    'search', 'arama', 'archive', 'archives', 'arsiv', 'feed', 'rss', 'login', 'giris', 'register', 'kayit',
+    'cart', 'sepet', 'account', 'hesap', 'comments', 'yorumlar', 'print', 'share', 'paylas', 'wp-json',
+})
+LOW_VALUE_PARAMS = frozenset({'page', 'p', 'sayfa', 'sort', 'order', 'orderby', 'filter', 'q', 's', 'replytocom'})
+CONTENT_SEGMENTS = frozenset({
+    'article', 'articles', 'makale', 'makaleler', 'post', 'posts', 'blog', 'news', 'haber', 'haberler',
+    'story', 'docs', 'doc', 'wiki', 'yazi', 'yazilar', 'rehber', 'guide',
+})
+NUMBER = re.compile(r'^\d+$')
+SLUG_WORDS = 3
+
+PRIOR_LOW = 0.15
+PRIOR_DEFAULT = 0.5
+PRIOR_CONTENT = 0.7
+# Ön değerin kaç gözlem ağırlığında olduğu (Beta önseli); küçük değer daha hızlı öğrenir
+PRIOR_WEIGHT = 2.0
+# Seviye başına eklenen ceza: eşit verimde sığ sayfalar önce gelir
+LEVEL_WEIGHT = 0.02
+# Bu kadar yeni sonuçtan sonra kuyruk güncel tahminlerle yeniden sıralanır
+REFRESH_EVERY = 20
+
+def path_segments(path):
+    return [s for s in path.split('/') if s]
+
+def url_prior(url):
+    # URL kalıbına göre ön verim tahmini: etiket, sayfalama, arama gibi liste sayfaları düşük,
+    # makale/haber yolları ve uzun slug'lar yüksek
+    parsed = urlparse(url)
+    segments = [s.lower() for s in path_segments(parsed.path)]
+    params = {k.lower() for k, _ in parse_qsl(parsed.query, keep_blank_values=True)}
+    if params & LOW_VALUE_PARAMS or any(s in LOW_VALUE_SEGMENTS for s in segments):
+        return PRIOR_LOW
+    if segments and NUMBER.match(segments[-1]) and all(NUMBER.match(s) for s in segments):
+        # /2024/05 gibi yalnızca tarihten oluşan arşiv yolları
+        return PRIOR_LOW
+    if any(s in CONTENT_SEGMENTS for s in segments[:-1]):
+        return PRIOR_CONTENT
+    if segments and len(segments[-1].rsplit('.', 1)[0].split('-')) >= SLUG_WORDS:
+        return PRIOR_CONTENT
+    return PRIOR_DEFAULT
+
+def path_prefix(url):
+    segments = path_segments(urlparse(url).path)
+    return '/' + segments[0].lower() if len(segments) > 1 else '/'
+
+def url_template(url):
+    # Yolun ilk bölümü aynen, diğerleri biçimine göre: sayı '#', diğer her şey '*'; sorgu parametrelerinin adları
+    # eklenir. /etiket/python ve /etiket/java -> '/etiket/*', /blog/sayfa/2 -> '/blog/*/#'
+    parsed = urlparse(url)
+    segments = path_segments(parsed.path)
+    shape = [segments[0].lower()] if segments else []
+    shape += ['#' if NUMBER.match(s) else '*' for s in segments[1:]]
+    template = '/' + '/'.join(shape)
+    params = sorted({k for k, _ in parse_qsl(parsed.query, keep_blank_values=True)})
+    return template + ('?' + '&'.join(params) if params else '')
+
+def _estimate(counts, prior):
+    if counts is None:
+        return prior
+    useful, total = counts
+    return (useful + PRIOR_WEIGHT * prior) / (total + PRIOR_WEIGHT)
+
+class YieldScheduler:
+    # Crawler'ın 'adaptive' sıralaması için öncelik hesaplayıcı. URL'nin şablonu, öneki ve ön değeri kuyruğa
+    # eklenirken bir kez hesaplanır (describe) ve yalnızca kuyruktaki URL'ler için saklanır; sonuç record()
+    # ile bildirilince (ana iş parçacığından) kayıt silinir. Kuyruğun yeniden sıralanması yalnızca sözlük
+    # okumalarıdır; sayaçlar tek demet olarak değiştirildiğinden okumalar kilit gerektirmez.
+    def __init__(self, refresh_every=REFRESH_EVERY):
+        self.refresh_every = refresh_every
+        self._lock = threading.Lock()
+        self._queued = {}
+        self._templates = {}
+        self._prefixes = {}
+        self._parents = {}
+        self._pending = 0
+        self.stats = {'useful': 0, 'wasted': 0, 'refreshes': 0}
+
+    def describe(self, url, parent):
+        return (url_template(url), path_prefix(url), url_prior(url), parent)
+
+    def link_found(self, url, info):
+        # Frontier URL'yi kabul ettikten sonra çağrılır
+        self._queued[url] = info
+
+    def forget(self, url):
+        # Sonucu hiç bildirilmeyecek URL'ler (robots.txt ile engellenen) için
+        self._queued.pop(url, None)
+
+    def score(self, info, level):
+        template, prefix, prior, parent = info
+        template_yield = _estimate(self._templates.get(template), prior)
+        prefix_yield = _estimate(self._prefixes.get(prefix), prior)
+        siblings = _estimate(self._parents.get(parent), prior) if parent is not None else prior
+        return LEVEL_WEIGHT * level - (template_yield + prefix_yield + siblings) / 3
+
+    def priority(self, url, level):
+        info = self._queued.get(url)
+        return self.score(info if info is not None else self.describe(url, None), level)
+
+    def record(self, url, useful):
+        # Bu tarayıcıya ait olmayan URL'ler yok sayılır (False döner)
+        with self._lock:
+            info = self._queued.pop(url, None)
+            if info is None:
+                return False
+            template, prefix, _, parent = info
+            keys = [(self._templates, template), (self._prefixes, prefix)]
+            if parent is not None:
+                keys.append((self._parents, parent))
+            for table, key in keys:
+                done, total = table.get(key, (0, 0))
+                table[key] = (done + useful, total + 1)
+            self.stats['useful' if useful else 'wasted'] += 1
+            self._pending += 1
+            return True
+
+    def needs_refresh(self):
+        with self._lock:
+            if self._pending < self.refresh_every:
+                return False
+            self._pending = 0
+            self.stats['refreshes'] += 1
+            return True
+
+    def report(self, limit=10):
+        # En çok sonuç alınan şablonlar ve öğrenilen verimleri
+        with self._lock:
+            templates = sorted(self._templates.items(), key=lambda item: -item[1][1])[:limit]
+        return [{'template': t, 'useful': useful, 'total': total} for t, (useful, total) in templates]
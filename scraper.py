@@ -1,55 +1,721 @@
 import requests
-from bs4 import BeautifulSoup
-from urllib.parse import urlparse, urljoin
+import threading
+import time
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from bs4 import BeautifulSoup, Tag
+from profiles import profile_for
+from urllib.parse import urlparse, urljoin, parse_qsl, urlencode
 import hashlib
+import re
+from functools import lru_cache
+from html.parser import HTMLParser
 
-def fetch_page(url):
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-        'Accept-Language': 'en-US,en;q=0.9'
-    }
+try:
+    from lxml import etree
+except ImportError:
+    etree = None
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept-Language': 'en-US,en;q=0.9'
+}
+
+# Bu uzantılarla biten linkler kuyruğa hiç eklenmez (büyük/küçük harf duyarsız). Yalnızca ikili/medya
+# dosyaları listelenir; metin biçimleri (.xml, .json, .js...) indirilir ve Content-Type kontrolüyle elenir
+SKIPPED_EXTENSIONS = frozenset([
+    '.pdf', '.jpg', '.jpeg', '.png', '.gif', '.webp', '.svg', '.ico', '.bmp', '.tif', '.tiff',
+    '.zip', '.rar', '.7z', '.gz', '.tgz', '.tar', '.bz2', '.xz',
+    '.mp3', '.mp4', '.m4a', '.m4v', '.avi', '.mov', '.wmv', '.mkv', '.webm', '.flv', '.ogg', '.wav',
+    '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx', '.odt', '.ods',
+    '.exe', '.msi', '.dmg', '.iso', '.apk', '.bin',
+    '.woff', '.woff2', '.ttf', '.otf', '.eot',
+])
+# normalize_link önbelleği: menü linkleri gibi her sayfada tekrarlanan href'ler bir kez çözümlenir
+LINK_CACHE_SIZE = 100000
+
+RETRY_STATUSES = [429, 500, 502, 503, 504]
+
+# Bu boyutu aşan yanıtların gövdesi okunmaz (varsayılan 10 MB)
+DEFAULT_MAX_BYTES = 10 * 1024 * 1024
+HTML_CONTENT_TYPES = ('text/html', 'application/xhtml+xml')
+CHUNK_SIZE = 64 * 1024
+# Başlıkta karakter kümesi yoksa <meta charset> yalnızca gövdenin başında aranır, tespit de ilk bölümle yapılır
+CHARSET_SNIFF_BYTES = 4096
+CHARSET_DETECT_BYTES = 64 * 1024
+HEADER_CHARSET = re.compile(r'charset\s*=\s*["\']?([\w.:-]+)', re.IGNORECASE)
+META_CHARSET = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?([\w.:-]+)', re.IGNORECASE)
+BOMS = [(b'\xef\xbb\xbf', 'utf-8-sig'), (b'\xff\xfe', 'utf-16'), (b'\xfe\xff', 'utf-16')]
+
+class ResponseRejected(requests.RequestException):
+    # HTML olmayan ya da boyut sınırını aşan yanıt; gövde okunmadan (ya da okunurken) bağlantı kapatılır
+    pass
+
+_connect_timer = threading.local()
+
+def _add_connect_time(seconds):
+    _connect_timer.seconds = getattr(_connect_timer, 'seconds', 0.0) + seconds
+    _connect_timer.count = getattr(_connect_timer, 'count', 0) + 1
+
+def _read_connect_timer():
+    return getattr(_connect_timer, 'seconds', 0.0), getattr(_connect_timer, 'count', 0)
+
+class TimedHTTPConnection(HTTPConnection):
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            _add_connect_time(time.perf_counter() - start)
+
+class TimedHTTPSConnection(HTTPSConnection):
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            _add_connect_time(time.perf_counter() - start)
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+class TimedHTTPAdapter(HTTPAdapter):
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': TimedHTTPConnectionPool,
+            'https': TimedHTTPSConnectionPool,
+        }
+
+class CrawlerSession:
+    # Tüm tarama boyunca paylaşılan, keep-alive bağlantı havuzlu ve yeniden denemeli HTTP oturumu
+    def __init__(self, pool_connections=10, pool_maxsize=20, max_retries=3, backoff_factor=0.5, timeout=15,
+                 cache=None, max_bytes=DEFAULT_MAX_BYTES, head_probe=False):
+        self.timeout = timeout
+        self.cache = cache
+        self.max_bytes = max_bytes
+        self.head_probe = head_probe
+        self.session = requests.Session()
+        self.session.headers.update(HEADERS)
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=['GET', 'HEAD'],
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = TimedHTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=retry)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self._lock = threading.Lock()
+        self.stats = {
+            'requests': 0,
+            'failures': 0,
+            'retries': 0,
+            'connections': 0,
+            'connect_time': 0.0,
+            'wait_time': 0.0,
+            'transfer_time': 0.0,
+            'bytes': 0,
+            'rejected': 0,
+            'head_requests': 0,
+        }
+
+    def _record(self, timing, failed=False, rejected=False):
+        with self._lock:
+            self.stats['requests'] += 1
+            if failed:
+                self.stats['failures'] += 1
+            if rejected:
+                self.stats['rejected'] += 1
+            for key in ('retries', 'connections', 'connect_time', 'wait_time', 'transfer_time', 'bytes'):
+                self.stats[key] += timing[key]
+
+    def get(self, url, content_types=None, **kwargs):
+        # Yanıtı, bağlantı / ilk bayta kadar bekleme / aktarım sürelerini içeren timing sözlüğüyle döndürür.
+        # content_types verilirse başarılı yanıtın Content-Type'ı bunlardan biri olmalıdır; uymayan ya da
+        # max_bytes'ı aşan yanıtlar için ResponseRejected fırlatılır.
+        kwargs.setdefault('timeout', self.timeout)
+        kwargs.setdefault('allow_redirects', True)
+        kwargs['content_types'] = content_types
+        if self.cache is None:
+            return self._full_get(url, **kwargs)
+        conditional = self.cache.conditional_headers(url)
+        response = None
+        if conditional:
+            headers = {**conditional, **kwargs.get('headers', {})}
+            response = self._timed_get(url, **dict(kwargs, headers=headers))
+            if response.status_code == 304 and self._serve_from_cache(url, response):
+                return response
+        if response is None or response.status_code == 304:
+            # Önbellekte kayıt yoksa ya da kayıt bu arada silinmişse koşulsuz olarak indir
+            response = self._full_get(url, **kwargs)
+        self.cache.record_miss()
+        if response.status_code == 200:
+            self.cache.put(url, response)
+        return response
+
+    def _serve_from_cache(self, url, response):
+        entry = self.cache.get(url)
+        if entry is None:
+            return False
+        response.status_code = 200
+        response._content = entry['body']
+        if entry['content_type']:
+            response.headers['Content-Type'] = entry['content_type']
+        response.encoding = entry['encoding']
+        response.from_cache = True
+        self.cache.record_hit(len(entry['body']))
+        return True
+
+    def _full_get(self, url, **kwargs):
+        # Koşulsuz GET. head_probe açıksa önce HEAD ile yoklanır; önbellekten dönen ya da koşullu istenen
+        # sayfalar için HEAD gönderilmez.
+        if self.head_probe and kwargs['content_types']:
+            self._probe(url, kwargs['content_types'], kwargs['timeout'])
+        return self._timed_get(url, **kwargs)
+
+    def _probe(self, url, content_types, timeout):
+        # GET öncesi HEAD isteği: reddedilecek yanıtlar için gövde hiç istenmez ve bağlantı korunur.
+        # HEAD'i desteklemeyen ya da hata veren sunucularda GET'teki kontrollere güvenilir.
+        with self._lock:
+            self.stats['head_requests'] += 1
+        try:
+            response = self.session.head(url, timeout=timeout, allow_redirects=True)
+        except requests.RequestException:
+            return
+        reason = _reject_reason(response, content_types, self.max_bytes)
+        response.close()
+        if reason is not None:
+            with self._lock:
+                self.stats['rejected'] += 1
+            raise ResponseRejected(reason, response=response)
+
+    def _timed_get(self, url, content_types=None, **kwargs):
+        connect_before, count_before = _read_connect_timer()
+        start = time.perf_counter()
+        timing = {'retries': 0, 'connections': 0, 'connect_time': 0.0, 'wait_time': 0.0, 'transfer_time': 0.0, 'bytes': 0}
+        try:
+            # Gövde parça parça okunur: başlıklar uygun değilse ya da sınır aşılırsa okuma bırakılır
+            response = self.session.get(url, stream=True, **kwargs)
+            reason = _reject_reason(response, content_types, self.max_bytes)
+            body = _read_body(response, self.max_bytes) if reason is None else None
+            if reason is None and body is None:
+                reason = f"gövde {self.max_bytes} baytı aşıyor"
+        except requests.RequestException:
+            connect_after, count_after = _read_connect_timer()
+            timing['connections'] = count_after - count_before
+            timing['connect_time'] = connect_after - connect_before
+            self._record(timing, failed=True)
+            raise
+        total = time.perf_counter() - start
+        connect_after, count_after = _read_connect_timer()
+        timing['connections'] = count_after - count_before
+        timing['connect_time'] = connect_after - connect_before
+        timing['wait_time'] = max(0.0, response.elapsed.total_seconds() - timing['connect_time'])
+        timing['transfer_time'] = max(0.0, total - timing['connect_time'] - timing['wait_time'])
+        if response.raw is not None and getattr(response.raw, 'retries', None) is not None:
+            timing['retries'] = len(response.raw.retries.history)
+        if reason is not None:
+            response.close()
+            self._record(timing, rejected=True)
+            raise ResponseRejected(reason, response=response)
+        timing['bytes'] = len(body)
+        response.timing = timing
+        response.from_cache = False
+        self._record(timing)
+        return response
+
+    def stream(self, url, max_bytes=None, **kwargs):
+        # Gövdeyi belleğe almadan parça parça döndürür (sitemap gibi büyük dosyalar için). İstek, süreler ve
+        # aktarılan bayt istatistiklere eklenir; max_bytes aşılırsa ResponseRejected, 2xx dışı yanıtlarda
+        # requests.HTTPError fırlatılır. Gövde önbelleğe alınmaz. max_bytes verilirse oturumun sınırı yerine
+        # kullanılır (0: sınırsız; çağıran okumayı kendisi keser).
+        max_bytes = self.max_bytes if max_bytes is None else max_bytes
+        kwargs.setdefault('timeout', self.timeout)
+        connect_before, count_before = _read_connect_timer()
+        start = time.perf_counter()
+        timing = {'retries': 0, 'connections': 0, 'connect_time': 0.0, 'wait_time': 0.0, 'transfer_time': 0.0, 'bytes': 0}
+        failed = rejected = False
+        response = None
+        try:
+            response = self.session.get(url, stream=True, **kwargs)
+            connect_after, count_after = _read_connect_timer()
+            timing['connections'] = count_after - count_before
+            timing['connect_time'] = connect_after - connect_before
+            timing['wait_time'] = max(0.0, response.elapsed.total_seconds() - timing['connect_time'])
+            if response.raw is not None and getattr(response.raw, 'retries', None) is not None:
+                timing['retries'] = len(response.raw.retries.history)
+            reason = _reject_reason(response, None, max_bytes)
+            if reason is not None:
+                rejected = True
+                raise ResponseRejected(reason, response=response)
+            response.raise_for_status()
+            for chunk in response.iter_content(CHUNK_SIZE):
+                timing['bytes'] += len(chunk)
+                if max_bytes and timing['bytes'] > max_bytes:
+                    rejected = True
+                    raise ResponseRejected(f"gövde {max_bytes} baytı aşıyor", response=response)
+                yield chunk
+        except (ResponseRejected, requests.HTTPError):
+            raise
+        except requests.RequestException:
+            failed = True
+            raise
+        finally:
+            if response is not None:
+                response.close()
+            else:
+                connect_after, count_after = _read_connect_timer()
+                timing['connections'] = count_after - count_before
+                timing['connect_time'] = connect_after - connect_before
+            timing['transfer_time'] = max(0.0, time.perf_counter() - start - timing['connect_time'] - timing['wait_time'])
+            self._record(timing, failed=failed, rejected=rejected)
+
+    def close(self):
+        self.session.close()
+
+def _reject_reason(response, content_types, max_bytes):
+    # Başlıklara bakarak gövdeyi okumadan reddetme nedeni; uygunsa None
+    if not 200 <= response.status_code < 300:
+        return None
+    content_type = response.headers.get('Content-Type', '').split(';', 1)[0].strip().lower()
+    if content_types and content_type and content_type not in content_types:
+        return f"içerik türü {content_type}"
+    length = response.headers.get('Content-Length', '')
+    if max_bytes and length.isdigit() and int(length) > max_bytes:
+        return f"Content-Length {length} > {max_bytes}"
+    return None
+
+def _read_body(response, max_bytes):
+    # Gövdeyi max_bytes'a kadar okur; aşılırsa None. Tamamı okunan bağlantı havuza geri döner.
+    chunks = []
+    size = 0
+    for chunk in response.iter_content(CHUNK_SIZE):
+        size += len(chunk)
+        if max_bytes and size > max_bytes:
+            return None
+        chunks.append(chunk)
+    response._content = b''.join(chunks)
+    response._content_consumed = True
+    return response._content
+
+def detect_encoding(response):
+    # Sıra: Content-Type başlığı, BOM, <meta charset>, geçerli UTF-8, gövdenin başından tespit.
+    # requests'in response.text'i başlıkta charset yoksa ya ISO-8859-1 varsayar ya da tüm gövdeyi tarar.
+    match = HEADER_CHARSET.search(response.headers.get('Content-Type', ''))
+    if match:
+        return match.group(1)
+    body = response.content
+    for bom, encoding in BOMS:
+        if body.startswith(bom):
+            return encoding
+    match = META_CHARSET.search(body[:CHARSET_SNIFF_BYTES])
+    if match:
+        return match.group(1).decode('ascii')
     try:
-        response = requests.get(url, headers=headers, timeout=15, allow_redirects=True)
+        body.decode('utf-8')
+        return 'utf-8'
+    except UnicodeDecodeError:
+        pass
+    return requests.compat.chardet.detect(body[:CHARSET_DETECT_BYTES])['encoding'] or 'utf-8'
+
+def decode_body(response):
+    encoding = detect_encoding(response)
+    try:
+        return response.content.decode(encoding, errors='replace')
+    except LookupError:
+        return response.content.decode('utf-8', errors='replace')
+
+_default_session = None
+_default_session_lock = threading.Lock()
+
+def get_session():
+    global _default_session
+    with _default_session_lock:
+        if _default_session is None:
+            _default_session = CrawlerSession()
+        return _default_session
+
+def fetch_response(url, session=None):
+    session = session or get_session()
+    try:
+        response = session.get(url, content_types=HTML_CONTENT_TYPES)
         if response.status_code == 404:
             return None
         response.raise_for_status()
-        return response.text
+        return response
     except requests.RequestException as e:
         return None
 
+def fetch_page(url, session=None):
+    response = fetch_response(url, session)
+    if response is None:
+        return None
+    return decode_body(response)
+
 def is_valid_url(u):
     parsed = urlparse(u)
     return bool(parsed.scheme and parsed.netloc)
 
-def get_all_website_links(url, base_domain):
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+def canonical_netloc(netloc, scheme=''):
+    netloc = netloc.lower()
+    host, sep, port = netloc.rpartition(':')
+    if sep and port.isdigit() and (DEFAULT_PORTS.get(scheme) == int(port) or (not scheme and int(port) in (80, 443))):
+        return host
+    return netloc
+
+def canonicalize_url(url, allowed_params=None):
+    # Şema/host küçük harf, varsayılan port ve fragment atılır; sorgu yalnızca allowed_params içindeki
+    # parametrelerle (sıralı) korunur. Yol linkteki gibi kalır (sondaki '/' dahil), istek bu URL'ye gider.
+    return _canonical_parts(urlparse(url), allowed_params)[0]
+
+def url_key(url):
+    # Tekilleştirme anahtarı: sondaki '/' farkı aynı sayfa sayılır ('/blog/' ile '/blog'). Yalnızca
+    # Frontier'ın görülen kümesinde kullanılır; sunucunun yönlendirmesine yol açmamak için istek
+    # linkteki biçimle yapılır.
+    base, sep, query = url.partition('?')
+    if base.endswith('/') and base.count('/') > 3:
+        base = base.rstrip('/')
+        if base.count('/') < 3:
+            base += '/'
+    return base + sep + query
+
+def _canonical_parts(p, allowed_params):
+    # (kanonik URL, şema, host, yol); normalize_link URL'yi yeniden ayrıştırmadan host ve yolu kullanır
+    scheme = p.scheme.lower()
+    netloc = canonical_netloc(p.netloc, scheme)
+    path = p.path or '/'
+    query = ''
+    if allowed_params and p.query:
+        allowed = set(allowed_params)
+        query = urlencode(sorted((k, v) for k, v in parse_qsl(p.query, keep_blank_values=True) if k in allowed))
+    return f"{scheme}://{netloc}{path}" + (f"?{query}" if query else ''), scheme, netloc, path
+
+def path_extension(path):
+    name = path.rpartition('/')[2]
+    dot = name.rfind('.')
+    return name[dot:].lower() if dot > 0 else ''
+
+def normalize_link(page_url, href, base_domain, allowed_params=None):
+    # Sayfadaki bir href'i aynı siteye ait kanonik URL'ye çevirir; site dışı ya da dosya linklerinde None.
+    # Mutlak ve '/' ile başlayan href'lerin sonucu sayfanın yolundan bağımsızdır; önbellekte sayfa yerine
+    # yalnızca köke (şema + host) göre tutulurlar.
+    if href.startswith('/') and not href.startswith('//'):
+        page_url = '/'.join(page_url.split('/', 3)[:3])
+    elif href[:8].lower().startswith(('http://', 'https://')):
+        page_url = ''
+    return _normalize_link(page_url, href, base_domain, tuple(allowed_params) if allowed_params else None)
+
+@lru_cache(maxsize=LINK_CACHE_SIZE)
+def _normalize_link(page_url, href, base_domain, allowed_params):
+    clean, scheme, netloc, path = _canonical_parts(urlparse(urljoin(page_url, href)), allowed_params)
+    if not scheme or netloc != canonical_netloc(base_domain, scheme):
+        return None
+    if path_extension(path) in SKIPPED_EXTENSIONS:
+        return None
+    return clean
+
+def link_base(page_url, base_href):
+    # <base href> varsa göreli linkler ona göre çözülür
+    if not base_href or not base_href.strip():
+        return page_url
+    return urljoin(page_url, base_href.strip())
+
+def extract_links(soup, page_url, base_domain, allowed_params=None):
+    base = soup.find('base', href=True)
+    page_url = link_base(page_url, base['href'] if base is not None else None)
+    urls = set()
+    for a in soup.find_all('a', href=True):
+        clean = normalize_link(page_url, a['href'], base_domain, allowed_params)
+        if clean:
+            urls.add(clean)
+    return urls
+
+# Ağaç kurmadan yalnızca <a href> ve <base href> değerlerini toplayan link çıkarıcı. lxml kuruluysa libxml2'nin
+# C tokenizer'ı yalnızca başlangıç etiketleri için geri çağırır; değilse html.parser'ın olay tabanlı ayrıştırıcısı
+# kullanılır. BeautifulSoup ile aynı href kümesini verir (değersiz href '' sayılır, script içi atlanır); tek fark
+# lxml'in <textarea> içeriğini HTML standardına uygun olarak düz metin saymasıdır.
+
+class _LinkTarget:
+    # lxml ayrıştırıcı hedefi: yalnızca start ve close tanımlı olduğundan metin ve kapanış olayları hiç üretilmez
+    def __init__(self):
+        self.base = None
+        self.hrefs = []
+
+    def start(self, tag, attrib):
+        if tag == 'a':
+            href = attrib.get('href')
+            if href is not None:
+                self.hrefs.append(href)
+        elif tag == 'base' and self.base is None:
+            self.base = attrib.get('href')
+
+    def close(self):
+        return self
+
+class _LinkParser(HTMLParser):
+    def __init__(self):
+        # Metin içindeki karakter referansları çözülmez; öznitelik değerleri yine de çözülür
+        super().__init__(convert_charrefs=False)
+        self.base = None
+        self.hrefs = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'a':
+            for name, value in attrs:
+                if name == 'href':
+                    self.hrefs.append(value or '')
+                    break
+        elif tag == 'base' and self.base is None:
+            self.base = next((value for name, value in attrs if name == 'href'), None)
+
+def scan_links(html):
+    # (base href ya da None, sayfa sırasıyla href listesi)
+    if etree is not None:
+        parser = etree.HTMLParser(target=_LinkTarget())
+        parser.feed(html)
+        target = parser.close()
+        return target.base, target.hrefs
+    parser = _LinkParser()
+    parser.feed(html)
+    parser.close()
+    return parser.base, parser.hrefs
+
+def scan_page_links(html, page_url, base_domain, allowed_params=None):
+    base, hrefs = scan_links(html)
+    base_url = link_base(page_url, base)
+    urls = set()
+    for href in set(hrefs):
+        clean = normalize_link(base_url, href, base_domain, allowed_params)
+        if clean:
+            urls.add(clean)
+    return urls
+
+PARSERS = ['html.parser', 'lxml', 'selectolax']
+# Yalnızca link bulmada kullanılabilen, ağaç kurmayan akış ayrıştırıcısı (scan_page_links)
+STREAM_LINK_PARSER = 'stream'
+
+def available_parsers():
+    parsers = ['html.parser']
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        }
-        resp = requests.get(url, headers=headers, timeout=15)
-        if resp.status_code != 200:
-            return []
-        soup = BeautifulSoup(resp.text, 'html.parser')
-        urls = set()
-        for a in soup.find_all('a', href=True):
-            href = urljoin(url, a['href'])
-            p = urlparse(href)
-            clean = f"{p.scheme}://{p.netloc}{p.path}"
-            if p.netloc == base_domain and clean not in urls and is_valid_url(clean):
-                if not any(clean.endswith(ext) for ext in ['.pdf','.jpg','.png','.zip']):
-                    urls.add(clean)
-        return urls
-    except Exception as e:
+        import lxml
+        parsers.append('lxml')
+    except ImportError:
+        pass
+    import lexbor_backend
+    if lexbor_backend.available():
+        parsers.append('selectolax')
+    return parsers
+
+def available_link_parsers():
+    # Yavaştan hızlıya: akış ayrıştırıcısı BeautifulSoup ağaçlarından birkaç kat hızlıdır, selectolax'la
+    # benzer hızdadır ama ek bağımlılık gerektirmez
+    return available_parsers() + [STREAM_LINK_PARSER]
+
+def parse_html(html, parser='html.parser'):
+    # 'html.parser' ve 'lxml' BeautifulSoup ağacı, 'selectolax' yerel lexbor ağacı döndürür
+    if parser == 'selectolax':
+        import lexbor_backend
+        return lexbor_backend.parse(html)
+    return BeautifulSoup(html, parser)
+
+def _is_lexbor(tree):
+    return not isinstance(tree, Tag)
+
+def extract_content(tree, opts, url=None):
+    # url verilirse ve seçeneklerde o siteye ait profil varsa (opts['profiles']) içerik profile göre çıkarılır
+    profile = profile_for(opts.get('profiles'), url) if url else None
+    if _is_lexbor(tree):
+        import lexbor_backend
+        return lexbor_backend.process_content(tree, opts, profile)
+    return process_content(tree, opts, profile)
+
+def extract_page_links(tree, page_url, base_domain, allowed_params=None):
+    if _is_lexbor(tree):
+        import lexbor_backend
+        return lexbor_backend.extract_links(tree, page_url, base_domain, allowed_params)
+    return extract_links(tree, page_url, base_domain, allowed_params)
+
+def fetch_and_parse(url, base_domain=None, session=None, manifest=None, parser='html.parser', link_parser=None,
+                    allowed_params=None):
+    # Sayfa tek sefer indirilir ve ayrıştırılır; linkler ve içerik aynı ağaçtan çıkarılır.
+    # link_parser farklıysa linkler o ayrıştırıcıyla bulunur, içerik ağacı gerektiğinde get_soup ile kurulur.
+    # Gövdesi manifest'teki kayıtla aynı olan sayfalar ayrıştırılmaz, linkleri manifest'ten alınır.
+    # stages: aşama süreleri (sn), sizes: aşamada işlenen bayt; metrics.StageMetrics bunları toplar
+    link_parser = link_parser or parser
+    start = time.perf_counter()
+    response = fetch_response(url, session)
+    if response is None:
+        return None
+    html = decode_body(response)
+    stages = {'fetch': time.perf_counter() - start}
+    body_hash = hashlib.md5(response.content).hexdigest()
+    final_url = response.url or url
+    entry = manifest.get(url) if manifest is not None else None
+    soup = None
+    links = None
+    if entry is not None and entry['body_hash'] == body_hash and (entry['links'] is not None or not base_domain):
+        if base_domain:
+            links = set(entry['links'])
+    elif base_domain and link_parser == STREAM_LINK_PARSER:
+        start = time.perf_counter()
+        links = scan_page_links(html, final_url, base_domain, allowed_params)
+        stages['links'] = time.perf_counter() - start
+    elif base_domain:
+        start = time.perf_counter()
+        tree = parse_html(html, link_parser)
+        stages['parse'] = time.perf_counter() - start
+        links = extract_page_links(tree, final_url, base_domain, allowed_params)
+        stages['links'] = time.perf_counter() - start - stages['parse']
+        if link_parser == parser:
+            soup = tree
+    else:
+        start = time.perf_counter()
+        soup = parse_html(html, parser)
+        stages['parse'] = time.perf_counter() - start
+    return {
+        'url': url,
+        'final_url': final_url,
+        'html': html,
+        'body_hash': body_hash,
+        'headers': dict(response.headers),
+        'parser': parser,
+        'soup': soup,
+        'links': links,
+        'timing': getattr(response, 'timing', None),
+        'from_cache': getattr(response, 'from_cache', False),
+        'stages': stages,
+        'sizes': {'fetch': len(response.content)},
+    }
+
+def get_soup(page):
+    if page.get('soup') is None:
+        start = time.perf_counter()
+        page['soup'] = parse_html(page['html'], page.get('parser', 'html.parser'))
+        stages = page.setdefault('stages', {})
+        stages['parse'] = stages.get('parse', 0.0) + time.perf_counter() - start
+    return page['soup']
+
+def get_all_website_links(url, base_domain, session=None):
+    page = fetch_and_parse(url, base_domain, session, link_parser=STREAM_LINK_PARSER)
+    if page is None:
         return []
+    return page['links']
+
+NON_CONTENT_TAGS = ('header', 'footer', 'nav', 'aside')
+
+UNWANTED_CLASSES = [
+    'dropdown', 'menu', 'navigation', 'nav', 'sidebar', 'footer', 'header',
+    'popup', 'modal', 'cookie', 'banner', 'alert', 'notification',
+    'advertisement', 'ad', 'widget', 'social', 'share', 'search',
+    'login', 'cart', 'newsletter', 'subscribe'
+]
+
+WANTED_SPECIAL_CLASSES = [
+    'accordion', 'faq', 'soru', 'cevap', 'question', 'answer', 
+    'sss', 'sıkça-sorulan', 'sikca-sorulan', 'collapsible',
+    'toggle', 'expand', 'vss', 'vs-soru', 'faq-item'
+]
+
+def compile_keywords(keywords):
+    # Anahtar kelimelerden herhangi birinin alt dize olarak geçtiğini tek bir aramayla bulan desen
+    return re.compile('|'.join(re.escape(k) for k in sorted(keywords, key=len, reverse=True)))
+
+UNWANTED_PATTERN = compile_keywords(UNWANTED_CLASSES)
+WANTED_PATTERN = compile_keywords(WANTED_SPECIAL_CLASSES)
 
 def is_main_content(el):
-    return el.find_parent(['header','footer','nav','aside']) is None
+    return el.find_parent(list(NON_CONTENT_TAGS)) is None
 
-def process_content(soup, opts):
-    content = []
-    title = soup.title.string.strip() if soup.title and soup.title.string else 'Başlıksız'
-    content.append({'type':'title','text':title})
-    
+def own_flags(classes, node_id):
+    # Düğümün kendi class listesi ve id değerine göre: (özel içerik mi, en yakın karar)
+    # karar: True (al), False (alma) veya None (üst düğüme bak); öncelik sırası class > id, istenen > istenmeyen
+    wanted = False
+    decision = None
+    if classes:
+        class_names = ' '.join(classes).lower()
+        if WANTED_PATTERN.search(class_names):
+            wanted = True
+            decision = True
+        elif UNWANTED_PATTERN.search(class_names):
+            decision = False
+    if node_id:
+        id_name = node_id.lower()
+        if WANTED_PATTERN.search(id_name):
+            wanted = True
+            if decision is None:
+                decision = True
+        elif decision is None and UNWANTED_PATTERN.search(id_name):
+            decision = False
+    return wanted, decision
+
+def iter_content_elements(body, tags, opts, skip=None, force=None, scoped=False):
+    # body altındaki ağacı tek seferde yukarıdan aşağı dolaşır; her düğümün durumu (header/footer/nav/aside
+    # içinde mi, div içinde mi, özel içerik zincirinde mi, en yakın class/id kararı) bir kez hesaplanıp
+    # çocuklara aktarılır. Seçilen elemanları belge sırasıyla döndürür.
+    # Site profili: skip/force düğüm kimlikleri (id()) kümeleridir; skip'teki alt ağaçlar atlanır, force'takiler
+    # özel içerik gibi alınır. scoped=True ise body profilde seçilmiş bir kapsayıcıdır ve header/nav içinde
+    # olsa da taranır.
+    tag_set = set(tags)
+    span_rule = bool(opts['span'])
+    div_rule = not opts['div']
+    filter_divs = opts.get('filter_divs', True)
+    skip = skip or ()
+    force = force or ()
+    check_profile = bool(skip or force)
+    # durum: (dışlanmış, div atası var, özel içerik zinciri, en yakın karar)
+    root_state = (not scoped and body.find_parent(list(NON_CONTENT_TAGS)) is not None,
+                  body.find_parent('div') is not None, False, None)
+    stack = [(iter(body.contents), root_state)]
+    while stack:
+        children, state = stack[-1]
+        node = next(children, None)
+        if node is None:
+            stack.pop()
+            continue
+        if not isinstance(node, Tag):
+            continue
+        excluded, div_ancestor, wanted_chain, decision = state
+        name = node.name
+        if check_profile and id(node) in skip:
+            continue
+        wanted, own_decision = own_flags(node.get('class'), node.get('id'))
+        if check_profile and id(node) in force:
+            wanted, own_decision = True, True
+        if own_decision is not None:
+            decision = own_decision
+        wanted_chain = wanted_chain or wanted
+
+        if name in tag_set and not excluded:
+            if name == 'span' and span_rule:
+                accept = wanted_chain
+            elif div_rule and (name == 'div' or div_ancestor):
+                accept = filter_divs and decision is not False
+            else:
+                accept = True
+            if accept:
+                yield node
+
+        if node.contents:
+            if name == 'body':
+                wanted_chain, decision = False, None
+            stack.append((iter(node.contents), (
+                excluded or name in NON_CONTENT_TAGS,
+                div_ancestor or name == 'div',
+                wanted_chain,
+                decision,
+            )))
+
+def content_tags(opts):
     tags = []
     header_tags = []
     for lvl in range(1,7):
@@ -61,66 +727,49 @@ def process_content(soup, opts):
     if opts['headers']: tags.append('header')
     if opts['footers']: tags.append('footer')
     if opts['span']: tags.append('span')
+    return tags, header_tags
+
+def _top_level(nodes, parents):
+    # İç içe eşleşmelerden yalnızca en dıştakiler (aynı içerik iki kez alınmasın)
+    ids = {id(node) for node in nodes}
+    return [node for node in nodes if not any(id(p) in ids for p in parents(node))]
+
+def profile_scope(soup, profile):
+    # Profile göre taranacak kökler ve skip/force kümeleri; içerik seçicisi eşleşmezse tüm body taranır
+    roots = None
+    if profile['content'] is not None:
+        roots = _top_level(profile['content'].select(soup), lambda node: node.parents) or None
+    scope = roots or [soup]
+    skip = force = None
+    if profile['exclude'] is not None:
+        skip = {id(node) for root in scope for node in profile['exclude'].select(root)}
+    if profile['include'] is not None:
+        force = {id(node) for root in scope for node in profile['include'].select(root)}
+    return roots, skip, force
+
+def iter_profile_elements(soup, tags, opts, profile):
+    roots, skip, force = profile_scope(soup, profile)
+    if roots is None:
+        yield from iter_content_elements(soup.body, tags, opts, skip, force)
+        return
+    for root in roots:
+        yield from iter_content_elements(root, tags, opts, skip, force, scoped=True)
+
+def process_content(soup, opts, profile=None):
+    content = []
+    title = soup.title.string.strip() if soup.title and soup.title.string else 'Başlıksız'
+    if profile is not None and profile['title'] is not None:
+        title_node = profile['title'].select_one(soup)
+        title = (title_node.get_text(' ', strip=True) if title_node is not None else '') or title
+    content.append({'type':'title','text':title})
     
-    unwanted_classes = [
-        'dropdown', 'menu', 'navigation', 'nav', 'sidebar', 'footer', 'header',
-        'popup', 'modal', 'cookie', 'banner', 'alert', 'notification',
-        'advertisement', 'ad', 'widget', 'social', 'share', 'search',
-        'login', 'cart', 'newsletter', 'subscribe'
-    ]
-    
-    wanted_special_classes = [
-        'accordion', 'faq', 'soru', 'cevap', 'question', 'answer', 
-        'sss', 'sıkça-sorulan', 'sikca-sorulan', 'collapsible',
-        'toggle', 'expand', 'vss', 'vs-soru', 'faq-item'
-    ]
-
-    def should_process_element(elem):
-        if not is_main_content(elem):
-            return False
-            
-        if elem.name == 'span' and opts['span']:
-            current = elem
-            while current and current.name != 'body':
-                if current.get('class'):
-                    class_names = ' '.join(current.get('class')).lower()
-                    if any(wanted in class_names for wanted in wanted_special_classes):
-                        return True
-                if current.get('id'):
-                    id_name = current.get('id').lower()
-                    if any(wanted in id_name for wanted in wanted_special_classes):
-                        return True
-                current = current.parent
-            return False
-            
-        if not opts['div']:
-            if elem.name == 'div' or elem.find_parents('div'):
-                if opts.get('filter_divs', True):
-                    current = elem
-                    while current and current.name != 'body':
-                        if current.get('class'):
-                            class_names = ' '.join(current.get('class')).lower()
-                            if any(wanted in class_names for wanted in wanted_special_classes):
-                                return True
-                            if any(unwanted in class_names for unwanted in unwanted_classes):
-                                return False
-                        if current.get('id'):
-                            id_name = current.get('id').lower()
-                            if any(wanted in id_name for wanted in wanted_special_classes):
-                                return True
-                            if any(unwanted in id_name for unwanted in unwanted_classes):
-                                return False
-                        current = current.parent
-                    return True
-                else:
-                    return False
-                    
-        return True
+    tags, header_tags = content_tags(opts)
     
-    for elem in soup.body.find_all(tags, recursive=True):
-        if not should_process_element(elem):
-            continue
-            
+    if profile is not None:
+        elements = iter_profile_elements(soup, tags, opts, profile)
+    else:
+        elements = iter_content_elements(soup.body, tags, opts)
+    for elem in elements:
         name = elem.name
         if name in header_tags:
             text = elem.get_text(strip=True)
@@ -170,8 +819,16 @@ def process_content(soup, opts):
     
     return content
 
+def item_text(item):
+    # Bir içerik öğesinin (başlık, paragraf, liste) tüm metni
+    if 'text' in item:
+        return item['text']
+    if 'parts' in item:
+        return ' '.join(part['text'] for part in item['parts'])
+    if 'items' in item:
+        return ' '.join(item_text(li) for li in item['items'])
+    return ''
+
 def hash_content(content):
-    hash_str = ""
-    for item in content:
-        hash_str += f"{item['type']}_{item.get('level','')}_{item.get('text','')}".lower()
+    hash_str = ''.join(f"{item['type']}_{item.get('level','')}_{item_text(item)}".lower() for item in content)
     return hashlib.md5(hash_str.encode()).hexdigest()
\ No newline at end of file